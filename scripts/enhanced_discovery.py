@@ -56,7 +56,7 @@ class EnhancedWebsiteDiscovery:
         
         contractors = []
         for row in rows:
-            contractor = Contractor.from_dict(dict(row))
+            contractor = Contractor.from_dict(row)
             contractors.append(contractor)
             
         logger.info(f"Found {len(contractors)} candidates for enhanced discovery")
@@ -289,9 +289,6 @@ class EnhancedWebsiteDiscovery:
             if discovery_result['website_found']:
                 await self.update_contractor_with_discovery(contractor, discovery_result)
                 logger.info(f"✅ Enhanced discovery success: {discovery_result['website_url']}")
-            
-            # Small delay to avoid overwhelming the system
-            await asyncio.sleep(0.1)
         
         return self.discoveries
 
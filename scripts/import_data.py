@@ -21,6 +21,9 @@ from config import config
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Compiled once; clean_phone_number runs for every imported row
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+
 
 def clean_phone_number(phone: Optional[str]) -> Optional[str]:
     """Standardize phone number to (XXX) XXX-XXXX format"""
@@ -30,7 +33,7 @@ def clean_phone_number(phone: Optional[str]) -> Optional[str]:
     phone_str = str(phone).strip()
     
     # Remove all non-digit characters
-    digits = re.sub(r'[^\d]', '', phone_str)
+    digits = _NON_DIGIT_RE.sub('', phone_str)
     
     # Check if we have exactly 10 digits
     if len(digits) == 10:
@@ -26,7 +26,7 @@ async def get_all_processed_contractors():
     
     contractors = []
     for row in rows:
-        contractor = Contractor.from_dict(dict(row))
+        contractor = Contractor.from_dict(row)
         contractors.append(contractor)
         
     return contractors
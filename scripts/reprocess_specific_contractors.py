@@ -17,6 +17,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.database.connection import db_pool
 from src.database.models import Contractor
 from src.services.contractor_service import ContractorService, QuotaExceededError, quota_tracker
+from src.utils.event_loop import install_event_loop
 
 class SpecificContractorReprocessor:
     def __init__(self):
@@ -76,8 +77,6 @@ class SpecificContractorReprocessor:
         
         # Process contractor
         try:
-            from src.utils.logging_utils import contractor_logger
-            
             # Use the full process_contractor method that includes 6-factor validation
             try:
                 processed_contractor = await self.service.process_contractor(contractor)
@@ -211,4 +210,5 @@ async def main():
     await reprocessor.reprocess_contractors(business_names)
 
 if __name__ == "__main__":
+    install_event_loop()
     asyncio.run(main()) 
\ No newline at end of file
@@ -45,6 +45,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.database.connection import db_pool
 from src.database.models import Contractor
 from src.services.contractor_service import ContractorService, QuotaExceededError, quota_tracker
+from src.utils.event_loop import install_event_loop
 
 class ParallelTestSuite:
     def __init__(self, limit: int = 5000, processes: int = 3, puget_sound_only: bool = True):
@@ -126,12 +127,17 @@ class ParallelTestSuite:
         
         return contractors
     
-    async def process_contractor_chunk(self, contractors: List[Contractor], chunk_id: int) -> Dict[str, Any]:
-        """Process a chunk of contractors in a single process"""
-        service = ContractorService()
+    async def process_contractor_queue(self, queue: asyncio.Queue, worker_id: int) -> Dict[str, Any]:
+        """Process contractors from the shared queue until it is empty
+        
+        Workers pull one contractor at a time, so a worker that draws slow websites
+        doesn't leave the others idle at the end of the run. All workers share the
+        suite's service, and with it one HTTP session and its connection pool.
+        """
+        service = self.service
         results = {
-            'chunk_id': chunk_id,
-            'total': len(contractors),
+            'worker_id': worker_id,
+            'total': 0,
             'completed': 0,
             'failed': 0,
             'quota_exceeded': False,
@@ -140,42 +146,46 @@ class ParallelTestSuite:
         }
         
         try:
-            for i, contractor in enumerate(contractors):
+            while True:
+                try:
+                    contractor = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                results['total'] += 1
+                
                 try:
                     # Check quota before processing each contractor
                     if quota_tracker.is_quota_exceeded():
                         results['quota_exceeded'] = True
-                        print(f"🛑 Process {chunk_id}: Daily quota exceeded - stopping chunk")
+                        print(f"🛑 Process {worker_id}: Daily quota exceeded - stopping worker")
                         break
                     
                     # Process contractor
                     await service.process_contractor(contractor)
                     results['completed'] += 1
                     
-                    # Log progress every 10 contractors
-                    if (i + 1) % 10 == 0:
-                        quota_status = quota_tracker.get_quota_status()
-                        print(f"📊 Process {chunk_id}: {i + 1}/{len(contractors)} completed | "
-                              f"Queries: {quota_status['queries_today']:,}/{quota_status['daily_limit']:,}")
+                    # Log progress every 10 contractors (reading the counters, not a full status dict)
+                    if results['completed'] % 10 == 0:
+                        print(f"📊 Process {worker_id}: {results['completed']} completed, {queue.qsize()} left in queue | "
+                              f"Queries: {quota_tracker.queries_today:,}/{quota_tracker.daily_quota_limit:,}")
                     
                 except QuotaExceededError:
                     results['quota_exceeded'] = True
-                    print(f"🛑 Process {chunk_id}: Daily quota exceeded - stopping chunk")
+                    print(f"🛑 Process {worker_id}: Daily quota exceeded - stopping worker")
                     break
                 except Exception as e:
-                    print(f"❌ Process {chunk_id}: Error processing {contractor.business_name}: {e}")
+                    print(f"❌ Process {worker_id}: Error processing {contractor.business_name}: {e}")
                     results['failed'] += 1
                     contractor.processing_status = 'failed'
                     contractor.error_message = str(e)
                     await service.update_contractor(contractor)
         
         except Exception as e:
-            print(f"❌ Process {chunk_id}: Fatal error: {e}")
-            results['failed'] = len(contractors) - results['completed']
+            print(f"❌ Process {worker_id}: Fatal error: {e}")
+            results['failed'] = results['total'] - results['completed']
         
         finally:
             results['end_time'] = time.time()
-            await service.close()
         
         return results
     
@@ -189,37 +199,36 @@ class ParallelTestSuite:
             print("❌ No contractors found to process")
             return
         
-        # Split contractors into chunks for parallel processing
-        chunk_size = len(contractors) // self.processes
-        chunks = []
-        for i in range(self.processes):
-            start_idx = i * chunk_size
-            end_idx = start_idx + chunk_size if i < self.processes - 1 else len(contractors)
-            chunks.append(contractors[start_idx:end_idx])
+        # One shared queue drained by every worker, instead of fixed per-process chunks
+        queue: asyncio.Queue = asyncio.Queue()
+        for contractor in contractors:
+            queue.put_nowait(contractor)
+        workers = min(self.processes, len(contractors))
         
-        print(f"🔄 Starting parallel processing with {self.processes} processes...")
-        print(f"   - Chunk sizes: {[len(chunk) for chunk in chunks]}")
+        print(f"🔄 Starting parallel processing with {workers} processes...")
+        print(f"   - Shared queue: {len(contractors):,} contractors")
         print()
         
-        # Process chunks in parallel
-        tasks = []
-        for i, chunk in enumerate(chunks):
-            if chunk:  # Only create task if chunk has contractors
-                task = asyncio.create_task(self.process_contractor_chunk(chunk, i + 1))
-                tasks.append(task)
+        # Process the queue in parallel
+        tasks = [
+            asyncio.create_task(self.process_contractor_queue(queue, i + 1))
+            for i in range(workers)
+        ]
         
-        # Wait for all tasks to complete
-        chunk_results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Wait for all tasks to complete, then close the shared service once
+        try:
+            worker_results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            await self.service.close()
         
         # Process results
         total_completed = 0
         total_failed = 0
         quota_exceeded = False
         
-        for i, result in enumerate(chunk_results):
+        for i, result in enumerate(worker_results):
             if isinstance(result, Exception):
                 print(f"❌ Process {i + 1}: Exception: {result}")
-                total_failed += len(chunks[i]) if i < len(chunks) else 0
             else:
                 total_completed += result['completed']
                 total_failed += result['failed']
@@ -288,4 +297,5 @@ async def main():
         sys.exit(1)  # Exit with error code if quota exceeded
 
 if __name__ == "__main__":
+    install_event_loop()
     asyncio.run(main()) 
\ No newline at end of file
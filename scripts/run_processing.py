@@ -3,20 +3,24 @@
 Processing orchestrator for contractor enrichment pipeline
 """
 import asyncio
+import contextlib
 import logging
 import argparse
 import sys
 import time
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from dataclasses import fields
+from typing import Optional, List, Dict, Any, AsyncIterable, AsyncIterator
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from src.config import config
 from src.database.connection import db_pool
+from src.database.models import Contractor
 from src.services.contractor_service import ContractorService
 from src.services.export_service import ExportService
+from src.utils.event_loop import install_event_loop
 from src.utils.logging_utils import contractor_logger
 from src.services.contractor_service import QuotaExceededError, quota_tracker
 
@@ -28,6 +32,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Finished contractors are written back in batches of this many
+_RESULT_FLUSH_SIZE = 50
+
+# A run killed between result flushes leaves its unsaved contractors marked 'processing';
+# rows marked longer ago than this (minutes) are returned to 'pending' at startup
+_STALE_PROCESSING_MINUTES = 60
+
+# Columns read for processing: everything the Contractor model holds except the region flag
+_CONTRACTOR_COLUMNS = ', '.join(field.name for field in fields(Contractor) if field.name != 'puget_sound')
+
 
 class ProcessingOrchestrator:
     """Orchestrates the contractor processing and export pipeline"""
@@ -41,6 +55,9 @@ class ProcessingOrchestrator:
         self.exported_count = 0
         self.start_time = None
         self.end_time = None
+        # Keyset cursor: id of the last contractor handed out, so a later
+        # process_contractors call resumes after it instead of re-reading from the start
+        self._last_id = 0
     
     async def initialize(self):
         """Initialize the system"""
@@ -50,8 +67,14 @@ class ProcessingOrchestrator:
         if not config.validate():
             raise RuntimeError("Configuration validation failed")
         
-        # Initialize database pool
-        await db_pool.initialize()
+        # Initialize database pool with a warm connection for every contractor in flight,
+        # plus the contractor page prefetch and the occasional stats query
+        await db_pool.initialize(min_size=self.processes + 2, max_size=self.processes * 2 + 2)
+        
+        # Requeue contractors an earlier, hard-killed run never saved
+        reset_count = await self.contractor_service.reset_stale_processing(_STALE_PROCESSING_MINUTES)
+        if reset_count:
+            logger.info(f"♻️  Reset {reset_count:,} stale 'processing' contractors to 'pending'")
         
         # Log quota status
         await self.log_quota_status()
@@ -128,95 +151,120 @@ class ProcessingOrchestrator:
         except Exception as e:
             logger.error(f"Error logging quota status: {e}")
     
-    async def get_contractors(self, limit: int) -> List[Any]:
-        """Get contractors to process with optional Puget Sound filtering"""
-        if self.puget_sound_only:
-            # Get Puget Sound contractors only (ACTIVE only)
-            query = """
-                SELECT * FROM contractors 
-                WHERE processing_status = 'pending' 
-                AND puget_sound = TRUE
-                AND status_code = 'A'
-                ORDER BY id 
-                LIMIT $1
-            """
-        else:
-            # Get all contractors (ACTIVE only)
-            query = """
-                SELECT * FROM contractors 
-                WHERE processing_status = 'pending'
-                AND status_code = 'A'
-                ORDER BY id 
-                LIMIT $1
-            """
+    async def get_contractors(self, limit: int, page_size: int) -> AsyncIterator[Any]:
+        """Stream contractors to process with optional Puget Sound filtering
         
-        rows = await db_pool.fetch(query, limit)
-        contractors = []
-        for row in rows:
-            contractor_data = dict(row)
-            # Remove puget_sound field if it exists to avoid model issues
-            contractor_data.pop('puget_sound', None)
-            contractors.append(contractor_data)
+        Rows are read in keyset pages of `page_size`, and the next page is fetched while
+        the current one is being handed out, so DB round-trips overlap with processing.
+        The stream starts after the last contractor a previous call handed out.
+        """
+        region_filter = "AND puget_sound = TRUE" if self.puget_sound_only else ""
+        # ACTIVE pending contractors only; explicit columns skip puget_sound, which the model doesn't need
+        query = f"""
+            SELECT {_CONTRACTOR_COLUMNS} FROM contractors 
+            WHERE processing_status = 'pending'
+            {region_filter}
+            AND status_code = 'A'
+            AND id > $1
+            ORDER BY id 
+            LIMIT $2
+        """
+        
+        found = 0
+        next_page = asyncio.create_task(db_pool.fetch(query, self._last_id, min(page_size, limit)))
+        try:
+            while next_page is not None:
+                rows = await next_page
+                next_page = None
+                found += len(rows)
+                
+                # Start the next page before yielding this one (a short page means there is no more)
+                if len(rows) == page_size and found < limit:
+                    next_page = asyncio.create_task(
+                        db_pool.fetch(query, rows[-1]['id'], min(page_size, limit - found))
+                    )
+                
+                for row in rows:
+                    yield row
+                    # Only advance once the consumer asks for more; a row it stopped on
+                    # (e.g. quota exceeded before starting it) is read again next call
+                    self._last_id = row['id']
+        finally:
+            if next_page is not None:
+                next_page.cancel()
         
-        logger.info(f"Found {len(contractors)} contractors to process")
+        logger.info(f"Found {found} contractors to process")
         if self.puget_sound_only:
             logger.info("   (ACTIVE Puget Sound contractors only)")
         else:
             logger.info("   (ACTIVE contractors only)")
-        
-        return contractors
     
-    async def process_contractor_chunk(self, contractors: List[Dict], chunk_id: int) -> Dict[str, Any]:
-        """Process a chunk of contractors in a single process"""
-        service = ContractorService()
+    async def process_contractor_window(self, contractors: AsyncIterable[Any]) -> Dict[str, Any]:
+        """Process contractors as a sliding window of at most `processes` concurrent contractors"""
         results = {
-            'chunk_id': chunk_id,
-            'total': len(contractors),
+            'total': 0,
             'completed': 0,
             'failed': 0,
-            'quota_exceeded': False,
-            'start_time': time.time(),
-            'end_time': None
+            'quota_exceeded': False
         }
+        window = asyncio.Semaphore(self.processes)
+        # Finished contractors waiting to be written back in one executemany
+        pending_updates: List[Contractor] = []
+        
+        async def flush_updates():
+            if not pending_updates:
+                return
+            batch = pending_updates[:]
+            pending_updates.clear()
+            try:
+                await self.contractor_service.update_contractors(batch)
+            except Exception as e:
+                logger.error(f"❌ Error saving results for {len(batch)} contractors: {e}")
+        
+        async def process_one(contractor_data: Any):
+            contractor = None
+            try:
+                contractor = Contractor.from_record(contractor_data)
+                await self.contractor_service.process_contractor(contractor, save=False)
+                results['completed'] += 1
+                
+                # Log progress every 10 contractors, reading the quota counters directly
+                # (contractors are streamed, so 'total' is the number started so far, not the target)
+                if results['completed'] % 10 == 0 and logger.isEnabledFor(logging.INFO):
+                    logger.info(f"📊 {results['completed']}/{results['total']} completed | "
+                              f"Queries: {quota_tracker.queries_today:,}/{quota_tracker.daily_quota_limit:,}")
+                
+            except QuotaExceededError:
+                results['quota_exceeded'] = True
+            except Exception as e:
+                logger.error(f"❌ Error processing {contractor_data.get('business_name', 'Unknown')}: {e}")
+                results['failed'] += 1
+            finally:
+                window.release()
+                # Results (including failed/error states) are saved in batches, not one UPDATE each
+                if contractor is not None:
+                    pending_updates.append(contractor)
+                    if len(pending_updates) >= _RESULT_FLUSH_SIZE:
+                        await flush_updates()
         
+        # Errors are handled per contractor, so the task group only unwinds on cancellation
         try:
-            for i, contractor_data in enumerate(contractors):
-                try:
-                    # Check quota before processing each contractor
-                    if quota_tracker.is_quota_exceeded():
+            async with asyncio.TaskGroup() as task_group:
+                async for contractor_data in contractors:
+                    await window.acquire()
+                    
+                    # Check quota before starting each contractor
+                    if results['quota_exceeded'] or quota_tracker.is_quota_exceeded():
                         results['quota_exceeded'] = True
-                        logger.info(f"🛑 Process {chunk_id}: Daily quota exceeded - stopping chunk")
+                        window.release()
+                        logger.info("🛑 Daily quota exceeded - not starting further contractors")
                         break
                     
-                    # Create contractor object
-                    from src.database.models import Contractor
-                    contractor = Contractor.from_dict(contractor_data)
-                    
-                    # Process contractor
-                    await service.process_contractor(contractor)
-                    results['completed'] += 1
-                    
-                    # Log progress every 10 contractors
-                    if (i + 1) % 10 == 0:
-                        quota_status = quota_tracker.get_quota_status()
-                        logger.info(f"📊 Process {chunk_id}: {i + 1}/{len(contractors)} completed | "
-                                  f"Queries: {quota_status['queries_today']:,}/{quota_status['daily_limit']:,}")
-                    
-                except QuotaExceededError:
-                    results['quota_exceeded'] = True
-                    logger.info(f"🛑 Process {chunk_id}: Daily quota exceeded - stopping chunk")
-                    break
-                except Exception as e:
-                    logger.error(f"❌ Process {chunk_id}: Error processing {contractor_data.get('business_name', 'Unknown')}: {e}")
-                    results['failed'] += 1
-        
-        except Exception as e:
-            logger.error(f"❌ Process {chunk_id}: Fatal error: {e}")
-            results['failed'] = len(contractors) - results['completed']
-        
+                    results['total'] += 1
+                    task_group.create_task(process_one(contractor_data))
         finally:
-            results['end_time'] = time.time()
-            await service.close()
+            # Save whatever finished, even if the run is cancelled part-way
+            await flush_updates()
         
         return results
     
@@ -228,55 +276,25 @@ class ProcessingOrchestrator:
         logger.info(f"Starting contractor processing (target: {target_count or 'all'}, batch size: {batch_size}, processes: {self.processes})")
         logger.info(f"Region filter: {'Puget Sound only' if self.puget_sound_only else 'All contractors'}")
         
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         
-        # Get contractors to process
-        contractors = await self.get_contractors(target_count or batch_size)
-        if not contractors:
-            logger.info("No contractors found to process")
-            return 0
+        logger.info(f"🔄 Starting processing with up to {self.processes} contractors in flight...")
         
-        # Split contractors into chunks for parallel processing
-        chunk_size = len(contractors) // self.processes
-        chunks = []
-        for i in range(self.processes):
-            start_idx = i * chunk_size
-            end_idx = start_idx + chunk_size if i < self.processes - 1 else len(contractors)
-            chunks.append(contractors[start_idx:end_idx])
-        
-        logger.info(f"🔄 Starting parallel processing with {self.processes} processes...")
-        logger.info(f"   - Chunk sizes: {[len(chunk) for chunk in chunks]}")
-        
-        # Process chunks in parallel
-        tasks = []
-        for i, chunk in enumerate(chunks):
-            if chunk:  # Only create task if chunk has contractors
-                task = asyncio.create_task(self.process_contractor_chunk(chunk, i + 1))
-                tasks.append(task)
-        
-        # Wait for all tasks to complete
-        chunk_results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Process results
-        total_completed = 0
-        total_failed = 0
-        quota_exceeded = False
-        
-        for i, result in enumerate(chunk_results):
-            if isinstance(result, Exception):
-                logger.error(f"❌ Process {i + 1}: Exception: {result}")
-                total_failed += len(chunks[i]) if i < len(chunks) else 0
+        # Contractors stream in from the database as the window drains; closing the stream
+        # on an early stop (quota exceeded) cancels any page fetch still in flight
+        async with contextlib.aclosing(self.get_contractors(target_count or batch_size, batch_size)) as contractors:
+            results = await self.process_contractor_window(contractors)
+        if not results['total']:
+            if results['quota_exceeded']:
+                logger.info("🛑 Daily Google API quota exceeded - no contractors were started")
             else:
-                total_completed += result['completed']
-                total_failed += result['failed']
-                if result['quota_exceeded']:
-                    quota_exceeded = True
-                
-                duration = result['end_time'] - result['start_time']
-                logger.info(f"✅ Process {i + 1}: {result['completed']} completed, {result['failed']} failed "
-                          f"({duration:.1f}s)")
+                logger.info("No contractors found to process")
+            return 0
+        total_completed = results['completed']
+        total_failed = results['failed']
+        quota_exceeded = results['quota_exceeded']
         
-        self.end_time = time.time()
+        self.end_time = time.monotonic()
         self.processed_count = total_completed
         
         # Print final results
@@ -337,7 +355,7 @@ async def main():
     parser = argparse.ArgumentParser(description='Process contractors through enrichment pipeline')
     parser.add_argument('--count', '-c', type=int, help='Number of contractors to process')
     parser.add_argument('--batch-size', '-b', type=int, help='Batch size for processing')
-    parser.add_argument('--processes', '-p', type=int, default=3, help='Number of parallel processes (default: 3)')
+    parser.add_argument('--processes', '-p', type=int, default=3, help='Number of contractors processed concurrently (default: 3)')
     parser.add_argument('--all', action='store_true', help='Process all ACTIVE contractors (overrides default Puget Sound filter)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging')
     
@@ -376,4 +394,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_event_loop()
     asyncio.run(main())
\ No newline at end of file
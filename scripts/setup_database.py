@@ -18,6 +18,105 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Seed service categories (the rows of sql/03_insert_categories.sql), bulk-loaded with COPY:
+# (name, priority, afb_name, category, keywords, typical_services, sort_order)
+CATEGORY_COLUMNS = ['name', 'priority', 'afb_name', 'category', 'keywords', 'typical_services', 'sort_order']
+CATEGORIES = [
+    ('Plumbing', True, 'Plumbing Services', 'Home Services',
+     ['plumber', 'pipes', 'drain', 'water heater', 'leak', 'sewer', 'faucet', 'toilet'],
+     ['Drain cleaning', 'Water heater repair', 'Pipe repair', 'Leak detection', 'Bathroom fixtures'],
+     1),
+    ('HVAC', True, 'Heating & Cooling', 'Home Services',
+     ['heating', 'cooling', 'air conditioning', 'furnace', 'hvac', 'heat pump', 'duct'],
+     ['AC repair', 'Furnace installation', 'Duct cleaning', 'Heat pump service'],
+     2),
+    ('Electrical', True, 'Electrical Services', 'Home Services',
+     ['electrician', 'wiring', 'electrical', 'panel', 'outlet', 'lighting', 'electrical repair'],
+     ['Electrical repairs', 'Panel upgrades', 'Outlet installation', 'Lighting installation'],
+     3),
+    ('Roofing', True, 'Roofing Contractors', 'Home Services',
+     ['roofer', 'roofing', 'shingles', 'roof repair', 'gutters', 'siding'],
+     ['Roof replacement', 'Roof repair', 'Gutter installation', 'Siding repair'],
+     4),
+    ('General Contractor', True, 'General Construction', 'Home Services',
+     ['general contractor', 'construction', 'remodeling', 'renovation', 'building'],
+     ['Home remodeling', 'Room additions', 'Kitchen renovation', 'Bathroom remodel'],
+     5),
+    ('Handyman', True, 'Handyman Services', 'Home Services',
+     ['handyman', 'repair', 'maintenance', 'odd jobs', 'fix', 'installation'],
+     ['General repairs', 'Home maintenance', 'Fixture installation', 'Odd jobs'],
+     6),
+    ('Flooring', True, 'Flooring Installation', 'Home Services',
+     ['flooring', 'hardwood', 'carpet', 'tile', 'laminate', 'vinyl', 'floor installation'],
+     ['Hardwood installation', 'Carpet installation', 'Tile work', 'Floor refinishing'],
+     7),
+    ('Painting', True, 'Painting Services', 'Home Services',
+     ['painter', 'painting', 'interior painting', 'exterior painting', 'drywall'],
+     ['Interior painting', 'Exterior painting', 'Drywall repair', 'Wallpaper removal'],
+     8),
+    ('Landscaping', True, 'Landscaping Services', 'Home Services',
+     ['landscaping', 'lawn care', 'tree service', 'gardening', 'irrigation', 'landscape design'],
+     ['Lawn maintenance', 'Tree removal', 'Landscape design', 'Irrigation systems'],
+     9),
+    ('Windows & Doors', True, 'Window & Door Installation', 'Home Services',
+     ['windows', 'doors', 'window installation', 'door replacement', 'glass'],
+     ['Window replacement', 'Door installation', 'Glass repair', 'Screen repair'],
+     10),
+    ('Concrete', False, 'Concrete Services', 'Home Services',
+     ['concrete', 'driveway', 'patio', 'sidewalk', 'foundation', 'cement'],
+     ['Driveway installation', 'Patio construction', 'Concrete repair', 'Foundation work'],
+     11),
+    ('Fencing', False, 'Fencing Contractors', 'Home Services',
+     ['fence', 'fencing', 'gate', 'privacy fence', 'chain link'],
+     ['Fence installation', 'Gate repair', 'Privacy fencing', 'Fence repair'],
+     12),
+    ('Kitchen & Bath', True, 'Kitchen & Bathroom Remodeling', 'Home Services',
+     ['kitchen', 'bathroom', 'cabinets', 'countertops', 'vanity', 'backsplash'],
+     ['Kitchen remodel', 'Bathroom renovation', 'Cabinet installation', 'Countertop installation'],
+     13),
+    ('Insulation', False, 'Insulation Services', 'Home Services',
+     ['insulation', 'attic insulation', 'weatherization', 'energy efficiency'],
+     ['Attic insulation', 'Wall insulation', 'Weatherproofing', 'Energy audits'],
+     14),
+    ('Security Systems', False, 'Security Services', 'Home Services',
+     ['security', 'alarm', 'camera', 'monitoring', 'access control'],
+     ['Security system installation', 'Camera systems', 'Alarm monitoring'],
+     15),
+    ('Pool & Spa', False, 'Pool Services', 'Home Services',
+     ['pool', 'spa', 'hot tub', 'pool maintenance', 'pool repair'],
+     ['Pool cleaning', 'Pool repair', 'Hot tub service', 'Pool equipment'],
+     16),
+    ('Garage Doors', False, 'Garage Door Services', 'Home Services',
+     ['garage door', 'opener', 'garage door repair', 'overhead door'],
+     ['Garage door installation', 'Opener repair', 'Door maintenance'],
+     17),
+    ('Septic Systems', False, 'Septic Services', 'Home Services',
+     ['septic', 'septic tank', 'drain field', 'septic pumping'],
+     ['Septic pumping', 'Septic repair', 'Drain field installation'],
+     18),
+    ('Solar', False, 'Solar Installation', 'Home Services',
+     ['solar', 'solar panels', 'renewable energy', 'solar installation'],
+     ['Solar panel installation', 'Solar system design', 'Solar maintenance'],
+     19),
+    ('Demolition', False, 'Demolition Services', 'Construction',
+     ['demolition', 'removal', 'tear down', 'debris removal'],
+     ['Structure demolition', 'Debris removal', 'Site clearing'],
+     20),
+    ('Commercial Construction', False, 'Commercial Building', 'Commercial',
+     ['commercial construction', 'office building', 'retail', 'warehouse'],
+     ['Office construction', 'Retail buildouts', 'Warehouse construction'],
+     50),
+    ('Industrial Services', False, 'Industrial Contractors', 'Industrial',
+     ['industrial', 'manufacturing', 'factory', 'plant maintenance'],
+     ['Industrial maintenance', 'Factory services', 'Plant construction'],
+     51),
+    ('Municipal Services', False, 'Government Contractors', 'Municipal',
+     ['municipal', 'government', 'public works', 'city contracts'],
+     ['Public works', 'Municipal construction', 'Government projects'],
+     52),
+]
+
+
 async def create_database_if_not_exists():
     """Create the database if it doesn't exist"""
     try:
@@ -50,31 +149,58 @@ async def create_database_if_not_exists():
         raise
 
 
-async def execute_sql_file(file_path: Path):
-    """Execute SQL commands from a file"""
+async def connect_to_database() -> asyncpg.Connection:
+    """Open a connection to the application database"""
+    return await asyncpg.connect(
+        host=config.DB_HOST,
+        port=config.DB_PORT,
+        user=config.DB_USER,
+        password=config.DB_PASSWORD,
+        database=config.DB_NAME
+    )
+
+
+async def execute_sql_file(file_path: Path, conn: asyncpg.Connection = None):
+    """Execute SQL commands from a file
+    
+    Runs on ``conn`` when given (the caller keeps ownership), otherwise on a
+    connection opened and closed for this file.
+    """
     try:
         with open(file_path, 'r') as f:
             sql_content = f.read()
         
-        conn = await asyncpg.connect(
-            host=config.DB_HOST,
-            port=config.DB_PORT,
-            user=config.DB_USER,
-            password=config.DB_PASSWORD,
-            database=config.DB_NAME
-        )
-        
-        logger.info(f"Executing SQL file: {file_path}")
-        await conn.execute(sql_content)
-        logger.info(f"Successfully executed: {file_path}")
+        own_conn = conn is None
+        if own_conn:
+            conn = await connect_to_database()
         
-        await conn.close()
+        try:
+            logger.info(f"Executing SQL file: {file_path}")
+            await conn.execute(sql_content)
+            logger.info(f"Successfully executed: {file_path}")
+        finally:
+            if own_conn:
+                await conn.close()
         
     except Exception as e:
         logger.error(f"Error executing {file_path}: {e}")
         raise
 
 
+async def load_categories(conn: asyncpg.Connection = None):
+    """Bulk-load the seed categories with a single COPY"""
+    own_conn = conn is None
+    if own_conn:
+        conn = await connect_to_database()
+    
+    try:
+        logger.info(f"Loading {len(CATEGORIES)} seed categories")
+        await conn.copy_records_to_table('categories', records=CATEGORIES, columns=CATEGORY_COLUMNS)
+    finally:
+        if own_conn:
+            await conn.close()
+
+
 async def setup_database():
     """Main database setup function"""
     logger.info("Starting database setup...")
@@ -91,22 +217,15 @@ async def setup_database():
         # Get the SQL directory path
         sql_dir = Path(__file__).parent.parent / 'sql'
         
-        # Execute SQL files in order
-        sql_files = [
-            '01_create_schema.sql',
-            '02_create_indexes.sql',
-            '03_insert_categories.sql'
-        ]
-        
-        for sql_file in sql_files:
-            file_path = sql_dir / sql_file
-            if file_path.exists():
-                await execute_sql_file(file_path)
-            else:
-                logger.warning(f"SQL file not found: {file_path}")
-        
-        # Test the connection and verify tables
-        conn = await asyncpg.connect(config.database_url)
+        conn = await connect_to_database()
+        
+        # The schema must exist first; the indexes and the seed categories only
+        # depend on it, so those load side by side on separate connections
+        await execute_sql_file(sql_dir / '01_create_schema.sql', conn)
+        await asyncio.gather(
+            execute_sql_file(sql_dir / '02_create_indexes.sql', conn),
+            load_categories()
+        )
         
         # Check if main tables exist
         tables = await conn.fetch("""
@@ -19,8 +19,9 @@ async def show_processed_puget_sound():
     await db_pool.initialize()
     
     try:
-        # Get processed Puget Sound contractors
-        contractors = await db_pool.fetch('''
+        # Get processed Puget Sound contractors, with the summary aggregated by Postgres
+        # over every processed Puget Sound contractor (not just the rows shown)
+        contractors, summary, categories = await asyncio.gather(db_pool.fetch('''
             SELECT 
                 business_name,
                 city,
@@ -35,7 +36,27 @@ async def show_processed_puget_sound():
             AND processing_status = 'completed'
             ORDER BY last_processed DESC 
             LIMIT 20
-        ''')
+        '''), db_pool.fetchrow('''
+            SELECT 
+                COUNT(*) as total,
+                COUNT(*) FILTER (WHERE website_url IS NOT NULL AND website_url <> '') as with_websites,
+                COUNT(*) FILTER (WHERE confidence_score >= 0.8) as high_conf,
+                AVG(COALESCE(confidence_score, 0)) as avg_overall,
+                AVG(COALESCE(website_confidence, 0)) as avg_website,
+                AVG(COALESCE(classification_confidence, 0)) as avg_classification
+            FROM contractors 
+            WHERE puget_sound = TRUE 
+            AND processing_status = 'completed'
+        '''), db_pool.fetch('''
+            SELECT 
+                COALESCE(mailer_category, 'General Contractor') as category,
+                COUNT(*) as count
+            FROM contractors 
+            WHERE puget_sound = TRUE 
+            AND processing_status = 'completed'
+            GROUP BY 1
+            ORDER BY count DESC, category
+        '''))
         
         print("🏔️ PROCESSED PUGET SOUND CONTRACTORS")
         print("=" * 60)
@@ -84,38 +105,25 @@ async def show_processed_puget_sound():
         print(tabulate(table_data, headers=headers, tablefmt="grid", maxcolwidths=[25, 15, 40, 20, 8, 8, 8]))
         
         # Show summary
+        total = summary['total']
         print()
-        print("📈 SUMMARY:")
+        print(f"📈 SUMMARY (all {total} processed):")
         print("=" * 30)
         
-        # Count by category
-        categories = {}
-        for contractor in contractors:
-            category = contractor['mailer_category'] or "General Contractor"
-            categories[category] = categories.get(category, 0) + 1
-        
         print("📂 Categories:")
-        for category, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
-            print(f"  {category}: {count}")
+        for row in categories:
+            print(f"  {row['category']}: {row['count']}")
         
-        # Count with websites
-        with_websites = sum(1 for c in contractors if c['website_url'])
         print(f"\n🌐 Website Discovery:")
-        print(f"  With websites: {with_websites}/{len(contractors)} ({with_websites/len(contractors)*100:.1f}%)")
+        print(f"  With websites: {summary['with_websites']}/{total} ({summary['with_websites']/total*100:.1f}%)")
         
-        # Count high confidence
-        high_conf = sum(1 for c in contractors if (c['confidence_score'] or 0) >= 0.8)
-        print(f"\n🎯 High Confidence (≥0.8): {high_conf}/{len(contractors)} ({high_conf/len(contractors)*100:.1f}%)")
+        print(f"\n🎯 High Confidence (≥0.8): {summary['high_conf']}/{total} ({summary['high_conf']/total*100:.1f}%)")
         
         # Average confidence scores
-        avg_overall = sum(c['confidence_score'] or 0 for c in contractors) / len(contractors)
-        avg_website = sum(c['website_confidence'] or 0 for c in contractors) / len(contractors)
-        avg_classification = sum(c['classification_confidence'] or 0 for c in contractors) / len(contractors)
-        
         print(f"\n📊 Average Confidence Scores:")
-        print(f"  Overall: {avg_overall:.2f}")
-        print(f"  Website Discovery: {avg_website:.2f}")
-        print(f"  AI Classification: {avg_classification:.2f}")
+        print(f"  Overall: {summary['avg_overall']:.2f}")
+        print(f"  Website Discovery: {summary['avg_website']:.2f}")
+        print(f"  AI Classification: {summary['avg_classification']:.2f}")
         
     finally:
         await db_pool.close()
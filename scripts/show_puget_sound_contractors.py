@@ -7,12 +7,14 @@ Display a table of recent Puget Sound contractors with their details.
 
 USAGE:
     python scripts/show_puget_sound_contractors.py --limit 50
+    python scripts/show_puget_sound_contractors.py --limit 10000 --csv > contractors.csv
 """
 
 import asyncio
 import sys
 import os
 import argparse
+from collections import Counter
 from datetime import datetime
 from tabulate import tabulate
 
@@ -21,6 +23,36 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.database.connection import db_pool
 
+# Recent Puget Sound contractors, newest first
+RECENT_CONTRACTORS_QUERY = '''
+    SELECT 
+        business_name,
+        city,
+        state,
+        website_url,
+        mailer_category,
+        confidence_score,
+        processing_status,
+        review_status,
+        created_at
+    FROM contractors 
+    WHERE puget_sound = TRUE 
+    ORDER BY created_at DESC 
+    LIMIT $1
+'''
+
+async def export_puget_sound_contractors_csv(limit: int, output):
+    """Write recent Puget Sound contractors as CSV straight from a COPY stream
+    
+    Skips Record/row construction entirely, for large limits or piping into other tools.
+    """
+    await db_pool.initialize()
+    
+    try:
+        await db_pool.copy_from_query(RECENT_CONTRACTORS_QUERY, limit, output=output)
+    finally:
+        await db_pool.close()
+
 async def show_puget_sound_contractors(limit: int = 50):
     """Show recent Puget Sound contractors in a table"""
     
@@ -33,22 +65,7 @@ async def show_puget_sound_contractors(limit: int = 50):
     
     try:
         # Get recent Puget Sound contractors
-        contractors = await db_pool.fetch('''
-            SELECT 
-                business_name,
-                city,
-                state,
-                website_url,
-                mailer_category,
-                confidence_score,
-                processing_status,
-                review_status,
-                created_at
-            FROM contractors 
-            WHERE puget_sound = TRUE 
-            ORDER BY created_at DESC 
-            LIMIT $1
-        ''', limit)
+        contractors = await db_pool.fetch(RECENT_CONTRACTORS_QUERY, limit)
         
         if not contractors:
             print("❌ No Puget Sound contractors found!")
@@ -57,8 +74,12 @@ async def show_puget_sound_contractors(limit: int = 50):
         print(f"📊 Found {len(contractors)} recent Puget Sound contractors")
         print()
         
-        # Prepare table data
+        # Prepare table data and summary counts in a single pass
         table_data = []
+        categories = Counter()
+        statuses = Counter()
+        high_conf = med_conf = low_conf = 0
+        with_websites = 0
         for contractor in contractors:
             # Clean up website URL for display
             website = contractor['website_url'] or "None"
@@ -79,6 +100,17 @@ async def show_puget_sound_contractors(limit: int = 50):
             # Get status
             status = contractor['processing_status'] or "unknown"
             
+            categories[category] += 1
+            statuses[status] += 1
+            if confidence >= 0.8:
+                high_conf += 1
+            elif confidence >= 0.6:
+                med_conf += 1
+            else:
+                low_conf += 1
+            if contractor['website_url']:
+                with_websites += 1
+            
             table_data.append([
                 business_name,
                 f"{contractor['city']}, {contractor['state']}",
@@ -97,38 +129,19 @@ async def show_puget_sound_contractors(limit: int = 50):
         print("📈 SUMMARY STATISTICS:")
         print("=" * 40)
         
-        # Count by category
-        categories = {}
-        for contractor in contractors:
-            category = contractor['mailer_category'] or "General Contractor"
-            categories[category] = categories.get(category, 0) + 1
-        
         print("📂 Category Distribution:")
-        for category, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
+        for category, count in categories.most_common():
             print(f"  {category}: {count}")
         
-        # Count by confidence level
-        high_conf = sum(1 for c in contractors if (c['confidence_score'] or 0) >= 0.8)
-        med_conf = sum(1 for c in contractors if 0.6 <= (c['confidence_score'] or 0) < 0.8)
-        low_conf = sum(1 for c in contractors if (c['confidence_score'] or 0) < 0.6)
-        
         print(f"\n🎯 Confidence Distribution:")
         print(f"  High (≥0.8): {high_conf}")
         print(f"  Medium (0.6-0.79): {med_conf}")
         print(f"  Low (<0.6): {low_conf}")
         
-        # Count by status
-        statuses = {}
-        for contractor in contractors:
-            status = contractor['processing_status'] or "unknown"
-            statuses[status] = statuses.get(status, 0) + 1
-        
         print(f"\n🔄 Processing Status:")
         for status, count in sorted(statuses.items()):
             print(f"  {status}: {count}")
         
-        # Count with websites
-        with_websites = sum(1 for c in contractors if c['website_url'])
         print(f"\n🌐 Website Discovery:")
         print(f"  With websites: {with_websites}/{len(contractors)} ({with_websites/len(contractors)*100:.1f}%)")
         
@@ -139,10 +152,16 @@ async def main():
     """Main function"""
     parser = argparse.ArgumentParser(description="Show Recent Puget Sound Contractors")
     parser.add_argument("--limit", type=int, default=50, help="Number of contractors to show")
+    parser.add_argument("--csv", nargs="?", const="-", metavar="PATH",
+                        help="Write CSV via COPY instead of a table (to PATH, or stdout if omitted)")
     
     args = parser.parse_args()
     
-    await show_puget_sound_contractors(args.limit)
+    if args.csv:
+        output = sys.stdout.buffer if args.csv == "-" else args.csv
+        await export_puget_sound_contractors_csv(args.limit, output)
+    else:
+        await show_puget_sound_contractors(args.limit)
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
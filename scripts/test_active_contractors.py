@@ -22,33 +22,16 @@ async def test_active_contractors():
     print("🔍 TESTING ACTIVE CONTRACTOR FILTERING")
     print("=" * 50)
     
-    # Test Puget Sound ACTIVE contractors
-    puget_active_query = """
-        SELECT COUNT(*) as count 
-        FROM contractors 
-        WHERE processing_status = 'pending' 
-        AND puget_sound = TRUE
-        AND status_code = 'A'
-    """
-    
-    puget_active = await db_pool.fetchrow(puget_active_query)
-    puget_active_count = puget_active['count']
-    
-    print(f"📊 ACTIVE Puget Sound Pending: {puget_active_count:,}")
-    
-    # Test all ACTIVE contractors
-    all_active_query = """
-        SELECT COUNT(*) as count 
+    # Both ACTIVE pending counts in one scan: the Puget Sound count is a FILTER over the same rows
+    counts_query = """
+        SELECT 
+            COUNT(*) FILTER (WHERE puget_sound = TRUE) as puget_count,
+            COUNT(*) as all_count
         FROM contractors 
         WHERE processing_status = 'pending'
         AND status_code = 'A'
     """
     
-    all_active = await db_pool.fetchrow(all_active_query)
-    all_active_count = all_active['count']
-    
-    print(f"📊 All ACTIVE Pending: {all_active_count:,}")
-    
     # Show some sample records
     sample_query = """
         SELECT id, business_name, city, state, status_code, processing_status, puget_sound
@@ -59,7 +42,14 @@ async def test_active_contractors():
         LIMIT 5
     """
     
-    samples = await db_pool.fetch(sample_query)
+    # The two queries run on separate pool connections, so their round-trips overlap
+    counts, samples = await asyncio.gather(
+        db_pool.fetchrow(counts_query),
+        db_pool.fetch(sample_query)
+    )
+    
+    print(f"📊 ACTIVE Puget Sound Pending: {counts['puget_count']:,}")
+    print(f"📊 All ACTIVE Pending: {counts['all_count']:,}")
     
     print(f"\n📋 Sample ACTIVE Puget Sound Contractors:")
     for sample in samples:
@@ -13,7 +13,7 @@ import os
 # Add the project root to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.services.contractor_service import ContractorService
+from src.services.contractor_service import ContractorService, NormalizedSearchItem
 
 async def test_confidence_calculation():
     """Test confidence calculation for specific search results"""
@@ -43,6 +43,9 @@ async def test_confidence_calculation():
     print(f"   - Snippet: {search_item['snippet'][:100]}...")
     print()
     
+    # Lowercased title/snippet/link and domain, as the service's checks see them
+    normalized = NormalizedSearchItem.from_raw(search_item)
+    
     # Test validation checks
     is_valid_website = service._is_valid_website(search_item['link'])
     has_wa_location = service._has_wa_location_indicators(search_item['link'], search_item['title'], search_item['snippet'])
@@ -53,7 +56,7 @@ async def test_confidence_calculation():
     print()
     
     # Test confidence calculation
-    confidence = service._calculate_search_confidence(search_item, business_name, city, state)
+    confidence = service._calculate_search_confidence(normalized, business_name, city, state)
     
     print(f"📊 Confidence Calculation:")
     print(f"   - Final confidence: {confidence:.3f}")
@@ -67,7 +70,7 @@ async def test_confidence_calculation():
     print()
     
     # Test domain analysis
-    domain = search_item['link'].lower().replace('https://', '').replace('http://', '').split('/')[0]
+    domain = normalized.domain
     business_name_lower = business_name.lower()
     simple_name_lower = simple_name.lower()
     
@@ -79,8 +82,8 @@ async def test_confidence_calculation():
     print()
     
     # Test title/snippet analysis
-    title_lower = search_item['title'].lower()
-    snippet_lower = search_item['snippet'].lower()
+    title_lower = normalized.title_lower
+    snippet_lower = normalized.snippet_lower
     
     print(f"🔍 Content Analysis:")
     print(f"   - Business name in title: {business_name_lower in title_lower}")
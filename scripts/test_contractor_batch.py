@@ -12,11 +12,16 @@ from tabulate import tabulate
 # Add the project root to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src.config import config
 from src.database.connection import db_pool
 from src.services.contractor_service import ContractorService
 
-async def test_batch_with_city(limit=10):
-    """Process pending contractors and display results with city info"""
+async def test_batch_with_city(limit=10, processes=3):
+    """Process pending contractors and display results with city info
+    
+    Up to `processes` contractors are in flight at once; the service (and its
+    HTTP session) is shared, so their network waits overlap.
+    """
     print("🚀 Starting batch test with city information...")
     print("=" * 60)
     
@@ -32,23 +37,39 @@ async def test_batch_with_city(limit=10):
             print("❌ No pending contractors found!")
             return
         
-        print(f"📋 Found {len(contractors)} pending contractors to process")
+        print(f"📋 Found {len(contractors)} pending contractors to process ({processes} at a time)")
         print()
         
-        # Process each contractor
-        results = []
-        for i, contractor in enumerate(contractors, 1):
-            print(f"Processing {i}/{len(contractors)}: {contractor.business_name} ({contractor.city}, {contractor.state})")
+        # Process contractors concurrently, bounded by the semaphore
+        semaphore = asyncio.Semaphore(processes)
+        
+        async def process_one(i, contractor):
+            async with semaphore:
+                print(f"Processing {i}/{len(contractors)}: {contractor.business_name} ({contractor.city}, {contractor.state})")
+                processed_contractor = await service.process_contractor(contractor)
             
-            # Process the contractor
-            processed_contractor = await service.process_contractor(contractor)
+            website_url = processed_contractor.website_url or "None"
+            confidence = processed_contractor.confidence_score or 0.0
+            category = processed_contractor.mailer_category or "None"
+            print(f"   ✅ Completed: {processed_contractor.business_name} | {category} | "
+                  f"Confidence: {confidence:.2f} | Website: {website_url}")
+            return processed_contractor
+        
+        processed = await asyncio.gather(
+            *(process_one(i, contractor) for i, contractor in enumerate(contractors, 1)),
+            return_exceptions=True
+        )
+        
+        # Extract results, in the original order
+        results = []
+        for contractor, processed_contractor in zip(contractors, processed):
+            if isinstance(processed_contractor, Exception):
+                print(f"   ❌ Failed: {contractor.business_name}: {processed_contractor}")
+                continue
             
-            # Extract results
             website_url = processed_contractor.website_url or "None"
             confidence = processed_contractor.confidence_score or 0.0
-            status = processed_contractor.processing_status or "unknown"
             category = processed_contractor.mailer_category or "None"
-            is_home = "Yes" if processed_contractor.residential_focus else "No"
             
             results.append([
                 processed_contractor.business_name,
@@ -59,8 +80,10 @@ async def test_batch_with_city(limit=10):
                 processed_contractor.review_status or "unknown",
                 "Yes" if processed_contractor.residential_focus else "No"
             ])
-            
-            print(f"   ✅ Completed: {category} | Confidence: {confidence:.2f} | Website: {website_url}")
+        
+        if not results:
+            print("❌ No contractors were processed successfully!")
+            return
         
         # Display results table
         print("\n" + "=" * 60)
@@ -110,6 +133,11 @@ if __name__ == "__main__":
     
     parser = argparse.ArgumentParser(description='Test contractor batch processing')
     parser.add_argument('--limit', type=int, default=10, help='Number of contractors to process (default: 10)')
+    parser.add_argument('--processes', '-p', type=int, default=3, help='Number of contractors processed concurrently (default: 3)')
+    parser.add_argument('--replay', action='store_true',
+                        help='Answer Google searches only from the on-disk search cache (no API quota used)')
     
     args = parser.parse_args()
-    asyncio.run(test_batch_with_city(args.limit)) 
\ No newline at end of file
+    if args.replay:
+        config.GOOGLE_SEARCH_CACHE_REPLAY = True
+    asyncio.run(test_batch_with_city(args.limit, args.processes)) 
\ No newline at end of file
@@ -12,6 +12,7 @@ from dotenv import load_dotenv
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.config import config
+from src.services.contractor_service import ContractorService
 
 async def test_google_api():
     """Test Google API status"""
@@ -27,12 +28,11 @@ async def test_google_api():
         print("❌ Google API not configured!")
         return
     
-    # Test API call
-    import aiohttp
-    
-    session = aiohttp.ClientSession()
+    # Test API call on the service's session, so it goes out exactly as processing's calls do
+    service = ContractorService()
     
     try:
+        session = await service._get_session()
         url = "https://www.googleapis.com/customsearch/v1"
         params = {
             'key': config.GOOGLE_API_KEY,
@@ -58,7 +58,7 @@ async def test_google_api():
     except Exception as e:
         print(f"❌ Error testing API: {e}")
     finally:
-        await session.close()
+        await service.close()
 
 if __name__ == "__main__":
     asyncio.run(test_google_api()) 
\ No newline at end of file
@@ -11,28 +11,24 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.database.connection import db_pool
 from src.services.contractor_service import ContractorService
 
-async def test_search_queries(contractor_name):
-    """Test the simplified search queries for a contractor"""
+async def test_search_queries(contractor_names):
+    """Test the simplified search queries for one or more contractors"""
     await db_pool.initialize()
     
-    # Get the contractor
-    async with db_pool.pool.acquire() as conn:
-        result = await conn.fetchrow('''
-            SELECT * FROM contractors 
-            WHERE business_name ILIKE $1
-            LIMIT 1
-        ''', f'%{contractor_name}%')
-        
+    contractor = ContractorService()
+    
+    # Get every contractor in a single query
+    results = await contractor.get_contractors_by_names(contractor_names)
+    
+    for contractor_name, result in zip(contractor_names, results):
         if not result:
             print(f"No contractor found matching: {contractor_name}")
-            return
-        
-        contractor = ContractorService()
+            continue
         
         # Test the simplified search queries
-        business_name = result['business_name']
-        city = result['city'] or ''
-        state = result['state'] or ''
+        business_name = result.business_name
+        city = result.city or ''
+        state = result.state or ''
         
         print(f"🔍 Testing search queries for: {business_name}")
         print(f"📍 Location: {city}, {state}")
@@ -53,14 +49,16 @@ async def test_search_queries(contractor_name):
         print(f"  Original: '{business_name}'")
         print(f"  Simple:   '{simple_name}'")
         print(f"  Location: '{city}, {state}'")
-        
-        await contractor.close()
+        print()
     
+    await contractor.close()
     await db_pool.close()
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Test simplified search queries')
-    parser.add_argument('--contractor', '-c', type=str, default='425 CONSTRUCTION', help='Contractor name to test')
+    parser.add_argument('--contractor', '-c', type=str, default='425 CONSTRUCTION',
+                        help='Contractor name to test (comma-separated for several)')
     args = parser.parse_args()
     
-    asyncio.run(test_search_queries(args.contractor)) 
\ No newline at end of file
+    contractor_names = [name.strip() for name in args.contractor.split(',') if name.strip()]
+    asyncio.run(test_search_queries(contractor_names))
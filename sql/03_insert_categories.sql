@@ -1,5 +1,7 @@
 -- Insert sample mailer categories for home contractors
 -- This represents common contractor service categories
+-- scripts/setup_database.py bulk-loads these same rows into categories with COPY
+-- (CATEGORIES there); this file is kept for loading them by hand with psql
 
 INSERT INTO mailer_categories (category_name, priority, afb_name, category, keywords, typical_services, sort_order) VALUES
 ('Plumbing', TRUE, 'Plumbing Services', 'Home Services', 
@@ -0,0 +1,17 @@
+-- Partial indexes for the processing orchestrator's pending-contractor stream
+-- (scripts/run_processing.py: ProcessingOrchestrator.get_contractors)
+--
+-- The orchestrator pages through ACTIVE pending contractors in id order
+-- (WHERE ... AND id > $1 ORDER BY id LIMIT $2). With these indexes each page is
+-- a short index range scan instead of a scan over every pending row.
+-- Requires the puget_sound column (05_add_puget_sound_column.sql).
+
+-- Default run: ACTIVE Puget Sound contractors only
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_contractors_pending_active_puget_sound
+ON contractors (id)
+WHERE processing_status = 'pending' AND status_code = 'A' AND puget_sound = TRUE;
+
+-- --all run: every ACTIVE contractor
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_contractors_pending_active
+ON contractors (id)
+WHERE processing_status = 'pending' AND status_code = 'A';
@@ -2,9 +2,11 @@
 Configuration management for contractor enrichment system
 """
 import os
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from dotenv import load_dotenv
 import re
+from urllib.parse import urlparse
 
 # Load environment variables
 load_dotenv()
@@ -21,6 +23,9 @@ class Config:
     DB_PASSWORD: str = os.getenv('DB_PASSWORD', '')
     DB_MIN_CONNECTIONS: int = int(os.getenv('DB_MIN_CONNECTIONS', '5'))
     DB_MAX_CONNECTIONS: int = int(os.getenv('DB_MAX_CONNECTIONS', '20'))
+    DB_STATEMENT_CACHE_SIZE: int = int(os.getenv('DB_STATEMENT_CACHE_SIZE', '100'))  # Prepared statements kept per connection
+    # Enrichment results can be recomputed, so commits don't wait for the WAL flush by default
+    DB_SYNCHRONOUS_COMMIT: str = os.getenv('DB_SYNCHRONOUS_COMMIT', 'off')
     
     # OpenAI Configuration
     OPENAI_API_KEY: str = os.getenv('OPENAI_API_KEY', '')
@@ -29,13 +34,18 @@ class Config:
     OPENAI_MAX_TOKENS: int = int(os.getenv('OPENAI_MAX_TOKENS', '4096'))
     OPENAI_TEMPERATURE: float = float(os.getenv('OPENAI_TEMPERATURE', '0.2'))
     OPENAI_TIMEOUT: int = int(os.getenv('OPENAI_TIMEOUT', '60'))
+    MAX_CONCURRENT_LLM_CALLS: int = int(os.getenv('MAX_CONCURRENT_LLM_CALLS', '20'))
     
     # Processing Configuration
     BATCH_SIZE: int = int(os.getenv('BATCH_SIZE', '10'))
+    MAX_CONCURRENT_SEARCHES: int = int(os.getenv('MAX_CONCURRENT_SEARCHES', '3'))
     MAX_CONCURRENT_CRAWLS: int = int(os.getenv('MAX_CONCURRENT_CRAWLS', '5'))
     CRAWL_TIMEOUT: int = int(os.getenv('CRAWL_TIMEOUT', '30'))
+    MAX_CRAWL_BYTES: int = int(os.getenv('MAX_CRAWL_BYTES', '200000'))  # Stop reading page bodies past this size
+    MAX_PARSER_WORKERS: int = int(os.getenv('MAX_PARSER_WORKERS', str(os.cpu_count() or 1)))  # HTML parser processes
     RETRY_ATTEMPTS: int = int(os.getenv('RETRY_ATTEMPTS', '3'))
     RETRY_DELAY: int = int(os.getenv('RETRY_DELAY', '5'))
+    MIN_CONTENT_LENGTH: int = int(os.getenv('MIN_CONTENT_LENGTH', '500'))  # Skip validation on parked/empty pages
     
     # Confidence Thresholds
     AUTO_APPROVE_THRESHOLD: float = float(os.getenv('AUTO_APPROVE_THRESHOLD', '0.8'))
@@ -48,6 +58,10 @@ class Config:
     # Search API Keys (optional)
     GOOGLE_API_KEY: Optional[str] = os.getenv('GOOGLE_SEARCH_API_KEY') or os.getenv('GOOGLE_API_KEY')
     GOOGLE_CSE_ID: Optional[str] = os.getenv('GOOGLE_SEARCH_ENGINE_ID') or os.getenv('GOOGLE_CSE_ID')
+    # Persist Google responses to disk and reuse them on later runs; replay mode only reads the cache
+    GOOGLE_SEARCH_CACHE: bool = os.getenv('GOOGLE_SEARCH_CACHE', 'False').lower() == 'true'
+    GOOGLE_SEARCH_CACHE_REPLAY: bool = os.getenv('GOOGLE_SEARCH_CACHE_REPLAY', 'False').lower() == 'true'
+    GOOGLE_SEARCH_CACHE_PATH: str = os.getenv('GOOGLE_SEARCH_CACHE_PATH', '.cache/google_search.sqlite')
     
     # Application Settings
     DEBUG: bool = os.getenv('DEBUG', 'False').lower() == 'true'
@@ -83,7 +97,7 @@ config = Config()
 
 
 # Puget Sound Zip Codes
-PUGET_SOUND_ZIP_CODES = {
+PUGET_SOUND_ZIP_CODES = frozenset({
     98001, 98002, 98003, 98004, 98005, 98006, 98007, 98008, 98010, 98011, 98014, 98019, 98022, 98023, 98024, 98027, 98028, 98029, 98030, 98031, 98032, 98033, 98034, 98038, 98039, 98040, 98042, 98045, 98047, 98052, 98053, 98055, 98056, 98057, 98058, 98059, 98070, 98072, 98074, 98075, 98077, 98092, 98101, 98102, 98103, 98104, 98105, 98106, 98107, 98108, 98109, 98110, 98111, 98112, 98115, 98116, 98117, 98118, 98119, 98121, 98122, 98125, 98126, 98133, 98134, 98136, 98144, 98146, 98148, 98154, 98155, 98158, 98164, 98166, 98168, 98174, 98177, 98178, 98188, 98195, 98198, 98199,
     98303, 98304, 98321, 98323, 98327, 98328, 98329, 98330, 98332, 98333, 98335, 98338, 98344, 98349, 98351, 98352, 98354, 98360, 98371, 98372, 98373, 98374, 98375, 98385, 98387, 98388, 98402, 98403, 98404, 98405, 98406, 98407, 98408, 98409, 98418, 98421, 98422, 98424, 98433, 98439, 98443, 98444, 98445, 98446, 98447, 98465, 98466, 98467, 98498, 98499,
     98012, 98020, 98021, 98026, 98036, 98037, 98043, 98087, 98201, 98203, 98204, 98205, 98208, 98223, 98241, 98251, 98252, 98256, 98258, 98259, 98270, 98271, 98272, 98282, 98287, 98290, 98291, 98292, 98293, 98294, 98296,
@@ -94,7 +108,7 @@ PUGET_SOUND_ZIP_CODES = {
     98239, 98249, 98253, 98260, 98277, 98278,
     98524, 98528, 98546, 98548, 98555, 98584, 98588, 98592,
     98243, 98245, 98250, 98261, 98279, 98286
-}
+})
 
 
 # Query Generation Templates (in priority order)
@@ -157,58 +171,81 @@ EXCLUDED_DOMAIN_PATTERNS = {
     '*.co.uk',  # UK businesses
 }
 
+# Hashed lookup table and suffix tuple for is_valid_website_domain, built once at import
+_EXCLUDED_DOMAIN_SET = frozenset(EXCLUDED_DOMAINS)
+_EXCLUDED_TLD_SUFFIXES = ('.codes', '.org', '.gov')
+
+# URL path fragments that mark news articles, listings and data downloads
+_NEWS_PATH_PATTERNS = (
+    '/articles/', '/news/', '/story/', '/article/', '/business-licenses',
+    '/business-directory/', '/company-profiles', '/business-profiles',
+    '/property-details/', '/real-estate/', '/homes/', '/apartments/',
+    '/api/download/', '/api/items/', '/csv?', '/data/', '/datasets/',
+    '/business-licenses-may-9', '/business-licenses-june-', '/business-licenses-july-',
+    '/business-licenses-august-', '/business-licenses-september-', '/business-licenses-october-',
+    '/business-licenses-november-', '/business-licenses-december-'
+)
+
+# Government data API patterns, matched against the full URL
+_GOV_DATA_URL_PATTERNS = (
+    '/api/download/', '/api/items/', '/csv?', '/data/', '/datasets/',
+    'redirect=true', 'layers=', 'where=1=1', 'items/', 'download/v1/'
+)
+
+
+def _is_excluded_domain(domain: str) -> bool:
+    """Check a domain and each of its parent domains against EXCLUDED_DOMAINS"""
+    while True:
+        if domain in _EXCLUDED_DOMAIN_SET:
+            return True
+        _, dot, domain = domain.partition('.')
+        if not dot:
+            return False
+
+
+@lru_cache(maxsize=10000)
+def _is_excluded_host(domain: str) -> bool:
+    """Host-only exclusion checks, memoized since directory hosts recur across many contractors"""
+    # Check for excluded domains (exact match or subdomain)
+    if _is_excluded_domain(domain):
+        return True
+    
+    # Check for excluded domain patterns
+    if domain.endswith(_EXCLUDED_TLD_SUFFIXES):
+        return True
+    
+    # Check for member, chamber, or directory in domain name
+    return 'member' in domain or 'chamber' in domain or 'directory' in domain
+
+
+@lru_cache(maxsize=10000)
 def is_valid_website_domain(url: str) -> bool:
-    """Check if URL is a valid business website (not directory/social)"""
+    """Check if URL is a valid business website (not directory/social), memoized per URL"""
     if not url:
         return False
     
-    from urllib.parse import urlparse
     parsed_url = urlparse(url)
-    domain = parsed_url.netloc.lower()
+    # Match on the bare host: no port, credentials or trailing root dot (hostname is already lowercased)
+    domain = (parsed_url.hostname or '').rstrip('.')
     path = parsed_url.path.lower()
     
-    # Check for excluded domains (exact match or subdomain)
-    for excluded in EXCLUDED_DOMAINS:
-        if domain == excluded or domain.endswith('.' + excluded):
-            return False
-    
-    # Check for excluded domain patterns
-    if domain.endswith('.codes') or domain.endswith('.org') or domain.endswith('.gov'):
-        return False
-    
-    # Check for member, chamber, or directory in domain name
-    if 'member' in domain or 'chamber' in domain or 'directory' in domain:
+    # Check excluded domains, TLDs and directory-style host names
+    if _is_excluded_host(domain):
         return False
     
     # Check for news article patterns in URL path
-    news_patterns = [
-        '/articles/', '/news/', '/story/', '/article/', '/business-licenses',
-        '/business-directory/', '/company-profiles', '/business-profiles',
-        '/property-details/', '/real-estate/', '/homes/', '/apartments/',
-        '/api/download/', '/api/items/', '/csv?', '/data/', '/datasets/',
-        '/business-licenses-may-9', '/business-licenses-june-', '/business-licenses-july-',
-        '/business-licenses-august-', '/business-licenses-september-', '/business-licenses-october-',
-        '/business-licenses-november-', '/business-licenses-december-'
-    ]
-    
-    for pattern in news_patterns:
-        if pattern in path:
-            return False
+    if any(pattern in path for pattern in _NEWS_PATH_PATTERNS):
+        return False
     
     # Check for government data API patterns
-    gov_data_patterns = [
-        '/api/download/', '/api/items/', '/csv?', '/data/', '/datasets/',
-        'redirect=true', 'layers=', 'where=1=1', 'items/', 'download/v1/'
-    ]
-    
-    for pattern in gov_data_patterns:
-        if pattern in url.lower():
-            return False
+    url_lower = url.lower()
+    if any(pattern in url_lower for pattern in _GOV_DATA_URL_PATTERNS):
+        return False
     
     return True
 
 # Puget Sound Area Cities and Area Codes for Local Business Validation
-PUGET_SOUND_CITIES = {
+PUGET_SOUND_CITIES = frozenset({
     'seattle', 'bellevue', 'redmond', 'kirkland', 'sammamish', 'issaquah', 'snoqualmie',
     'north bend', 'fall city', 'carnation', 'duvall', 'monroe', 'snohomish',
     'arlington', 'stanwood', 'camano island', 'oak harbor', 'coupeville', 'langley',
@@ -226,15 +263,31 @@ PUGET_SOUND_CITIES = {
     'snohomish', 'arlington', 'stanwood', 'camano island', 'oak harbor', 'coupeville',
     'langley', 'freeland', 'clinton', 'mukilteo', 'edmonds', 'lynnwood', 'mill creek',
     'brier', 'mountlake terrace', 'shoreline', 'lake forest park', 'kenmore'
-}
+})
 
-PUGET_SOUND_AREA_CODES = {
+PUGET_SOUND_AREA_CODES = frozenset({
     '206',  # Seattle
     '253',  # Tacoma
     '360',  # Vancouver, Bellingham
     '425',  # Bellevue, Redmond
     '564'   # New Washington area code
-}
+})
+
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+
+# Website phrases that suggest a locally operating business
+_LOCAL_KEYWORDS = (
+    'family owned', 'community', 'neighborhood',
+    'serving', 'service area', 'coverage area', 'licensed in', 'licensed for',
+    'seattle', 'spokane', 'tacoma', 'vancouver', 'bellevue'
+)
+
+# Local phrases that contain a shorter local phrase; the longer ones are only
+# searched for once the shorter one has been found in the page
+_NESTED_LOCAL_KEYWORDS = (
+    ('local', ('locally owned',)),
+    ('wa', ('washington',)),
+)
 
 def is_local_business_validation(contractor_city: str, contractor_state: str, contractor_phone: str, website_content: str) -> Dict[str, Any]:
     """Comprehensive local business validation using city lists and area codes"""
@@ -258,7 +311,10 @@ def is_local_business_validation(contractor_city: str, contractor_state: str, co
     # 2. Area Code Validation
     if contractor_phone:
         # Extract area code from phone number
-        phone_digits = re.sub(r'[^\d]', '', contractor_phone)
+        phone_digits = _NON_DIGIT_RE.sub('', contractor_phone)
+        # Drop the North American country code so "+1 425 ..." yields 425, not 142
+        if len(phone_digits) == 11 and phone_digits[0] == '1':
+            phone_digits = phone_digits[1:]
         if len(phone_digits) >= 10:
             area_code = phone_digits[:3]
             validation_result['area_code_match'] = area_code in PUGET_SOUND_AREA_CODES
@@ -267,13 +323,12 @@ def is_local_business_validation(contractor_city: str, contractor_state: str, co
     
     # 3. Local Keywords in Website Content
     if website_content:
-        local_keywords = [
-            'local', 'locally owned', 'family owned', 'community', 'neighborhood',
-            'serving', 'service area', 'coverage area', 'licensed in', 'licensed for',
-            'washington', 'wa', 'seattle', 'spokane', 'tacoma', 'vancouver', 'bellevue'
-        ]
         content_lower = website_content.lower()
-        validation_result['local_keywords'] = sum(1 for keyword in local_keywords if keyword in content_lower)
+        local_keywords = sum(1 for keyword in _LOCAL_KEYWORDS if keyword in content_lower)
+        for keyword, longer_keywords in _NESTED_LOCAL_KEYWORDS:
+            if keyword in content_lower:
+                local_keywords += 1 + sum(1 for longer in longer_keywords if longer in content_lower)
+        validation_result['local_keywords'] = local_keywords
     
     # 4. Determine if local business
     validation_result['is_local'] = (
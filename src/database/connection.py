@@ -22,8 +22,14 @@ class DatabasePool:
     def __init__(self):
         self.pool: Optional[asyncpg.Pool] = None
     
-    async def initialize(self) -> None:
-        """Initialize the connection pool"""
+    async def initialize(self, min_size: Optional[int] = None, max_size: Optional[int] = None) -> None:
+        """Initialize the connection pool
+        
+        min_size/max_size default to DB_MIN_CONNECTIONS/DB_MAX_CONNECTIONS; callers that know
+        their concurrency pass larger values so connections are opened up front, not mid-run.
+        """
+        min_size = max(min_size or 0, config.DB_MIN_CONNECTIONS)
+        max_size = max(max_size or 0, config.DB_MAX_CONNECTIONS, min_size)
         try:
             self.pool = await asyncpg.create_pool(
                 host=config.DB_HOST,
@@ -31,11 +37,20 @@ class DatabasePool:
                 user=config.DB_USER,
                 password=config.DB_PASSWORD,
                 database=config.DB_NAME,
-                min_size=config.DB_MIN_CONNECTIONS,
-                max_size=config.DB_MAX_CONNECTIONS,
-                command_timeout=60
+                min_size=min_size,
+                max_size=max_size,
+                command_timeout=60,
+                # Each connection prepares a repeated query once and reuses it
+                statement_cache_size=config.DB_STATEMENT_CACHE_SIZE,
+                # Session settings sent once in each connection's startup packet; JIT only
+                # adds compile time to the short per-contractor queries
+                server_settings={
+                    'application_name': 'scrappy',
+                    'jit': 'off',
+                    'synchronous_commit': config.DB_SYNCHRONOUS_COMMIT
+                }
             )
-            logger.info(f"Database pool initialized with {config.DB_MIN_CONNECTIONS}-{config.DB_MAX_CONNECTIONS} connections")
+            logger.info(f"Database pool initialized with {min_size}-{max_size} connections")
             
             # Test the connection
             async with self.pool.acquire() as conn:
@@ -89,6 +104,11 @@ class DatabasePool:
                 records=records,
                 columns=columns
             )
+    
+    async def copy_from_query(self, query: str, *args, output: Any, format: str = 'csv') -> str:
+        """Stream a query's rows out with COPY, without building Records"""
+        async with self.pool.acquire() as conn:
+            return await conn.copy_from_query(query, *args, output=output, format=format, header=True)
 
 
 # Global database pool instance
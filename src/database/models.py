@@ -1,10 +1,10 @@
 """
 Data models for contractor enrichment system
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-import json
+from typing import Optional, List, Dict, Any, Mapping
+import orjson
 import sys
 import os
 
@@ -12,7 +12,7 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 
-@dataclass
+@dataclass(slots=True)
 class Contractor:
     """Contractor data model"""
     
@@ -108,25 +108,36 @@ class Contractor:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for database operations"""
         result = {}
-        for key, value in self.__dict__.items():
+        for key in _CONTRACTOR_FIELDS:
+            value = getattr(self, key)
             if value is None:
                 result[key] = None
             elif isinstance(value, datetime):
                 result[key] = value
             elif isinstance(value, (dict, list)):
-                result[key] = json.dumps(value) if value else None
+                result[key] = orjson.dumps(value).decode() if value else None
             else:
                 result[key] = value
         return result
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Contractor':
-        """Create instance from dictionary"""
-        instance = cls()
-        for key, value in data.items():
-            if hasattr(instance, key):
-                setattr(instance, key, value)
-        return instance
+    def from_dict(cls, data: Mapping[str, Any]) -> 'Contractor':
+        """Create instance from a dictionary or database record, ignoring non-model keys"""
+        return cls(**{key: value for key, value in data.items() if key in _CONTRACTOR_FIELD_SET})
+    
+    @classmethod
+    def from_record(cls, record: Mapping[str, Any]) -> 'Contractor':
+        """Create instance from a database record whose columns are all model fields
+        
+        Binds the record directly, without from_dict's per-key filtering; rows
+        from SELECT * may carry extra columns and should go through from_dict.
+        """
+        return cls(**record)
+
+
+# Field names of Contractor, in declaration order (slots instances have no __dict__)
+_CONTRACTOR_FIELDS = tuple(field.name for field in fields(Contractor))
+_CONTRACTOR_FIELD_SET = frozenset(_CONTRACTOR_FIELDS)
 
 
 @dataclass
@@ -10,6 +10,7 @@ from pathlib import Path
 
 from src.config import config
 from src.database.connection import db_pool
+from src.utils.event_loop import install_event_loop
 
 # Create logs directory if it doesn't exist
 logs_dir = Path("/app/logs")
@@ -56,9 +57,8 @@ class ContractorEnrichmentSystem:
         
         try:
             # Main processing loop would go here
-            # For now, just wait for shutdown
-            while self.running:
-                await asyncio.sleep(1)
+            # For now, just wait for shutdown (woken by shutdown() rather than polling)
+            await self.shutdown_event.wait()
                 
         except asyncio.CancelledError:
             logger.info("Processing cancelled")
@@ -110,4 +110,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_event_loop()
     sys.exit(asyncio.run(main()))
\ No newline at end of file
@@ -2,12 +2,27 @@
 Contractor processing service with improved website discovery
 """
 import asyncio
+import codecs
 import logging
+import logging.handlers
+import multiprocessing
+import os
 import aiohttp
-from typing import List, Optional, Dict, Any, Tuple
+import orjson
+from typing import List, Optional, Dict, Any, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-import json
+from functools import lru_cache
+import hashlib
+import html
 import re
+import sqlite3
+import threading
+import time
+import zlib
+from urllib.parse import quote, urlparse
 
 from ..database.connection import db_pool
 from ..database.models import Contractor
@@ -17,6 +32,581 @@ from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
+# Washington location indicators for search result geo-validation
+_WA_LOCATION_INDICATORS = frozenset({
+    'wa', 'washington', 'seattle', 'spokane', 'tacoma', 'bellevue', 'everett', 'kent',
+    'auburn', 'federal way', 'yakima', 'vancouver', 'olympia', 'bellingham', 'kennewick',
+    'puyallup', 'lynnwood', 'renton', 'spokane valley', 'bremerton', 'pasco', 'marysville',
+    'lakewood', 'redmond', 'sammamish', 'kirkland', 'bothell', 'mercer island', 'woodinville',
+    'edmonds', 'mount vernon', 'bainbridge island', 'gig harbor', 'port orchard', 'silverdale',
+    'poulsbo', 'kingston', 'port townsend', 'sequim', 'port angeles', 'forks', 'aberdeen',
+    'hoquiam', 'centralia', 'chehalis', 'lacey', 'tumwater', 'shelton', 'colbert', 'oroville',
+    'moxee', 'selah', 'naches', 'cle elum', 'ellensburg', 'connell', 'richland', 'kennewick',
+    'pasco', 'west richland', 'prosser', 'grandview', 'sunnyside', 'toppenish', 'granger',
+    'zillah', 'wapato', 'mabton', 'benton city', 'kiona', 'paterson', 'bickleton', 'klickitat',
+    'goldendale', 'white salmon', 'stevenson', 'carson', 'wishram', 'lyle', 'dallesport',
+    'husum', 'trout lake', 'glenwood', 'klickitat', 'centerville', 'appleton', 'bickleton',
+    'cle elum', 'ellensburg', 'kittitas', 'thorp', 'rosellyn', 'south cle elum', 'liberty',
+    'kittitas', 'vantage', 'george', 'quincy', 'moses lake', 'soap lake', 'ephrata', 'mattawa',
+    'royal city', 'warden', 'odessa', 'wilbur', 'almira', 'creston', 'davenport', 'reardan',
+    'medical lake', 'airway heights', 'deer park', 'newport', 'colville', 'chewelah', 'kettle falls',
+    'republic', 'curlew', 'oriente', 'malo', 'danville', 'boyds', 'barstow', 'northport',
+    'laurier', 'orient', 'addy', 'valley', 'springdale', 'chelan', 'mansfield', 'pateros',
+    'brewer', 'methow', 'twisp', 'winthrop', 'mazama', 'carlton', 'tonasket', 'omak', 'orondo',
+    'rock island', 'malaga', 'walla walla', 'college place', 'dayton', 'waitsburg', 'prescott',
+    'burbank', 'lowden', 'touchet', 'dixie', 'staples', 'huntsville', 'milton-freewater',
+    'clarkston', 'asotin', 'anatone', 'cloverland', 'weston', 'anatom', 'lewiston', 'clarkston',
+    'pullman', 'moscow', 'colfax', 'palouse', 'garfield', 'albion', 'uniontown', 'farmington',
+    'endicott', 'st john', 'lamont', 'oakesdale', 'tekoa', 'rosalia', 'malden', 'thornton',
+    'steptoe', 'hay', 'benge', 'washtucna', 'lind', 'ritzville', 'davenport', 'creston', 'wilbur',
+    'odessa', 'almira', 'reardan', 'medical lake', 'airway heights', 'deer park', 'newport',
+    'colville', 'chewelah', 'kettle falls', 'republic', 'curlew', 'oriente', 'malo', 'danville',
+    'boyds', 'barstow', 'northport', 'laurier', 'orient', 'addy', 'valley', 'springdale',
+    'chelan', 'mansfield', 'pateros', 'brewer', 'methow', 'twisp', 'winthrop', 'mazama',
+    'carlton', 'tonasket', 'omak', 'orondo', 'rock island', 'malaga', 'walla walla',
+    'college place', 'dayton', 'waitsburg', 'prescott', 'burbank', 'lowden', 'touchet',
+    'dixie', 'staples', 'huntsville', 'milton-freewater', 'clarkston', 'asotin', 'anatone',
+    'cloverland', 'weston', 'anatom', 'lewiston', 'clarkston', 'pullman', 'moscow', 'colfax',
+    'palouse', 'garfield', 'albion', 'uniontown', 'farmington', 'endicott', 'st john',
+    'lamont', 'oakesdale', 'tekoa', 'rosalia', 'malden', 'thornton', 'steptoe', 'hay',
+    'benge', 'washtucna', 'lind', 'ritzville'
+})
+# Only presence matters, so indicators containing a shorter one ('washington' contains 'wa')
+# are implied by it and dropped; plain 'in' checks beat a regex alternation on short strings
+_WA_LOCATION_NEEDLES = tuple(sorted(
+    indicator for indicator in _WA_LOCATION_INDICATORS
+    if not any(other != indicator and other in indicator for other in _WA_LOCATION_INDICATORS)
+))
+
+# Puget Sound region indicators (counties, cities, regions) used for address matching
+_PUGET_SOUND_INDICATORS = (
+    'KING COUNTY', 'PIERCE COUNTY', 'SNOHOMISH COUNTY', 'KITSAP COUNTY',
+    'SEATTLE', 'TACOMA', 'BELLEVUE', 'EVERETT', 'KENT', 'RENTON',
+    'FEDERAL WAY', 'KIRKLAND', 'BELLINGHAM', 'KENNEWICK', 'AUBURN',
+    'MARYSVILLE', 'LAKEWOOD', 'REDMOND', 'SHORELINE', 'RICHLAND', 'OLYMPIA',
+    'LACEY', 'EDMONDS', 'BURIEN', 'BOTHELL', 'LYNNWOOD', 'LONGVIEW',
+    'WENATCHEE', 'MOUNT VERNON', 'CENTRALIA', 'ANACORTES', 'UNIVERSITY PLACE',
+    'MUKILTEO', 'TUKWILA', 'BREMERTON', 'CHEHALIS', 'PORT ORCHARD',
+    'MAPLE VALLEY', 'OAK HARBOR', 'FERNDALE', 'MOUNTLAKE TERRACE',
+    'PUGET SOUND', 'GREATER SEATTLE', 'SEATTLE AREA', 'TACOMA AREA',
+    'SERVING SEATTLE', 'SERVING TACOMA', 'SERVING BELLEVUE',
+    'PACIFIC NORTHWEST', 'PNW', 'NORTHWESTERN', 'WA LICENSE'
+)
+# Lowercased for plain substring checks against lowercased page text (a case-insensitive regex
+# alternation is ~20x slower on large pages); entries containing a shorter indicator, such as
+# 'SEATTLE AREA', are implied by it and dropped
+_PUGET_SOUND_INDICATORS_LOWER = tuple(
+    indicator for indicator in map(str.lower, _PUGET_SOUND_INDICATORS)
+    if not any(other != indicator and other in indicator for other in map(str.lower, _PUGET_SOUND_INDICATORS))
+)
+
+# Business designations stripped by _generate_simple_business_name (first match only)
+_BUSINESS_DESIGNATIONS = (
+    ' INC', ' LLC', ' CORP', ' CORPORATION', ' CO', ' COMPANY',
+    ' LP', ' LLP', ' LPA', ' PA', ' PLLC', ' PC',
+    ' LTD', ' LIMITED', ' GROUP', ' ENTERPRISES', ' ENTERPRISE',
+    ' SERVICES', ' SERVICE', ' BUILDING'
+)
+
+# Common abbreviation mappings tried when a search result doesn't match the name directly
+_ABBREVIATION_VARIATIONS = (
+    ('& a/c', '& air conditioning'),
+    ('& ac', '& air conditioning'),
+    ('a/c', 'air conditioning'),
+    ('ac', 'air conditioning'),
+    ('heating & a/c', 'heating & air conditioning'),
+    ('heating & ac', 'heating & air conditioning'),
+    ('heating and a/c', 'heating and air conditioning'),
+    ('heating and ac', 'heating and air conditioning')
+)
+
+# Search-result title/snippet words that mark directory and association listings
+_DIRECTORY_INDICATORS = (
+    'association', 'directory', 'listing', 'find', 'search', 'pros', 'contractors', 'bizprofile',
+    'bizapedia', 'yellowpages', 'whitepages', 'superpages', 'manta', 'zoominfo'
+)
+_DIRECTORY_INDICATOR_RE = re.compile('|'.join(map(re.escape, _DIRECTORY_INDICATORS)))
+
+# Search-result title/snippet words that earn a small contractor bonus
+_CONTRACTOR_KEYWORDS = (
+    'contractor', 'construction', 'plumbing', 'electrical', 'hvac', 'roofing', 'insulation', 'mold', 'attic'
+)
+_CONTRACTOR_KEYWORD_RE = re.compile('|'.join(map(re.escape, _CONTRACTOR_KEYWORDS)))
+
+# Navigation links containing any of these are skipped (admin, auth, feeds, non-HTTP schemes)
+_NAV_EXCLUDE_PATTERNS = (
+    '/admin', '/login', '/cart', '/checkout', '/search',
+    '/privacy', '/terms', '/sitemap', '/feed', '/rss',
+    '/wp-admin', '/wp-login', '/cgi-bin', '/api',
+    'mailto:', 'tel:', 'javascript:', '#'
+)
+_NAV_EXCLUDE_RE = re.compile('|'.join(map(re.escape, _NAV_EXCLUDE_PATTERNS)))
+
+# Navigation links whose URL or text contain these are content-rich pages worth crawling
+_NAV_CONTENT_KEYWORDS = ('service', 'offering', 'about', 'contact', 'capabilities', 'capability', 'location')
+_NAV_CONTENT_KEYWORD_RE = re.compile('|'.join(map(re.escape, _NAV_CONTENT_KEYWORDS)))
+
+# CSS selectors tried in order when extracting navigation links
+_NAV_SELECTORS = (
+    # Standard navigation
+    'nav a', 'header a', '.nav a', '.navigation a', 
+    '.menu a', '.navbar a', '#nav a', '#navigation a',
+    # Modern frameworks
+    '.navbar-nav a', '.nav-menu a', '.main-menu a', '.primary-menu a',
+    '.site-nav a', '.main-nav a', '.top-nav a', '.header-nav a',
+    # Common class patterns
+    '[class*="nav"] a', '[class*="menu"] a', '[class*="header"] a',
+    # Specific modern patterns
+    '.navbar-nav .nav-link', '.nav-menu .menu-item a', '.main-menu .menu-item a',
+    # Generic link extraction (fallback)
+    'a[href]'
+)
+
+# Fallback analysis: residential-focus keywords (each hit adds 0.1)
+_RESIDENTIAL_KEYWORDS = (
+    'residential', 'home', 'house', 'family', 'residential services',
+    'home improvement', 'home repair', 'home maintenance', 'homeowner',
+    'residential contractor', 'home contractor', 'residential services'
+)
+
+# Fallback analysis: contractor-service keywords (each hit adds 0.05)
+_CONTRACTOR_SERVICE_KEYWORDS = (
+    'plumbing', 'electrical', 'hvac', 'heating', 'cooling', 'roofing',
+    'painting', 'carpentry', 'landscaping', 'concrete', 'foundation',
+    'remodeling', 'renovation', 'repair', 'installation', 'maintenance',
+    'construction', 'contractor', 'contracting', 'home services'
+)
+
+# Fallback analysis: business-legitimacy keywords (each hit adds 0.05)
+_LEGITIMACY_KEYWORDS = (
+    'licensed', 'insured', 'bonded', 'certified', 'professional',
+    'experience', 'years', 'established', 'trusted', 'reliable',
+    'quality', 'warranty', 'guarantee', 'satisfaction', 'customer'
+)
+
+# Contractor keywords counted by the website validation
+_VALIDATION_CONTRACTOR_KEYWORDS = (
+    'plumbing', 'electrical', 'hvac', 'heating', 'cooling', 'air conditioning',
+    'roofing', 'construction', 'remodeling', 'renovation', 'contractor',
+    'painting', 'flooring', 'landscaping', 'handyman', 'maintenance',
+    'repair', 'installation', 'service', 'professional', 'licensed'
+)
+
+# Business-name words too generic to identify a business
+_GENERIC_NAME_WORDS = frozenset({'LLC', 'INC', 'CORP', 'CO', 'COMPANY', 'SERVICES', 'SERVICE'})
+
+# Keyword fallback for the mailer category, checked in order
+_CATEGORY_KEYWORDS = (
+    ('Electrical Contractor', ('electrical', 'electrician', 'wiring', 'electrical contractor')),
+    ('Plumbing Contractor', ('plumbing', 'plumber', 'pipe', 'drain', 'sewer')),
+    ('HVAC Contractor', ('hvac', 'heating', 'cooling', 'air conditioning', 'furnace', 'ac')),
+    ('Roofing Contractor', ('roofing', 'roof', 'shingle', 'gutter')),
+    ('General Contractor', ('construction', 'remodeling', 'renovation', 'general contractor')),
+)
+
+# Shared by the single and batched contractor result writes
+_UPDATE_CONTRACTOR_QUERY = """
+UPDATE contractors 
+SET 
+    processing_status = $1,
+    confidence_score = $2,
+    website_confidence = $3,
+    classification_confidence = $4,
+    mailer_category = $5,
+    website_url = $6,
+    website_status = $7,
+    data_sources = $8,
+    last_processed = $9,
+    error_message = $10,
+    review_status = $11,
+    residential_focus = $12,
+    business_description = $13,
+    gpt4mini_analysis = $14,
+    gpt4_verification = $15,
+    website_content_hash = $16,
+    processing_attempts = $17,
+    updated_at = NOW()
+WHERE id = $18
+"""
+
+# Upper bound on remembered Clearbit lookups per service instance
+_CLEARBIT_CACHE_SIZE = 10000
+
+# Upper bound on remembered AI analysis responses per service instance
+_AI_ANALYSIS_CACHE_SIZE = 2000
+
+# Crawled sites kept per service, and how long (seconds) a crawl stays fresh enough to reuse
+_CRAWL_CACHE_SIZE = 256
+_CRAWL_CACHE_TTL = 900
+
+# Recent page validations kept per service; only in-flight contractors revisit a page
+_VALIDATION_CACHE_SIZE = 64
+
+# Page text extraction and name/number normalisation patterns, compiled once at import
+_SCRIPT_TAG_RE = re.compile(r'<script[^>]*>.*?</script>', re.DOTALL)
+_STYLE_TAG_RE = re.compile(r'<style[^>]*>.*?</style>', re.DOTALL)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_WORD_TOKEN_RE = re.compile(r'\w+')
+_NON_WORD_RE = re.compile(r'[^\w]')
+# Every non-digit byte, for bytes.translate deletion
+_NON_DIGIT_BYTES = bytes(b for b in range(256) if not 0x30 <= b <= 0x39)
+_ADDRESS_NOISE_RE = re.compile(r'[^\w\s,.]')
+# <meta charset="..."> / <meta http-equiv="Content-Type" content="...; charset=..."> near the top of a page
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+# Bytes searched for a meta charset; browsers prescan the first 1024, but many pages declare it later
+_META_CHARSET_SCAN_BYTES = 4096
+
+
+@lru_cache(maxsize=4096)
+def _simple_business_name(business_name: str) -> str:
+    """Business name with its first designation (INC, LLC, ...) removed, memoized per name"""
+    upper_name = business_name.upper()
+    
+    # Remove the first designation found
+    for designation in _BUSINESS_DESIGNATIONS:
+        if designation in upper_name:
+            return upper_name.replace(designation, '').strip()
+    
+    return business_name
+
+
+@lru_cache(maxsize=4096)
+def _search_name_forms(business_name: str) -> Tuple[str, str, Tuple[str, ...], Tuple[str, ...],
+                                                   Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str], ...]]:
+    """Lowercased name forms _calculate_search_confidence tests against every search result
+    
+    Returns (name, simple name, fuzzy variations, name words, adjacent word pairs,
+    abbreviation variations). They depend only on the business name, so they are built once
+    per contractor rather than once per candidate. Variations equal to the name or simple name
+    are left out: by the time they are tried, those have already failed to match.
+    """
+    business_name_lower = business_name.lower()
+    simple_name = _simple_business_name(business_name).lower()
+    tried = {business_name_lower, simple_name}
+    
+    fuzzy_variations = []
+    for variation in (business_name_lower.replace('plus', '+'),
+                      business_name_lower.replace(' ', ''),
+                      simple_name.replace(' ', '')):
+        if variation not in tried:
+            fuzzy_variations.append(variation)
+    
+    # Tuples throughout: the result is cached and shared by every caller
+    business_words = tuple(business_name_lower.split())
+    business_pairs = tuple(zip(business_words, business_words[1:]))
+    
+    abbreviation_variations = tuple(
+        (variation, simple_variation)
+        for variation, simple_variation in (
+            (business_name_lower.replace(abbrev, full), simple_name.replace(abbrev, full))
+            for abbrev, full in _ABBREVIATION_VARIATIONS
+        )
+        if variation not in tried or simple_variation not in tried
+    )
+    
+    return (business_name_lower, simple_name, tuple(fuzzy_variations), business_words,
+            business_pairs, abbreviation_variations)
+
+
+@lru_cache(maxsize=4096)
+def _significant_name_words(business_name: str) -> Tuple[str, ...]:
+    """Lowercased business name words worth looking for in a domain (no suffixes or short words)"""
+    clean_name = _PUNCTUATION_RE.sub('', business_name).strip()
+    return tuple(
+        word.lower() for word in clean_name.split()
+        if len(word) > 2 and word.upper() not in _GENERIC_NAME_WORDS
+    )
+
+
+def _url_domain(url_lower: str) -> str:
+    """Host part of an already-lowercased result URL (scheme stripped, path dropped)"""
+    return url_lower.replace('https://', '').replace('http://', '').split('/')[0]
+
+
+@dataclass(slots=True)
+class NormalizedSearchItem:
+    """A Google search result with the lowercased forms every check uses, built once per result"""
+    link: str
+    title: str
+    snippet: str
+    link_lower: str
+    title_lower: str
+    snippet_lower: str
+    domain: str
+    
+    @classmethod
+    def from_raw(cls, search_item: Dict[str, Any]) -> 'NormalizedSearchItem':
+        link = search_item.get('link', '')
+        title = search_item.get('title', '')
+        snippet = search_item.get('snippet', '')
+        link_lower = link.lower()
+        return cls(link, title, snippet, link_lower, title.lower(), snippet.lower(), _url_domain(link_lower))
+
+
+@lru_cache(maxsize=4096)
+def _has_wa_location_lower(domain: str, title_lower: str, snippet_lower: str) -> bool:
+    """Washington indicator check on lowercased result parts, memoized since results recur across queries"""
+    # Check domain for location indicators
+    if any(indicator in domain for indicator in _WA_LOCATION_NEEDLES):
+        return True
+    
+    # Check title and snippet for location indicators
+    content = f"{title_lower} {snippet_lower}"
+    return any(indicator in content for indicator in _WA_LOCATION_NEEDLES)
+
+
+def _digits_only(text: str) -> str:
+    """Strip everything but ASCII digits with one C-level bytes.translate pass"""
+    return text.encode('ascii', 'ignore').translate(None, _NON_DIGIT_BYTES).decode('ascii')
+
+
+def _content_tokens(content_lower: str) -> set:
+    """Distinct \\w+ tokens of lowercased page text, for O(1) whole-word lookups"""
+    return set(_WORD_TOKEN_RE.findall(content_lower))
+
+
+def _any_name_word_in(words: List[str], content_lower: str, content_tokens: Optional[set]) -> bool:
+    """Whole-word check for punctuation-free name words, using the page's token set when the caller has one"""
+    if content_tokens is None:
+        return _any_whole_word_in(words, content_lower)
+    return any(len(word) > 2 and word in content_tokens for word in words)
+
+
+def _any_whole_word_in(words: List[str], content: str) -> bool:
+    """Check if any word longer than 2 characters appears as a whole word, in a single regex pass"""
+    words = [word for word in words if len(word) > 2]
+    if not words:
+        return False
+    pattern = r'\b(?:' + '|'.join(re.escape(word) for word in words) + r')\b'
+    return re.search(pattern, content) is not None
+
+
+def _detect_page_charset(body: bytes) -> str:
+    """Encoding for a page whose Content-Type declares no usable charset
+    
+    Uses the page's own meta charset when present, then UTF-8 if the bytes are valid UTF-8,
+    and otherwise windows-1252, the encoding browsers assume for unlabelled legacy pages.
+    """
+    match = _META_CHARSET_RE.search(body, 0, _META_CHARSET_SCAN_BYTES)
+    if match:
+        try:
+            encoding = codecs.lookup(match.group(1).decode('ascii')).name
+        except (LookupError, UnicodeDecodeError):
+            pass
+        else:
+            # A page that reached us as bytes can't really be UTF-16; browsers read that label as UTF-8
+            return 'utf-8' if encoding.startswith('utf-16') else encoding
+    try:
+        body.decode('utf-8')
+    except UnicodeDecodeError:
+        return 'cp1252'
+    return 'utf-8'
+
+
+def _html_to_text(content: str) -> str:
+    """Strip scripts, styles and tags from raw HTML and collapse whitespace"""
+    content = _SCRIPT_TAG_RE.sub('', content)
+    content = _STYLE_TAG_RE.sub('', content)
+    content = _HTML_TAG_RE.sub('', content)
+    content = html.unescape(content)
+    return _WHITESPACE_RE.sub(' ', content).strip()
+
+# Categories offered to the AI when the categories table can't be read
+_FALLBACK_CATEGORIES = (
+    "Plumbing", "Electrical", "HVAC", "Roofing", "General Contractor",
+    "Heating and Cooling", "Flooring", "Pools and Spas", "Security Systems",
+    "Window/Door", "Bathroom/Kitchen Remodel", "Storage & Closets",
+    "Decks & Patios", "Fence", "Fireplace", "Sprinklers", "Blinds",
+    "Awning/Patio/Carport", "Media Systems", "Exterior Solutions"
+)
+_FALLBACK_PRIORITY_CATEGORIES = (
+    "Heating and Cooling", "Plumbing", "Electrical", "HVAC"
+)
+
+# Static instructions for the content-analysis model. Sent as the system message so the
+# identical prefix is shared (and prompt-cached) across every contractor request.
+_CONTENT_ANALYSIS_INSTRUCTIONS = """\
+Please provide a JSON response with:
+1. "category" - Specific contractor category from the Available Categories list in the request
+2. "confidence" - Confidence score 0-1 based on content analysis AND validation results
+3. "residential_focus" - true if primarily serves homeowners, false if commercial, null if unclear
+4. "services_offered" - Array of main services mentioned
+5. "business_legitimacy" - true if appears to be a legitimate business
+6. "reasoning" - Brief explanation of categorization decision
+
+IMPORTANT: Before setting confidence, carefully examine the website content for business names. If you find a business name that is different from the searched business name, this indicates a mismatch and should result in very low confidence.
+
+CONFIDENCE SCORING RULES:
+- Start with base confidence of 0.5
+- ADD +0.1 for each validation factor that matches (business name, license, phone, address, principal)
+- ADD +0.05 for domain match score (each business name word in domain)
+- ADD +0.1 for strong contractor keywords in content
+- SUBTRACT -0.3 if business name doesn't match at all
+- SUBTRACT -0.2 if no contractor keywords found
+- SUBTRACT -0.2 if website appears to be wrong business type
+- CRITICAL: If the website clearly belongs to a DIFFERENT business than the one being searched for, SUBTRACT -0.8 (very low confidence)
+- CRITICAL: If the website mentions a different business name prominently (like "Runland Painting" when searching for "A TEAM PAINTING"), SUBTRACT -0.6
+- CRITICAL: If the website content describes services but doesn't match the business name being searched, SUBTRACT -0.4
+- FINAL confidence should be between 0.0 and 1.0
+
+CRITICAL CATEGORIZATION RULES:
+- ALWAYS choose the MOST SPECIFIC category that matches the actual services
+- AVOID generic categories like "General Contractor" or "HVAC Contractor" unless no specific category fits
+- FIRST check the business name for obvious category indicators (these are examples, not exhaustive):
+  * Business name contains "ROOFING" → Roofing
+  * Business name contains "PLUMBING" → Plumbing  
+  * Business name contains "ELECTRIC" or "ELECTRICAL" → Electrician
+  * Business name contains "HVAC" or "HEATING" or "COOLING" → Heating and Cooling
+  * Business name contains "LANDSCAPING" or "LANDSCAPE" → Landscaping
+  * Business name contains "TREE" → Tree Service
+  * Business name contains "CONCRETE" → Concrete
+  * Business name contains "PAINTING" → Painting
+  * Business name contains "FLOORING" → Flooring
+  * Business name contains "HANDYMAN" → Handyman
+
+- THEN look for these specific service keywords in the content (these are examples, not exhaustive):
+  * "roofing", "shingles", "roof", "roofer" → Roofing
+  * "plumbing", "pipe", "drain", "water heater", "plumber" → Plumbing  
+  * "electrical", "wiring", "outlet", "panel", "electrician" → Electrician
+  * "hvac", "heating", "cooling", "furnace", "ac", "air conditioning" → Heating and Cooling
+  * "flooring", "carpet", "hardwood", "tile", "floor" → Flooring
+  * "painting", "paint", "interior", "exterior" → Painting
+  * "landscaping", "lawn", "garden", "irrigation", "landscape" → Landscaping
+  * "concrete", "driveway", "patio", "foundation", "cement" → Concrete
+  * "window", "door", "glass" → Window/Door
+  * "kitchen", "bathroom", "remodel" → Bathroom/Kitchen Remodel
+  * "deck", "patio", "outdoor" → Decks & Patios
+  * "fence", "fencing" → Fence
+  * "fireplace", "chimney" → Fireplace
+  * "sprinkler", "irrigation" → Sprinklers
+  * "blind", "shade", "window treatment" → Blinds
+  * "awning", "patio cover", "carport" → Awning/Patio/Carport
+  * "storage", "closet", "shelving" → Storage & Closets
+  * "pool", "spa", "hot tub" → Pools and Spas
+  * "security", "alarm", "camera" → Security Systems
+  * "media", "audio", "video", "home theater" → Media Systems
+  * "tree", "tree service", "arborist" → Tree Service
+  * "handyman", "handy man" → Handyman
+
+- Base category on actual services mentioned, NOT business name
+- If multiple specific services are mentioned, choose the most prominent one
+- Only use "General Contractor" if no specific category applies
+- NEVER default to "HVAC Contractor" unless heating/cooling is the primary service
+- Provide very low confidence for directory sites, software platforms, or non-contractor website (0.0 score)
+- Look for residential keywords: "homeowners", "residential", "home services", "family"
+- Look for commercial keywords: "commercial", "business", "industrial", "corporate"
+- CRITICAL: If the website content does not match the business name or services, provide LOW confidence (under 0.2)
+- CRITICAL: If the website appears to be a hotel, restaurant, retail store, or other non-contractor business, provide LOW confidence
+- CRITICAL: Only provide high confidence if the website content clearly describes contractor services and has some sort of business name that matches
+- CRITICAL: Consider the validation results when setting confidence - more validation factors matched = higher confidence
+- CRITICAL: DETECT BUSINESS NAME MISMATCHES - If the website prominently mentions a different business name (like "Runland Painting" when searching for "A TEAM PAINTING"), this is a MAJOR RED FLAG and should result in very low confidence (0.1 or less)
+- CRITICAL: Look for business names in the website content that are different from the searched business name
+- CRITICAL: If the website belongs to a different business entirely, confidence should be 0.0-0.2
+
+Respond with valid JSON only.
+"""
+
+
+# Module-level (rather than a method) so it can be pickled into the parser process pool
+def _extract_navigation_links_from_html(base_url: str, html_content: str) -> List[str]:
+    """Extract navigation links from HTML content with improved selectors"""
+    try:
+        from bs4 import BeautifulSoup, FeatureNotFound
+        import urllib.parse
+        import re
+        
+        # Prefer the C-backed lxml parser; fall back to the pure-Python one if it isn't installed
+        try:
+            soup = BeautifulSoup(html_content, 'lxml')
+        except FeatureNotFound:
+            soup = BeautifulSoup(html_content, 'html.parser')
+        links = []
+        # Deduplicated in first-seen order as we go, so the scan can stop at the 10 links we return
+        seen = set()
+        unique_links = []
+        base_netloc = urllib.parse.urlparse(base_url).netloc
+        
+        # Comprehensive navigation selectors for modern websites
+        for selector in _NAV_SELECTORS:
+            try:
+                elements = soup.select(selector)
+                for element in elements:
+                    href = element.get('href')
+                    if href and href.strip():
+                        # Convert relative URLs to absolute
+                        absolute_url = urllib.parse.urljoin(base_url, href)
+                        
+                        # Only include links to the same domain
+                        if urllib.parse.urlparse(absolute_url).netloc == base_netloc:
+                            url_lower = absolute_url.lower()
+                            
+                            # Filter out common non-content pages and patterns
+                            if not _NAV_EXCLUDE_RE.search(url_lower):
+                                # Check if URL path or link text contains content keywords
+                                link_text = element.get_text(strip=True).lower()
+                                has_content_keyword = bool(
+                                    _NAV_CONTENT_KEYWORD_RE.search(url_lower) or _NAV_CONTENT_KEYWORD_RE.search(link_text)
+                                )
+                                
+                                if has_content_keyword or len(links) < 2:  # Limit non-content pages to 2
+                                    links.append(absolute_url)
+                                    if absolute_url not in seen:
+                                        seen.add(absolute_url)
+                                        unique_links.append(absolute_url)
+                                        if len(unique_links) >= 10:
+                                            break
+                                    
+            except Exception as selector_error:
+                logger.debug("Selector '%s' failed: %s", selector, selector_error)
+                continue
+            
+            # Later selectors can only add links past the ones we keep
+            if len(unique_links) >= 10:
+                break
+        
+        # Log what we found
+        logger.info("Extracted %d navigation links from %s", len(unique_links), base_url)
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, link in enumerate(unique_links[:5]):  # Log first 5
+                logger.debug("  Link %d: %s", i + 1, link)
+        
+        return unique_links[:10]  # Limit to 10 links
+        
+    except Exception as e:
+        logger.warning(f"Failed to extract navigation links from {base_url}: {e}")
+        return []
+
+
+def _parse_main_page(base_url: str, raw_html: str) -> Tuple[List[str], str]:
+    """Navigation links and visible text of a site's main page, in one parser-pool call"""
+    return _extract_navigation_links_from_html(base_url, raw_html), _html_to_text(raw_html)
+
+
+def _init_parser_worker(log_queue, log_level: str):
+    """Parser pool initializer: send the worker's log records back to the parent process
+    
+    Spawned workers start with no logging configured, so without this every message
+    logged by the functions run in the pool would be dropped.
+    """
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(log_level)
+
+
+class _ParentLogHandler(logging.Handler):
+    """Replays records forwarded by parser workers through the same-named logger in this process"""
+    
+    def emit(self, record: logging.LogRecord):
+        record_logger = logging.getLogger(record.name)
+        if record_logger.isEnabledFor(record.levelno):
+            record_logger.handle(record)
+
+
+# Seconds between wall-clock checks for the daily quota reset
+_QUOTA_DAY_CHECK_INTERVAL = 60.0
+
 # Global quota tracking
 class QuotaTracker:
     def __init__(self):
@@ -26,9 +616,17 @@ class QuotaTracker:
         self.daily_quota_limit = 10000  # Google API daily limit
         self.queries_today = 0
         self.last_reset_date = datetime.now().date()
+        # Monotonic time after which the wall-clock date is next read
+        self._next_day_check = time.monotonic() + _QUOTA_DAY_CHECK_INTERVAL
     
     def reset_if_new_day(self):
         """Reset daily counters if it's a new day"""
+        # Called on every search; the date can only roll over rarely, so read the clock at most once a minute
+        now = time.monotonic()
+        if now < self._next_day_check:
+            return
+        self._next_day_check = now + _QUOTA_DAY_CHECK_INTERVAL
+        
         today = datetime.now().date()
         if today != self.last_reset_date:
             self.queries_today = 0
@@ -76,6 +674,47 @@ class QuotaTracker:
 # Global quota tracker instance
 quota_tracker = QuotaTracker()
 
+
+class SearchResponseCache:
+    """On-disk cache of Google Custom Search responses, keyed by search type and normalized query
+    
+    Lets repeated runs against the same contractors (test and debug scripts especially)
+    replay earlier responses instead of spending daily quota on them again.
+    """
+    
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # get() and put() run in worker threads (asyncio.to_thread) so disk I/O stays off the event loop
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._write_lock = threading.Lock()
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, body BLOB NOT NULL, '
+            'cached_at REAL NOT NULL)'
+        )
+    
+    @staticmethod
+    def key(query: str, search_type: str) -> str:
+        normalized = f"{search_type}\n{' '.join(query.lower().split())}"
+        return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute('SELECT body FROM responses WHERE key = ?', (key,)).fetchone()
+        return orjson.loads(zlib.decompress(row[0])) if row else None
+    
+    def put(self, key: str, data: Dict[str, Any]):
+        body = zlib.compress(orjson.dumps(data))
+        with self._write_lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses (key, body, cached_at) VALUES (?, ?, ?)',
+                (key, body, time.time())
+            )
+            self._conn.commit()
+    
+    def close(self):
+        self._conn.close()
+
 class QuotaExceededError(Exception):
     """Raised when daily Google API quota is exceeded"""
     pass
@@ -86,13 +725,66 @@ class ContractorService:
     def __init__(self):
         self.batch_size = config.BATCH_SIZE
         self.session = None
-        self.openai_client = AsyncOpenAI(api_key=config.OPENAI_API_KEY)
-        
+        self.openai_client = AsyncOpenAI(
+            api_key=config.OPENAI_API_KEY,
+            timeout=config.OPENAI_TIMEOUT,
+            max_retries=config.RETRY_ATTEMPTS
+        )
+        self.ai_semaphore = asyncio.Semaphore(config.MAX_CONCURRENT_LLM_CALLS)
+        # Monotonic time of the next free LLM call slot, spaced LLM_DELAY apart across all tasks
+        self._next_llm_slot = 0.0
+        # Each pipeline stage (search, crawl, AI) has its own cap, so contractors waiting on one
+        # stage don't hold back contractors that are ready for another
+        self.search_semaphore = asyncio.Semaphore(config.MAX_CONCURRENT_SEARCHES)
+        self.crawl_semaphore = asyncio.Semaphore(config.MAX_CONCURRENT_CRAWLS)
+        # Clearbit answers (including "no match") by query, so repeated names skip the API
+        self._clearbit_cache: OrderedDict[str, Optional[str]] = OrderedDict()
+        # Raw AI analysis JSON by prompt hash; only responses that parsed are kept
+        self._ai_analysis_cache: OrderedDict[str, str] = OrderedDict()
+        # Recent successful crawls by URL: (monotonic crawl time, crawl result)
+        self._crawl_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        # Recent validation results by (contractor id, URL, page content)
+        self._validation_cache: OrderedDict[Tuple[Any, Optional[str], str], Dict[str, Any]] = OrderedDict()
+        # Categories from the keyword fallback analysis by contractor id, until process_contractor
+        # uses them; kept off the contractor so they aren't written to data_sources
+        self._fallback_categories: Dict[Any, str] = {}
+        # Comma-joined (categories, priority categories) for the AI prompt, loaded on first use
+        self._prompt_categories: Optional[Tuple[str, str]] = None
+        self._parser_pool: Optional[ProcessPoolExecutor] = None
+        # Forwards parser worker log records to this process's handlers while the pool is up
+        self._parser_log_listener: Optional[logging.handlers.QueueListener] = None
+        # Google responses persisted across runs (GOOGLE_SEARCH_CACHE / GOOGLE_SEARCH_CACHE_REPLAY)
+        self._search_cache: Optional[SearchResponseCache] = None
+        if config.GOOGLE_SEARCH_CACHE or config.GOOGLE_SEARCH_CACHE_REPLAY:
+            self._search_cache = SearchResponseCache(config.GOOGLE_SEARCH_CACHE_PATH)
+        
+    async def _wait_for_llm_slot(self):
+        """Space LLM calls LLM_DELAY apart across all concurrent contractors"""
+        now = time.monotonic()
+        slot = max(now, self._next_llm_slot)
+        # Reserve the slot before sleeping so concurrent callers queue up behind it
+        self._next_llm_slot = slot + config.LLM_DELAY
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session"""
         if self.session is None or self.session.closed:
+            # Cap per-host connections so domain probes and page crawls can't stampede one site.
+            # Idle connections are kept past aiohttp's 15s default: a contractor's crawl and AI
+            # stages often outlast it, and the next Google/Clearbit call would pay a new TLS handshake
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=10,
+                ttl_dns_cache=600,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            )
             self.session = aiohttp.ClientSession(
+                connector=connector,
                 timeout=aiohttp.ClientTimeout(total=30),
+                # response.text() on pages without a declared charset detects it like the crawler does
+                fallback_charset_resolver=lambda response, body: _detect_page_charset(body),
                 headers={
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 }
@@ -104,41 +796,80 @@ class ContractorService:
         try:
             session = await self._get_session()
             
-            # Generate business name variations for Clearbit
-            business_name_variations = [business_name, self._generate_simple_business_name(business_name)]
+            # Generate business name variations for Clearbit (skip duplicates)
+            business_name_variations = list(dict.fromkeys(
+                [business_name, self._generate_simple_business_name(business_name)]
+            ))
             
-            # Try each variation
-            for name_variation in business_name_variations:
-                # Clean business name for search - keep special characters for better matching
-                clean_name = name_variation.strip()
-                
-                # Properly URL encode the query parameter
-                from urllib.parse import quote
-                encoded_query = quote(clean_name)
-                
-                # Clearbit API endpoint
-                url = f"https://autocomplete.clearbit.com/v1/companies/suggest?query={encoded_query}"
-                
-                async with session.get(url) as response:
-                    if response.status in [200, 201, 202]:  # Accept 200 OK, 201 Created, 202 Accepted
-                        data = await response.json()
-                        
-                        if data and len(data) > 0:
-                            # Get the first (most relevant) result
-                            company = data[0]
-                            domain = company.get('domain')
-                            
-                            if domain:
-                                return domain
-                        
-                    elif response.status != 404:  # 404 is expected for no results
-                        logger.warning(f"Clearbit API returned status {response.status}")
+            # Query all variations concurrently, but keep the preference order of the list:
+            # as soon as the highest-priority variation with a domain is known, cancel the rest
+            tasks = [
+                asyncio.create_task(self._clearbit_lookup(session, name_variation))
+                for name_variation in business_name_variations
+            ]
+            try:
+                for task in tasks:
+                    domain = await task
+                    if domain:
+                        return domain
+            finally:
+                for task in tasks:
+                    task.cancel()
                         
         except Exception as e:
             logger.error(f"Clearbit API error for {business_name}: {e}")
             
         return None
     
+    async def _clearbit_lookup(self, session: aiohttp.ClientSession, name_variation: str) -> Optional[str]:
+        """Look up a single business name variation on the Clearbit autocomplete API"""
+        # Clean business name for search - keep special characters for better matching
+        clean_name = name_variation.strip()
+        
+        cache_key = clean_name.lower()
+        if cache_key in self._clearbit_cache:
+            self._clearbit_cache.move_to_end(cache_key)
+            return self._clearbit_cache[cache_key]
+        
+        # Clearbit API endpoint (properly URL encode the query parameter)
+        url = f"https://autocomplete.clearbit.com/v1/companies/suggest?query={quote(clean_name)}"
+        
+        try:
+            async with session.get(url) as response:
+                if response.status in [200, 201, 202]:  # Accept 200 OK, 201 Created, 202 Accepted
+                    data = await response.json(loads=orjson.loads)
+                    
+                    # Get the first (most relevant) result
+                    domain = data[0].get('domain') if data else None
+                    self._cache_clearbit_result(cache_key, domain)
+                    return domain
+                    
+                elif response.status == 404:  # 404 is expected for no results
+                    self._cache_clearbit_result(cache_key, None)
+                else:
+                    logger.warning(f"Clearbit API returned status {response.status}")
+        
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Clearbit API error for {name_variation}: {e}")
+        
+        return None
+    
+    def _cache_clearbit_result(self, cache_key: str, domain: Optional[str]):
+        """Remember a Clearbit answer, evicting the least recently used entry when full"""
+        self._clearbit_cache[cache_key] = domain
+        self._clearbit_cache.move_to_end(cache_key)
+        if len(self._clearbit_cache) > _CLEARBIT_CACHE_SIZE:
+            self._clearbit_cache.popitem(last=False)
+    
+    def _cache_ai_analysis(self, cache_key: str, ai_response: str):
+        """Remember a parsed AI answer, evicting the least recently used entry when full"""
+        self._ai_analysis_cache[cache_key] = ai_response
+        self._ai_analysis_cache.move_to_end(cache_key)
+        if len(self._ai_analysis_cache) > _AI_ANALYSIS_CACHE_SIZE:
+            self._ai_analysis_cache.popitem(last=False)
+    
     async def search_google_local_pack(self, business_name: str, city: str, state: str) -> Optional[Dict[str, Any]]:
         """Search Google Local Pack using Custom Search API with local business focus"""
         try:
@@ -164,9 +895,9 @@ class ContractorService:
                 'num': 5  # Fewer results for local pack
             }
             
-            async with session.get(url, params=params) as response:
+            async with self.search_semaphore, session.get(url, params=params) as response:
                 if response.status in [200, 201, 202]:  # Accept 200 OK, 201 Created, 202 Accepted
-                    data = await response.json()
+                    data = await response.json(loads=orjson.loads)
                     
                     if 'items' in data and len(data['items']) > 0:
                         # Look for local business type results
@@ -201,6 +932,17 @@ class ContractorService:
         """
         Search Google Custom Search API with quota tracking and graceful shutdown
         """
+        # Responses cached by an earlier run cost no quota; in replay mode a miss never hits the API
+        cache_key = None
+        if self._search_cache is not None:
+            cache_key = SearchResponseCache.key(query, search_type)
+            cached = await asyncio.to_thread(self._search_cache.get, cache_key)
+            if cached is not None:
+                return cached
+            if config.GOOGLE_SEARCH_CACHE_REPLAY:
+                logger.debug(f"No cached Google response (replay mode) for query: {query}")
+                return None
+        
         # Check if quota exceeded before making request
         if quota_tracker.is_quota_exceeded():
             logger.error("Daily Google API quota exceeded - stopping processing")
@@ -217,62 +959,54 @@ class ContractorService:
         if search_type == "knowledge":
             params['searchType'] = 'image'
         
+        # Reuse the service session so retries and later queries ride the same kept-alive TLS connection
+        session = await self._get_session()
+        
         max_retries = 3
         for attempt in range(max_retries):
+            rate_limited = False
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, params=params) as response:
-                        if response.status in [200, 201, 202]:  # Accept 200 OK, 201 Created, 202 Accepted
-                            data = await response.json()
-                            quota_tracker.record_query()  # Record successful query
-                            
-                            # Log quota status periodically
-                            if quota_tracker.queries_today % 100 == 0:
-                                status = quota_tracker.get_quota_status()
-                                logger.info(f"Google API quota status: {status['queries_today']}/{status['daily_limit']} queries used")
-                            
-                            return data
+                async with self.search_semaphore, session.get(url, params=params) as response:
+                    if response.status in [200, 201, 202]:  # Accept 200 OK, 201 Created, 202 Accepted
+                        data = await response.json(loads=orjson.loads)
+                        quota_tracker.record_query()  # Record successful query
+                        if cache_key is not None:
+                            await asyncio.to_thread(self._search_cache.put, cache_key, data)
                         
-                        elif response.status == 429:
-                            # Check if this is likely quota exceeded
-                            if quota_tracker.record_429_error():
-                                logger.error("Daily Google API quota exceeded - stopping processing")
-                                raise QuotaExceededError("Daily Google API quota exceeded")
-                            
-                            logger.warning(f"Google API rate limited (429) for query: {query}")
-                            await asyncio.sleep(5)  # Increased delay for 429 errors
-                            continue
+                        # Log quota status periodically (skip building the status when INFO is off)
+                        if quota_tracker.queries_today % 100 == 0 and logger.isEnabledFor(logging.INFO):
+                            logger.info("Google API quota status: %d/%d queries used",
+                                        quota_tracker.queries_today, quota_tracker.daily_quota_limit)
+                        
+                        return data
+                    
+                    elif response.status == 429:
+                        # Check if this is likely quota exceeded
+                        if quota_tracker.record_429_error():
+                            logger.error("Daily Google API quota exceeded - stopping processing")
+                            raise QuotaExceededError("Daily Google API quota exceeded")
+                        
+                        logger.warning(f"Google API rate limited (429) for query: {query}")
+                        rate_limited = True
+                    
+                    else:
+                        logger.error(f"Google API error {response.status} for query: {query}")
+                        return None
                         
-                        else:
-                            logger.error(f"Google API error {response.status} for query: {query}")
-                            return None
-                            
             except Exception as e:
                 logger.error(f"Error searching Google API: {e}")
                 return None
+            
+            if rate_limited:
+                # Back off after leaving the block, so the wait holds neither a search slot nor the response
+                await asyncio.sleep(5)  # Increased delay for 429 errors
         
         logger.error(f"Failed to search Google API after {max_retries} attempts for query: {query}")
         return None
     
     def _generate_simple_business_name(self, business_name: str) -> str:
         """Generate simple business name by removing INC, LLC, etc."""
-        simple_name = business_name
-        
-        # Common business designations to remove
-        designations = [
-            ' INC', ' LLC', ' CORP', ' CORPORATION', ' CO', ' COMPANY',
-            ' LP', ' LLP', ' LPA', ' PA', ' PLLC', ' PC', ' PLLC',
-            ' LTD', ' LIMITED', ' GROUP', ' ENTERPRISES', ' ENTERPRISE',
-            ' SERVICES', ' SERVICE', ' BUILDING'
-        ]
-        
-        # Remove each designation
-        for designation in designations:
-            if designation in simple_name.upper():
-                simple_name = simple_name.upper().replace(designation, '').strip()
-                break  # Only remove the first one found
-        
-        return simple_name
+        return _simple_business_name(business_name)
     
     def _generate_search_queries(self, business_name: str, city: str, state: str) -> List[str]:
         """Generate search queries without quotes for better matching"""
@@ -297,14 +1031,22 @@ class ContractorService:
         
         return unique_queries
     
-    def _calculate_search_confidence(self, search_item: Dict[str, Any], business_name: str, city: str, state: str) -> float:
+    def _calculate_search_confidence(self, search_item: Union[Dict[str, Any], NormalizedSearchItem],
+                                     business_name: str, city: str, state: str) -> float:
         """Calculate confidence score for a search result with STRICT business name and geographic validation"""
-        title = search_item.get('title', '').lower()
-        snippet = search_item.get('snippet', '').lower()
-        url = search_item.get('link', '').lower()
+        if isinstance(search_item, NormalizedSearchItem):
+            title = search_item.title_lower
+            snippet = search_item.snippet_lower
+            url = search_item.link_lower
+            domain = search_item.domain
+        else:
+            title = search_item.get('title', '').lower()
+            snippet = search_item.get('snippet', '').lower()
+            url = search_item.get('link', '').lower()
+            domain = _url_domain(url)
         
-        business_name_lower = business_name.lower()
-        simple_name = self._generate_simple_business_name(business_name).lower()
+        (business_name_lower, simple_name, fuzzy_variations, business_words,
+         business_pairs, abbreviation_variations) = _search_name_forms(business_name)
         city_lower = city.lower()
         state_lower = state.lower()
         
@@ -335,17 +1077,8 @@ class ContractorService:
         
         # Test fuzzy/partial matches if exact match not found
         if not business_name_found:
-            # Create variations of the business name (more restrictive)
-            business_variations = [
-                business_name_lower,
-                simple_name,
-                business_name_lower.replace('plus', '+'),
-                business_name_lower.replace(' ', ''),
-                simple_name.replace(' ', ''),
-            ]
-            
-            # Test each variation against title, snippet, and URL
-            for variation in business_variations:
+            # Test each variation of the business name (more restrictive) against title, snippet, and URL
+            for variation in fuzzy_variations:
                 if variation in title:
                     confidence += 0.35
                     business_name_found = True
@@ -361,37 +1094,30 @@ class ContractorService:
             
             # Test partial word matches (more restrictive)
             if not business_name_found:
-                business_words = business_name_lower.split()
                 title_words = title.split()
                 snippet_words = snippet.split()
                 url_words = url.split()
                 
-                # Count matching words
-                title_matches = sum(1 for word in business_words if word in title_words)
-                snippet_matches = sum(1 for word in business_words if word in snippet_words)
-                url_matches = sum(1 for word in business_words if word in url_words)
+                # Count matching words (set lookups instead of list scans)
+                title_word_set = set(title_words)
+                snippet_word_set = set(snippet_words)
+                url_word_set = set(url_words)
+                title_matches = sum(1 for word in business_words if word in title_word_set)
+                snippet_matches = sum(1 for word in business_words if word in snippet_word_set)
+                url_matches = sum(1 for word in business_words if word in url_word_set)
                 
                 # More restrictive: require at least 3 words to match, OR 2+ words that are adjacent
-                def check_adjacent_words(business_words, text_words):
-                    """Check if business words appear adjacent in text"""
-                    if len(business_words) < 2:
+                def check_adjacent_words(text_words):
+                    """Check if any adjacent pair of business words appears adjacent in text"""
+                    if not business_pairs:
                         return False
-                    
-                    # Look for adjacent pairs of business words
-                    for i in range(len(business_words) - 1):
-                        word1 = business_words[i]
-                        word2 = business_words[i + 1]
-                        
-                        # Check if these two words appear adjacent in text
-                        for j in range(len(text_words) - 1):
-                            if text_words[j] == word1 and text_words[j + 1] == word2:
-                                return True
-                    return False
+                    text_pairs = set(zip(text_words, text_words[1:]))
+                    return any(pair in text_pairs for pair in business_pairs)
                 
                 # Check for adjacent word matches
-                title_adjacent = check_adjacent_words(business_words, title_words)
-                snippet_adjacent = check_adjacent_words(business_words, snippet_words)
-                url_adjacent = check_adjacent_words(business_words, url_words)
+                title_adjacent = check_adjacent_words(title_words)
+                snippet_adjacent = check_adjacent_words(snippet_words)
+                url_adjacent = check_adjacent_words(url_words)
                 
                 # Require either 4+ words OR 2+ adjacent words (more restrictive)
                 if title_matches >= 4 or title_adjacent:
@@ -406,25 +1132,8 @@ class ContractorService:
         
         # Test common abbreviation variations if exact match not found
         if not business_name_found:
-            # Common abbreviation mappings
-            abbreviation_variations = [
-                ('& a/c', '& air conditioning'),
-                ('& ac', '& air conditioning'),
-                ('a/c', 'air conditioning'),
-                ('ac', 'air conditioning'),
-                ('heating & a/c', 'heating & air conditioning'),
-                ('heating & ac', 'heating & air conditioning'),
-                ('heating and a/c', 'heating and air conditioning'),
-                ('heating and ac', 'heating and air conditioning')
-            ]
-            
-            # Test each variation
-            for abbrev, full in abbreviation_variations:
-                # Create variation of business name
-                variation = business_name_lower.replace(abbrev, full)
-                simple_variation = simple_name.replace(abbrev, full)
-                
-                # Test against title and snippet
+            # Test each common abbreviation variation against title and snippet
+            for variation, simple_variation in abbreviation_variations:
                 if variation in title:
                     confidence += 0.4
                     business_name_found = True
@@ -458,7 +1167,7 @@ class ContractorService:
             location_found = True
         
         # Additional WA location validation
-        if self._has_wa_location_indicators(url, title, snippet):
+        if _has_wa_location_lower(domain, title, snippet):
             confidence += 0.15
             location_found = True
         
@@ -467,13 +1176,11 @@ class ContractorService:
             confidence += 0.1
             
             # STRICT DOMAIN NAME VALIDATION
-            domain = url.lower().replace('https://', '').replace('http://', '').split('/')[0]
-            
             # Check for exact business name in domain (highest confidence)
             if business_name_lower.replace(' ', '') in domain or simple_name.replace(' ', '') in domain:
                 confidence += 0.4  # Major bonus for exact domain match
                 location_found = True  # Domain match counts as location validation
-            elif any(word in domain for word in business_name_lower.split()):
+            elif any(word in domain for word in business_words):
                 # Partial match - but require location validation
                 confidence += 0.2
                 if not location_found:
@@ -483,17 +1190,19 @@ class ContractorService:
                 if not location_found:
                     confidence -= 0.4  # Major penalty for no business name AND no location
         
-        # STRICT PENALTY for directory/association sites
-        directory_indicators = ['association', 'directory', 'listing', 'find', 'search', 'pros', 'contractors', 'bizprofile', 'bizapedia', 'yellowpages', 'whitepages', 'superpages', 'manta', 'zoominfo']
-        if any(indicator in title.lower() or indicator in snippet.lower() for indicator in directory_indicators):
+        # The checks below can only add 0.05, so a score this low is rejected whatever they find
+        if confidence + 0.05 < 0.3:
+            return 0.0
+        
+        # STRICT PENALTY for directory/association sites (title and snippet are already lowercase)
+        if _DIRECTORY_INDICATOR_RE.search(title) or _DIRECTORY_INDICATOR_RE.search(snippet):
             confidence -= 0.5  # Major penalty for directory sites
         
-        # Contractor-related keywords (minor bonus)
-        contractor_keywords = ['contractor', 'construction', 'plumbing', 'electrical', 'hvac', 'roofing', 'insulation', 'mold', 'attic']
-        for keyword in contractor_keywords:
-            if keyword in title or keyword in snippet:
+        # Contractor-related keywords (minor bonus), skipped when the bonus can't change the outcome:
+        # the score is already at the 0.95 cap, or stays below the 0.3 floor even with it
+        if confidence < 0.95 and confidence + 0.05 >= 0.3:
+            if _CONTRACTOR_KEYWORD_RE.search(title) or _CONTRACTOR_KEYWORD_RE.search(snippet):
                 confidence += 0.05  # Reduced bonus
-                break
         
         # FINAL VALIDATION: Require minimum confidence for acceptance
         final_confidence = min(confidence, 0.95)
@@ -529,9 +1238,9 @@ class ContractorService:
                 'num': 5  # Fewer results for knowledge panel
             }
             
-            async with session.get(url, params=params) as response:
+            async with self.search_semaphore, session.get(url, params=params) as response:
                 if response.status in [200, 201, 202]:  # Accept 200 OK, 201 Created, 202 Accepted
-                    data = await response.json()
+                    data = await response.json(loads=orjson.loads)
                     
                     if 'items' in data and len(data['items']) > 0:
                         # Look for knowledge panel type results (usually first result)
@@ -568,6 +1277,11 @@ class ContractorService:
     
     async def _get_raw_html(self, url: str) -> Optional[str]:
         """Get raw HTML content for navigation extraction"""
+        async with self.crawl_semaphore:
+            return await self._fetch_raw_html(url)
+    
+    async def _fetch_raw_html(self, url: str) -> Optional[str]:
+        """Fetch raw HTML, retrying without certificate checks on SSL failures"""
         try:
             session = await self._get_session()
             
@@ -581,10 +1295,14 @@ class ContractorService:
             try:
                 async with session.get(url, timeout=10, ssl=ssl_context) as response:
                     if response.status in [200, 201, 202]:  # Accept 200 OK, 201 Created, 202 Accepted
-                        return await response.text()
+                        return await self._read_capped_text(response)
                     else:
                         logger.warning(f"Raw HTML fetch failed for {url}: status {response.status}")
                         
+            except aiohttp.ClientConnectorDNSError as dns_error:
+                # The host doesn't resolve - retrying without certificate checks can't help
+                logger.warning(f"Raw HTML fetch failed for {url}: DNS lookup failed: {dns_error}")
+                
             except Exception as ssl_error:
                 logger.warning(f"SSL raw HTML fetch failed for {url}, trying without SSL: {ssl_error}")
                 
@@ -592,7 +1310,7 @@ class ContractorService:
                 try:
                     async with session.get(url, timeout=10, ssl=False) as response:
                         if response.status in [200, 201, 202]:  # Accept 200 OK, 201 Created, 202 Accepted
-                            return await response.text()
+                            return await self._read_capped_text(response)
                         else:
                             logger.warning(f"Raw HTML fetch failed for {url}: status {response.status}")
                             
@@ -604,8 +1322,33 @@ class ContractorService:
             
         return None
     
+    async def _read_capped_text(self, response: aiohttp.ClientResponse) -> str:
+        """Read at most MAX_CRAWL_BYTES of a response body and decode it"""
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(16384):
+            body.extend(chunk)
+            if len(body) >= config.MAX_CRAWL_BYTES:
+                del body[config.MAX_CRAWL_BYTES:]
+                break
+        if response.charset:
+            try:
+                return body.decode(response.charset, errors='replace')
+            except LookupError:  # Unknown charset in Content-Type
+                pass
+        return body.decode(_detect_page_charset(bytes(body)), errors='replace')
+    
+    async def _page_text(self, raw_html: str) -> str:
+        """Strip a fetched page to visible text in the parser pool, off the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_parser_pool(), _html_to_text, raw_html)
+    
     async def _crawl_single_page(self, url: str) -> Optional[str]:
         """Crawl a single page with improved SSL handling"""
+        async with self.crawl_semaphore:
+            return await self._fetch_page_text(url)
+    
+    async def _fetch_page_text(self, url: str) -> Optional[str]:
+        """Fetch a page and strip it down to visible text"""
         try:
             session = await self._get_session()
             
@@ -619,23 +1362,16 @@ class ContractorService:
             try:
                 async with session.get(url, timeout=10, ssl=ssl_context) as response:
                     if response.status in [200, 201, 202]:  # Accept 200 OK, 201 Created, 202 Accepted
-                        content = await response.text()
-                        
-                        # Extract meaningful content
-                        content = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL)
-                        content = re.sub(r'<style[^>]*>.*?</style>', '', content, flags=re.DOTALL)
-                        content = re.sub(r'<[^>]+>', '', content)
-                        
-                        # Decode HTML entities
-                        import html
-                        content = html.unescape(content)
-                        
-                        content = re.sub(r'\s+', ' ', content).strip()
+                        content = await self._page_text(await self._read_capped_text(response))
                         
                         return content if content else None
                     else:
                         logger.warning(f"Website crawl failed for {url}: status {response.status}")
                         
+            except aiohttp.ClientConnectorDNSError as dns_error:
+                # The host doesn't resolve - retrying without certificate checks can't help
+                logger.warning(f"Website crawl failed for {url}: DNS lookup failed: {dns_error}")
+                
             except Exception as ssl_error:
                 logger.warning(f"SSL crawl failed for {url}, trying without SSL: {ssl_error}")
                 
@@ -643,18 +1379,7 @@ class ContractorService:
                 try:
                     async with session.get(url, timeout=10, ssl=False) as response:
                         if response.status in [200, 201, 202]:  # Accept 200 OK, 201 Created, 202 Accepted
-                            content = await response.text()
-                            
-                            # Extract meaningful content
-                            content = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL)
-                            content = re.sub(r'<style[^>]*>.*?</style>', '', content, flags=re.DOTALL)
-                            content = re.sub(r'<[^>]+>', '', content)
-                            
-                            # Decode HTML entities
-                            import html
-                            content = html.unescape(content)
-                            
-                            content = re.sub(r'\s+', ' ', content).strip()
+                            content = await self._page_text(await self._read_capped_text(response))
                             
                             return content if content else None
                         else:
@@ -670,6 +1395,23 @@ class ContractorService:
     
     async def crawl_website_comprehensive(self, url: str) -> Optional[Dict[str, Any]]:
         """Comprehensive website crawling - multiple pages with navigation analysis"""
+        # Discovery and content analysis crawl the same winning site, and chain or franchise
+        # contractors share sites, so recent successful crawls are reused
+        cached = self._crawl_cache.get(url)
+        if cached is not None and time.monotonic() - cached[0] < _CRAWL_CACHE_TTL:
+            self._crawl_cache.move_to_end(url)
+            return cached[1]
+        
+        crawled_data = await self._crawl_website_uncached(url)
+        if crawled_data:
+            self._crawl_cache[url] = (time.monotonic(), crawled_data)
+            self._crawl_cache.move_to_end(url)
+            if len(self._crawl_cache) > _CRAWL_CACHE_SIZE:
+                self._crawl_cache.popitem(last=False)
+        return crawled_data
+    
+    async def _crawl_website_uncached(self, url: str) -> Optional[Dict[str, Any]]:
+        """Crawl a site's main page plus up to five navigation pages"""
         try:
             session = await self._get_session()
             
@@ -678,11 +1420,13 @@ class ContractorService:
             if not raw_html:
                 return None
             
-            # Extract navigation links from raw HTML
-            nav_links = self._extract_navigation_links(url, raw_html)
-            
-            # Now crawl the main page for content
-            main_content = await self._crawl_single_page(url)
+            # Extract navigation links and the main page's text (from the HTML already fetched,
+            # not a second request). BeautifulSoup and the tag-stripping regexes hold the GIL
+            # for the whole page, so both run in the parser process pool in one round-trip
+            loop = asyncio.get_running_loop()
+            nav_links, main_content = await loop.run_in_executor(
+                self._get_parser_pool(), _parse_main_page, url, raw_html
+            )
             if not main_content:
                 return None
             
@@ -690,12 +1434,16 @@ class ContractorService:
             additional_content = []
             crawled_pages = 0
             max_pages = 5
+            # Aliases like /home or /index.html often serve the main page again; keep each text once
+            seen_content = {main_content}
             
             for link in nav_links[:max_pages]:
                 try:
                     page_content = await self._crawl_single_page(link)
                     if page_content:
-                        additional_content.append(page_content)
+                        if page_content not in seen_content:
+                            seen_content.add(page_content)
+                            additional_content.append(page_content)
                         crawled_pages += 1
                         
                         # Add delay to be respectful
@@ -724,92 +1472,22 @@ class ContractorService:
     
     def _extract_navigation_links(self, base_url: str, html_content: str) -> List[str]:
         """Extract navigation links from HTML content with improved selectors"""
-        try:
-            from bs4 import BeautifulSoup
-            import urllib.parse
-            import re
-            
-            soup = BeautifulSoup(html_content, 'html.parser')
-            links = []
-            
-            # Comprehensive navigation selectors for modern websites
-            nav_selectors = [
-                # Standard navigation
-                'nav a', 'header a', '.nav a', '.navigation a', 
-                '.menu a', '.navbar a', '#nav a', '#navigation a',
-                # Modern frameworks
-                '.navbar-nav a', '.nav-menu a', '.main-menu a', '.primary-menu a',
-                '.site-nav a', '.main-nav a', '.top-nav a', '.header-nav a',
-                # Common class patterns
-                '[class*="nav"] a', '[class*="menu"] a', '[class*="header"] a',
-                # Specific modern patterns
-                '.navbar-nav .nav-link', '.nav-menu .menu-item a', '.main-menu .menu-item a',
-                # Generic link extraction (fallback)
-                'a[href]'
-            ]
-            
-            for selector in nav_selectors:
-                try:
-                    elements = soup.select(selector)
-                    for element in elements:
-                        href = element.get('href')
-                        if href and href.strip():
-                            # Convert relative URLs to absolute
-                            absolute_url = urllib.parse.urljoin(base_url, href)
-                            
-                            # Only include links to the same domain
-                            if urllib.parse.urlparse(absolute_url).netloc == urllib.parse.urlparse(base_url).netloc:
-                                # Filter out common non-content pages and patterns
-                                exclude_patterns = [
-                                    '/admin', '/login', '/cart', '/checkout', '/search',
-                                    '/privacy', '/terms', '/sitemap', '/feed', '/rss',
-                                    '/wp-admin', '/wp-login', '/cgi-bin', '/api',
-                                    'mailto:', 'tel:', 'javascript:', '#'
-                                ]
-                                
-                                # Check if URL contains excluded patterns
-                                if not any(pattern in absolute_url.lower() for pattern in exclude_patterns):
-                                    # Focus on content-rich pages with specific keywords
-                                    content_keywords = [
-                                        'service', 'offering', 'about', 'contact', 
-                                        'capabilities', 'capability', 'location'
-                                    ]
-                                    
-                                    # Check if URL path or link text contains content keywords
-                                    url_lower = absolute_url.lower()
-                                    link_text = element.get_text(strip=True).lower()
-                                    
-                                    # Look for keywords in URL path or link text
-                                    has_content_keyword = any(keyword in url_lower for keyword in content_keywords) or \
-                                                        any(keyword in link_text for keyword in content_keywords)
-                                    
-                                    if has_content_keyword:
-                                        links.append(absolute_url)
-                                    elif len(links) < 2:  # Limit non-content pages to 2
-                                        links.append(absolute_url)
-                                        
-                except Exception as selector_error:
-                    logger.debug(f"Selector '{selector}' failed: {selector_error}")
-                    continue
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_links = []
-            for link in links:
-                if link not in seen:
-                    seen.add(link)
-                    unique_links.append(link)
-            
-            # Log what we found
-            logger.info(f"Extracted {len(unique_links)} navigation links from {base_url}")
-            for i, link in enumerate(unique_links[:5]):  # Log first 5
-                logger.debug(f"  Link {i+1}: {link}")
-            
-            return unique_links[:10]  # Limit to 10 links
-            
-        except Exception as e:
-            logger.warning(f"Failed to extract navigation links from {base_url}: {e}")
-            return []
+        return _extract_navigation_links_from_html(base_url, html_content)
+    
+    def _get_parser_pool(self) -> ProcessPoolExecutor:
+        """Get or create the process pool used for CPU-bound HTML parsing"""
+        if self._parser_pool is None:
+            mp_context = multiprocessing.get_context('spawn')
+            log_queue = mp_context.Queue()
+            self._parser_log_listener = logging.handlers.QueueListener(log_queue, _ParentLogHandler())
+            self._parser_log_listener.start()
+            self._parser_pool = ProcessPoolExecutor(
+                max_workers=config.MAX_PARSER_WORKERS,
+                mp_context=mp_context,
+                initializer=_init_parser_worker,
+                initargs=(log_queue, config.LOG_LEVEL.upper())
+            )
+        return self._parser_pool
     
     def _is_valid_website(self, url: str) -> bool:
         """Check if URL is a valid business website (not directory/social)"""
@@ -819,60 +1497,13 @@ class ContractorService:
         # Use the centralized domain validation function
         return is_valid_website_domain(url)
     
+    def _has_sufficient_content(self, content: str) -> bool:
+        """Check if crawled content is large enough to be worth validating (parked pages, 404 bodies, cookie walls)"""
+        return len(content) >= config.MIN_CONTENT_LENGTH
+    
     def _has_wa_location_indicators(self, url: str, title: str, snippet: str) -> bool:
         """Check if the website has Washington state location indicators"""
-        wa_indicators = [
-            'wa', 'washington', 'seattle', 'spokane', 'tacoma', 'bellevue', 'everett', 'kent', 
-            'auburn', 'federal way', 'yakima', 'vancouver', 'olympia', 'bellingham', 'kennewick', 
-            'puyallup', 'lynnwood', 'renton', 'spokane valley', 'bremerton', 'pasco', 'marysville', 
-            'lakewood', 'redmond', 'sammamish', 'kirkland', 'bothell', 'mercer island', 'woodinville', 
-            'edmonds', 'mount vernon', 'bainbridge island', 'gig harbor', 'port orchard', 'silverdale', 
-            'poulsbo', 'kingston', 'port townsend', 'sequim', 'port angeles', 'forks', 'aberdeen', 
-            'hoquiam', 'centralia', 'chehalis', 'lacey', 'tumwater', 'shelton', 'colbert', 'oroville', 
-            'moxee', 'selah', 'naches', 'cle elum', 'ellensburg', 'connell', 'richland', 'kennewick', 
-            'pasco', 'west richland', 'prosser', 'grandview', 'sunnyside', 'toppenish', 'granger', 
-            'zillah', 'wapato', 'mabton', 'benton city', 'kiona', 'paterson', 'bickleton', 'klickitat', 
-            'goldendale', 'white salmon', 'stevenson', 'carson', 'wishram', 'lyle', 'dallesport', 
-            'husum', 'trout lake', 'glenwood', 'klickitat', 'centerville', 'appleton', 'bickleton', 
-            'cle elum', 'ellensburg', 'kittitas', 'thorp', 'rosellyn', 'south cle elum', 'liberty', 
-            'kittitas', 'vantage', 'george', 'quincy', 'moses lake', 'soap lake', 'ephrata', 'mattawa', 
-            'royal city', 'warden', 'odessa', 'wilbur', 'almira', 'creston', 'davenport', 'reardan', 
-            'medical lake', 'airway heights', 'deer park', 'newport', 'colville', 'chewelah', 'kettle falls', 
-            'republic', 'curlew', 'oriente', 'malo', 'danville', 'boyds', 'barstow', 'northport', 
-            'laurier', 'orient', 'addy', 'valley', 'springdale', 'chelan', 'mansfield', 'pateros', 
-            'brewer', 'methow', 'twisp', 'winthrop', 'mazama', 'carlton', 'tonasket', 'omak', 'orondo', 
-            'rock island', 'malaga', 'walla walla', 'college place', 'dayton', 'waitsburg', 'prescott', 
-            'burbank', 'lowden', 'touchet', 'dixie', 'staples', 'huntsville', 'milton-freewater', 
-            'clarkston', 'asotin', 'anatone', 'cloverland', 'weston', 'anatom', 'lewiston', 'clarkston', 
-            'pullman', 'moscow', 'colfax', 'palouse', 'garfield', 'albion', 'uniontown', 'farmington', 
-            'endicott', 'st john', 'lamont', 'oakesdale', 'tekoa', 'rosalia', 'malden', 'thornton', 
-            'steptoe', 'hay', 'benge', 'washtucna', 'lind', 'ritzville', 'davenport', 'creston', 'wilbur', 
-            'odessa', 'almira', 'reardan', 'medical lake', 'airway heights', 'deer park', 'newport', 
-            'colville', 'chewelah', 'kettle falls', 'republic', 'curlew', 'oriente', 'malo', 'danville', 
-            'boyds', 'barstow', 'northport', 'laurier', 'orient', 'addy', 'valley', 'springdale', 
-            'chelan', 'mansfield', 'pateros', 'brewer', 'methow', 'twisp', 'winthrop', 'mazama', 
-            'carlton', 'tonasket', 'omak', 'orondo', 'rock island', 'malaga', 'walla walla', 
-            'college place', 'dayton', 'waitsburg', 'prescott', 'burbank', 'lowden', 'touchet', 
-            'dixie', 'staples', 'huntsville', 'milton-freewater', 'clarkston', 'asotin', 'anatone', 
-            'cloverland', 'weston', 'anatom', 'lewiston', 'clarkston', 'pullman', 'moscow', 'colfax', 
-            'palouse', 'garfield', 'albion', 'uniontown', 'farmington', 'endicott', 'st john', 
-            'lamont', 'oakesdale', 'tekoa', 'rosalia', 'malden', 'thornton', 'steptoe', 'hay', 
-            'benge', 'washtucna', 'lind', 'ritzville'
-        ]
-        
-        # Check domain for location indicators
-        domain = url.lower().replace('https://', '').replace('http://', '').split('/')[0]
-        for indicator in wa_indicators:
-            if indicator in domain:
-                return True
-        
-        # Check title and snippet for location indicators
-        content = f"{title} {snippet}".lower()
-        for indicator in wa_indicators:
-            if indicator in content:
-                return True
-        
-        return False
+        return _has_wa_location_lower(_url_domain(url.lower()), title.lower(), snippet.lower())
     
     async def enhanced_website_discovery(self, contractor: Contractor, logger_ctx) -> float:
         """Website discovery using multiple sources"""
@@ -902,7 +1533,9 @@ class ContractorService:
                 
                 crawled_data = await self.crawl_website_comprehensive(clearbit_url)
                 
-                if crawled_data and crawled_data['combined_content']:
+                if crawled_data and crawled_data['combined_content'] and not self._has_sufficient_content(crawled_data['combined_content']):
+                    logger_ctx.log_website_evaluation(clearbit_url, 'clearbit_api', 0.0, "Content too small to validate")
+                elif crawled_data and crawled_data['combined_content']:
                     # Perform comprehensive 5-factor validation
                     validation_results = await self._comprehensive_website_validation(contractor, crawled_data['combined_content'], logger_ctx)
                     validation_confidence = self._calculate_validation_confidence(validation_results)
@@ -948,6 +1581,11 @@ class ContractorService:
                 
                 # Try each search query
                 for query in queries:
+                    # Stop once a site clears the bar that lets a Clearbit hit skip Google entirely;
+                    # further queries would only spend quota and crawls on an already-decided outcome
+                    if best_confidence >= 0.90:
+                        break
+                    
                     google_api_result = await self.search_google_api(query)
                     if google_api_result and 'items' in google_api_result:
                         logger_ctx.log_search_query(f"Google API Query: {query} ({len(google_api_result['items'])} results)")
@@ -959,12 +1597,14 @@ class ContractorService:
                         # First, evaluate all results and log them
                         evaluated_results = []
                         for i, item in enumerate(google_api_result['items'], 1):
-                            url = item.get('link', '')
-                            title = item.get('title', '')
-                            snippet = item.get('snippet', '')
+                            # Lowercase the result once for the confidence and geographic checks
+                            normalized = NormalizedSearchItem.from_raw(item)
+                            url = normalized.link
+                            title = normalized.title
+                            snippet = normalized.snippet
                             
                             # Calculate confidence for this result
-                            confidence = self._calculate_search_confidence(item, business_name, city, state)
+                            confidence = self._calculate_search_confidence(normalized, business_name, city, state)
                             
                             # Log each result evaluation with consistent numbering
                             logger_ctx.log_website_evaluation(url, 'google_api', confidence, f"Search Result #{i}: {title[:50]}...")
@@ -976,7 +1616,8 @@ class ContractorService:
                                 'title': title,
                                 'snippet': snippet,
                                 'confidence': confidence,
-                                'item': item
+                                'item': item,
+                                'normalized': normalized
                             })
                         
                         # Now process the best candidates in order of confidence
@@ -998,10 +1639,14 @@ class ContractorService:
                                 # Check if this is a valid website
                                 if self._is_valid_website(url):
                                     # Check geographic validation
-                                    if self._has_wa_location_indicators(url, title, result_info['snippet']):
+                                    normalized = result_info['normalized']
+                                    if _has_wa_location_lower(normalized.domain, normalized.title_lower, normalized.snippet_lower):
                                         logger_ctx.log_website_evaluation(url, 'google_api', confidence, f"Search Result #{result_info['index']}: Passed geographic validation, crawling...")
                                         crawled_data = await self.crawl_website_comprehensive(url)
-                                        if crawled_data and crawled_data['combined_content']:
+                                        if crawled_data and crawled_data['combined_content'] and not self._has_sufficient_content(crawled_data['combined_content']):
+                                            logger_ctx.log_website_evaluation(url, 'google_api', confidence, f"Search Result #{result_info['index']}: Content too small to validate")
+                                            processed_urls.add(url)
+                                        elif crawled_data and crawled_data['combined_content']:
                                             # Perform comprehensive 5-factor validation
                                             validation_results = await self._comprehensive_website_validation(contractor, crawled_data['combined_content'], logger_ctx)
                                             validation_confidence = self._calculate_validation_confidence(validation_results)
@@ -1129,12 +1774,13 @@ class ContractorService:
                     'crawled_content': best_result.get('content', '')[:500]  # Store first 500 chars
                 }
                 logger_ctx.log_website_selection(best_result['url'], best_confidence)
-                logger.info(f"Discovery found website: {best_result['url']} via {best_result['source']} (confidence: {best_confidence:.2f})")
+                logger.info("Discovery found website: %s via %s (confidence: %.2f)",
+                            best_result['url'], best_result['source'], best_confidence)
                 
                 # Log final result with URL and validation details
-                logger.info(f"🌐 WEBSITE FOUND: {best_result['url']}")
-                logger.info(f"   Source: {best_result['source']}")
-                logger.info(f"   Confidence: {best_confidence:.3f}")
+                logger.info("🌐 WEBSITE FOUND: %s", best_result['url'])
+                logger.info("   Source: %s", best_result['source'])
+                logger.info("   Confidence: %.3f", best_confidence)
             else:
                 contractor.website_status = 'not_found'
                 contractor.data_sources = {
@@ -1143,7 +1789,7 @@ class ContractorService:
                     'discovery': True
                 }
                 # Log final result when no website is found
-                logger.info(f"❌ NO WEBSITE FOUND for {business_name}")
+                logger.info("❌ NO WEBSITE FOUND for %s", business_name)
             
             return best_confidence
             
@@ -1151,13 +1797,41 @@ class ContractorService:
             logger.error(f"Website discovery failed for {contractor.business_name}: {e}")
             return 0.0
     
+    async def _get_prompt_categories(self) -> Tuple[str, str]:
+        """Get the comma-joined category and priority-category lists for the AI prompt"""
+        if self._prompt_categories is not None:
+            return self._prompt_categories
+        
+        try:
+            async with db_pool.pool.acquire() as conn:
+                # Get all active categories
+                categories_result = await conn.fetch('''
+                    SELECT name, priority 
+                    FROM categories 
+                    WHERE active = true 
+                    ORDER BY priority DESC, name
+                ''')
+        except Exception as e:
+            logger.warning(f"Failed to get categories from database: {e}, using fallback")
+            return ', '.join(_FALLBACK_CATEGORIES), ', '.join(_FALLBACK_PRIORITY_CATEGORIES)
+        
+        categories_list = [row['name'] for row in categories_result]
+        priority_categories = [row['name'] for row in categories_result if row['priority']]
+        
+        # Fallback if the table is empty (not cached, so a later call can pick up real data)
+        if not categories_list:
+            return ', '.join(_FALLBACK_CATEGORIES), ', '.join(_FALLBACK_PRIORITY_CATEGORIES)
+        
+        self._prompt_categories = (', '.join(categories_list), ', '.join(priority_categories))
+        return self._prompt_categories
+    
     async def enhanced_content_analysis(self, contractor: Contractor, logger_ctx) -> float:
         """AI-powered business categorization and analysis using OpenAI"""
         try:
             if not contractor.website_url or contractor.website_status != 'found':
                 return 0.5  # Base confidence for no website
             
-            # Always re-crawl to ensure we have the latest content with improved parsing
+            # Re-crawl for the full multi-page content (served from the crawl cache when discovery just fetched it)
             crawled_data = await self.crawl_website_comprehensive(contractor.website_url)
             if crawled_data and crawled_data['combined_content']:
                 content = crawled_data['combined_content']
@@ -1174,7 +1848,7 @@ class ContractorService:
             openai_api_key = getattr(config, 'OPENAI_API_KEY', None)
             if not openai_api_key:
                 logger.warning("OpenAI API key not configured, using fallback keyword analysis")
-                return self._fallback_content_analysis(content, contractor.business_name, logger_ctx)
+                return self._fallback_content_analysis(content, contractor.business_name, logger_ctx, contractor.id)
             
             # Prepare content for AI analysis (limit to 10K chars for cost efficiency)
             analysis_content = content[:10000]  # Limit to 10K chars for cost-effective analysis
@@ -1191,49 +1865,8 @@ class ContractorService:
                 "estimated_cost": (len(analysis_content) // 4) * 0.0000005  # GPT-4o-mini input cost
             })
             
-            # OpenAI GPT-4o-mini analysis
-            import openai
-            client = openai.OpenAI(api_key=openai_api_key)
-            
-            # Get categories from database
-            try:
-                async with db_pool.pool.acquire() as conn:
-                    # Get all active categories
-                    categories_result = await conn.fetch('''
-                        SELECT name, priority 
-                        FROM categories 
-                        WHERE active = true 
-                        ORDER BY priority DESC, name
-                    ''')
-                    
-                    categories_list = [row['name'] for row in categories_result]
-                    priority_categories = [row['name'] for row in categories_result if row['priority']]
-                    
-                    # Fallback if database query fails
-                    if not categories_list:
-                        categories_list = [
-                            "Plumbing", "Electrical", "HVAC", "Roofing", "General Contractor",
-                            "Heating and Cooling", "Flooring", "Pools and Spas", "Security Systems",
-                            "Window/Door", "Bathroom/Kitchen Remodel", "Storage & Closets",
-                            "Decks & Patios", "Fence", "Fireplace", "Sprinklers", "Blinds",
-                            "Awning/Patio/Carport", "Media Systems", "Exterior Solutions"
-                        ]
-                        priority_categories = [
-                            "Heating and Cooling", "Plumbing", "Electrical", "HVAC"
-                        ]
-            except Exception as e:
-                logger.warning(f"Failed to get categories from database: {e}, using fallback")
-                # Fallback if database query fails
-                categories_list = [
-                    "Plumbing", "Electrical", "HVAC", "Roofing", "General Contractor",
-                    "Heating and Cooling", "Flooring", "Pools and Spas", "Security Systems",
-                    "Window/Door", "Bathroom/Kitchen Remodel", "Storage & Closets",
-                    "Decks & Patios", "Fence", "Fireplace", "Sprinklers", "Blinds",
-                    "Awning/Patio/Carport", "Media Systems", "Exterior Solutions"
-                ]
-                priority_categories = [
-                    "Heating and Cooling", "Plumbing", "Electrical", "HVAC"
-                ]
+            # Categories are loaded once per service and reused for every contractor
+            categories_text, priority_categories_text = await self._get_prompt_categories()
             
             # Prepare validation summary for the prompt
             validation_summary = {
@@ -1265,102 +1898,36 @@ VALIDATION RESULTS (6-Factor System):
 - Domain Match Score: {validation_summary['domain_match_score']:.2f} (each business name word in domain = +0.10)
 - Contractor Keywords Found: {validation_summary['contractor_keywords_found']}
 
-Available Categories: {', '.join(categories_list)}
+Available Categories: {categories_text}
 
-Priority Categories (high-value residential services): {', '.join(priority_categories)}
+Priority Categories (high-value residential services): {priority_categories_text}
 
 Website Content:
 {analysis_content}
-
-Please provide a JSON response with:
-1. "category" - Specific contractor category from the available categories list above
-2. "confidence" - Confidence score 0-1 based on content analysis AND validation results
-3. "residential_focus" - true if primarily serves homeowners, false if commercial, null if unclear
-4. "services_offered" - Array of main services mentioned
-5. "business_legitimacy" - true if appears to be a legitimate business
-6. "reasoning" - Brief explanation of categorization decision
-
-IMPORTANT: Before setting confidence, carefully examine the website content for business names. If you find a business name that is different from the searched business name, this indicates a mismatch and should result in very low confidence.
-
-CONFIDENCE SCORING RULES:
-- Start with base confidence of 0.5
-- ADD +0.1 for each validation factor that matches (business name, license, phone, address, principal)
-- ADD +0.05 for domain match score (each business name word in domain)
-- ADD +0.1 for strong contractor keywords in content
-- SUBTRACT -0.3 if business name doesn't match at all
-- SUBTRACT -0.2 if no contractor keywords found
-- SUBTRACT -0.2 if website appears to be wrong business type
-- CRITICAL: If the website clearly belongs to a DIFFERENT business than the one being searched for, SUBTRACT -0.8 (very low confidence)
-- CRITICAL: If the website mentions a different business name prominently (like "Runland Painting" when searching for "A TEAM PAINTING"), SUBTRACT -0.6
-- CRITICAL: If the website content describes services but doesn't match the business name being searched, SUBTRACT -0.4
-- FINAL confidence should be between 0.0 and 1.0
-
-CRITICAL CATEGORIZATION RULES:
-- ALWAYS choose the MOST SPECIFIC category that matches the actual services
-- AVOID generic categories like "General Contractor" or "HVAC Contractor" unless no specific category fits
-- FIRST check the business name for obvious category indicators (these are examples, not exhaustive):
-  * Business name contains "ROOFING" → Roofing
-  * Business name contains "PLUMBING" → Plumbing  
-  * Business name contains "ELECTRIC" or "ELECTRICAL" → Electrician
-  * Business name contains "HVAC" or "HEATING" or "COOLING" → Heating and Cooling
-  * Business name contains "LANDSCAPING" or "LANDSCAPE" → Landscaping
-  * Business name contains "TREE" → Tree Service
-  * Business name contains "CONCRETE" → Concrete
-  * Business name contains "PAINTING" → Painting
-  * Business name contains "FLOORING" → Flooring
-  * Business name contains "HANDYMAN" → Handyman
-
-- THEN look for these specific service keywords in the content (these are examples, not exhaustive):
-  * "roofing", "shingles", "roof", "roofer" → Roofing
-  * "plumbing", "pipe", "drain", "water heater", "plumber" → Plumbing  
-  * "electrical", "wiring", "outlet", "panel", "electrician" → Electrician
-  * "hvac", "heating", "cooling", "furnace", "ac", "air conditioning" → Heating and Cooling
-  * "flooring", "carpet", "hardwood", "tile", "floor" → Flooring
-  * "painting", "paint", "interior", "exterior" → Painting
-  * "landscaping", "lawn", "garden", "irrigation", "landscape" → Landscaping
-  * "concrete", "driveway", "patio", "foundation", "cement" → Concrete
-  * "window", "door", "glass" → Window/Door
-  * "kitchen", "bathroom", "remodel" → Bathroom/Kitchen Remodel
-  * "deck", "patio", "outdoor" → Decks & Patios
-  * "fence", "fencing" → Fence
-  * "fireplace", "chimney" → Fireplace
-  * "sprinkler", "irrigation" → Sprinklers
-  * "blind", "shade", "window treatment" → Blinds
-  * "awning", "patio cover", "carport" → Awning/Patio/Carport
-  * "storage", "closet", "shelving" → Storage & Closets
-  * "pool", "spa", "hot tub" → Pools and Spas
-  * "security", "alarm", "camera" → Security Systems
-  * "media", "audio", "video", "home theater" → Media Systems
-  * "tree", "tree service", "arborist" → Tree Service
-  * "handyman", "handy man" → Handyman
-
-- Base category on actual services mentioned, NOT business name
-- If multiple specific services are mentioned, choose the most prominent one
-- Only use "General Contractor" if no specific category applies
-- NEVER default to "HVAC Contractor" unless heating/cooling is the primary service
-- Provide very low confidence for directory sites, software platforms, or non-contractor website (0.0 score)
-- Look for residential keywords: "homeowners", "residential", "home services", "family"
-- Look for commercial keywords: "commercial", "business", "industrial", "corporate"
-- CRITICAL: If the website content does not match the business name or services, provide LOW confidence (under 0.2)
-- CRITICAL: If the website appears to be a hotel, restaurant, retail store, or other non-contractor business, provide LOW confidence
-- CRITICAL: Only provide high confidence if the website content clearly describes contractor services and has some sort of business name that matches
-- CRITICAL: Consider the validation results when setting confidence - more validation factors matched = higher confidence
-- CRITICAL: DETECT BUSINESS NAME MISMATCHES - If the website prominently mentions a different business name (like "Runland Painting" when searching for "A TEAM PAINTING"), this is a MAJOR RED FLAG and should result in very low confidence (0.1 or less)
-- CRITICAL: Look for business names in the website content that are different from the searched business name
-- CRITICAL: If the website belongs to a different business entirely, confidence should be 0.0-0.2
-
-Respond with valid JSON only.
 """
 
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=500,
-                temperature=0.2
-            )
-            
-            # Parse AI response
-            ai_response = response.choices[0].message.content.strip()
+            # Identical prompts (re-runs, duplicate listings) reuse the earlier answer
+            cache_key = hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).hexdigest()
+            ai_response = self._ai_analysis_cache.get(cache_key)
+            if ai_response is not None:
+                self._ai_analysis_cache.move_to_end(cache_key)
+            else:
+                # OpenAI GPT-4o-mini analysis (async client so other contractors keep running)
+                async with self.ai_semaphore:
+                    await self._wait_for_llm_slot()
+                    response = await self.openai_client.chat.completions.create(
+                        model="gpt-4o-mini",
+                        messages=[
+                            {"role": "system", "content": _CONTENT_ANALYSIS_INSTRUCTIONS},
+                            {"role": "user", "content": prompt}
+                        ],
+                        response_format={"type": "json_object"},
+                        max_tokens=500,
+                        temperature=0.2
+                    )
+                
+                # Parse AI response
+                ai_response = response.choices[0].message.content.strip()
             
             # Log AI response
             logger_ctx.log_ai_call("openai_gpt4_mini", {
@@ -1370,18 +1937,9 @@ Respond with valid JSON only.
             })
             
             try:
-                import json
-                import re
-                
-                # Clean the response - remove markdown code blocks if present
-                cleaned_response = ai_response.strip()
-                if cleaned_response.startswith('```json'):
-                    cleaned_response = cleaned_response[7:]  # Remove ```json
-                if cleaned_response.endswith('```'):
-                    cleaned_response = cleaned_response[:-3]  # Remove ```
-                cleaned_response = cleaned_response.strip()
-                
-                ai_data = json.loads(cleaned_response)
+                # JSON mode guarantees a bare object (no markdown fences); this only fails on truncation
+                ai_data = orjson.loads(ai_response)
+                self._cache_ai_analysis(cache_key, ai_response)
                 
                 category = ai_data.get('category', 'General Contractor')
                 confidence = float(ai_data.get('confidence', 0.5))
@@ -1416,15 +1974,16 @@ Respond with valid JSON only.
                 
                 return confidence
                 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.error(f"Failed to parse OpenAI response for {contractor.business_name}: {ai_response}")
-                return self._fallback_content_analysis(content, contractor.business_name, logger_ctx)
+                return self._fallback_content_analysis(content, contractor.business_name, logger_ctx, contractor.id)
             
         except Exception as e:
             logger.error(f"OpenAI analysis failed for {contractor.business_name}: {e}")
-            return self._fallback_content_analysis(content, contractor.business_name, logger_ctx)
+            return self._fallback_content_analysis(content, contractor.business_name, logger_ctx, contractor.id)
     
-    def _fallback_content_analysis(self, content: str, business_name: str, logger_ctx) -> float:
+    def _fallback_content_analysis(self, content: str, business_name: str, logger_ctx,
+                                   contractor_id: Optional[int] = None) -> float:
         """Fallback keyword-based analysis when OpenAI is not available"""
         content_lower = content.lower()
         business_name_lower = business_name.lower()
@@ -1432,43 +1991,24 @@ Respond with valid JSON only.
         confidence = 0.0
         
         # 1. Residential Focus Analysis (40% weight)
-        residential_keywords = [
-            'residential', 'home', 'house', 'family', 'residential services',
-            'home improvement', 'home repair', 'home maintenance', 'homeowner',
-            'residential contractor', 'home contractor', 'residential services'
-        ]
-        
         residential_score = 0.0
-        for keyword in residential_keywords:
+        for keyword in _RESIDENTIAL_KEYWORDS:
             if keyword in content_lower:
                 residential_score += 0.1
         residential_score = min(residential_score, 1.0)
         confidence += residential_score * 0.4
         
         # 2. Contractor Service Analysis (30% weight)
-        contractor_services = [
-            'plumbing', 'electrical', 'hvac', 'heating', 'cooling', 'roofing',
-            'painting', 'carpentry', 'landscaping', 'concrete', 'foundation',
-            'remodeling', 'renovation', 'repair', 'installation', 'maintenance',
-            'construction', 'contractor', 'contracting', 'home services'
-        ]
-        
         service_score = 0.0
-        for service in contractor_services:
+        for service in _CONTRACTOR_SERVICE_KEYWORDS:
             if service in content_lower:
                 service_score += 0.05
         service_score = min(service_score, 1.0)
         confidence += service_score * 0.3
         
         # 3. Business Legitimacy Analysis (20% weight)
-        legitimacy_keywords = [
-            'licensed', 'insured', 'bonded', 'certified', 'professional',
-            'experience', 'years', 'established', 'trusted', 'reliable',
-            'quality', 'warranty', 'guarantee', 'satisfaction', 'customer'
-        ]
-        
         legitimacy_score = 0.0
-        for keyword in legitimacy_keywords:
+        for keyword in _LEGITIMACY_KEYWORDS:
             if keyword in content_lower:
                 legitimacy_score += 0.05
         legitimacy_score = min(legitimacy_score, 1.0)
@@ -1479,7 +2019,7 @@ Respond with valid JSON only.
             confidence += 0.1
         
         # Determine category based on content analysis
-        category = self._determine_category_from_content(content.lower(), business_name.lower())
+        category = self._determine_category_from_content(content_lower, business_name_lower)
         
         # Store fallback analysis results
         fallback_analysis = {
@@ -1491,6 +2031,8 @@ Respond with valid JSON only.
             'reasoning': f'Fallback analysis: residential_score={residential_score:.2f}, service_score={service_score:.2f}, legitimacy_score={legitimacy_score:.2f}',
             'analysis_method': 'fallback_keyword_analysis'
         }
+        if contractor_id is not None:
+            self._fallback_categories[contractor_id] = category
         
         logger_ctx.log_classification(category, confidence)
         
@@ -1498,90 +2040,42 @@ Respond with valid JSON only.
     
     async def _comprehensive_website_validation(self, contractor: Contractor, content: str, logger_ctx) -> Dict[str, Any]:
         """Perform comprehensive website validation checks"""
-        validation_results = {
-            'business_name_match': False,
-            'keyword_business_name_match': False,
-            'license_match': False,
-            'phone_match': False,
-            'address_match': False,
-            'principal_name_match': False,
-            'details': {
-                'business_name': '',
-                'business_name_found': False,
-                'license': '',
-                'license_found': False,
-                'phone': '',
-                'phone_found': False,
-                'address': '',
-                'address_found': False,
-                'principal_name': '',
-                'principal_name_found': False
-            }
-        }
+        # Content analysis and the post-analysis log both validate the same re-crawled page
+        cache_key = (contractor.id, contractor.website_url, content)
+        cached = self._validation_cache.get(cache_key)
+        if cached is not None:
+            self._validation_cache.move_to_end(cache_key)
+            return cached
+        
+        # The factor checks are pure string scans that hold the GIL, so run them in the parser pool
+        loop = asyncio.get_running_loop()
+        validation_results = await loop.run_in_executor(
+            self._get_parser_pool(), _validate_page_content,
+            contractor.business_name, contractor.contractor_license_number, contractor.phone_number,
+            contractor.address1, contractor.primary_principal_name, contractor.website_url, content
+        )
         
-        content_lower = content.lower()
-        business_name_lower = contractor.business_name.lower()
-        
-        # 1. Business Name Matching (Factor 1)
-        business_name_match = self._advanced_business_name_matching(contractor.business_name, content)
-        keyword_business_name_match = self._keyword_business_name_matching(contractor.business_name, content)
-        
-        validation_results['business_name_match'] = business_name_match
-        validation_results['keyword_business_name_match'] = keyword_business_name_match
-        validation_results['details']['business_name'] = contractor.business_name
-        validation_results['details']['business_name_found'] = business_name_match or keyword_business_name_match
-        
-        # 2. License Number Matching (Factor 2)
-        if contractor.contractor_license_number:
-            license_match = self._license_matching(contractor.contractor_license_number, content)
-            validation_results['license_match'] = license_match
-            validation_results['details']['license'] = contractor.contractor_license_number
-            validation_results['details']['license_found'] = license_match
-        else:
-            validation_results['license_match'] = False
-            validation_results['details']['license'] = ''
-            validation_results['details']['license_found'] = False
-        
-        # 3. Phone Number Matching
-        validation_results['phone_match'] = self._phone_number_matching(contractor.phone_number, content)
-        validation_results['details']['phone'] = contractor.phone_number
-        validation_results['details']['phone_found'] = validation_results['phone_match']
-        
-        # 4. Address Matching (Factor 5)
-        validation_results['address_match'] = self._address_matching(contractor.address1, content)
-        validation_results['details']['address'] = contractor.address1
-        validation_results['details']['address_found'] = validation_results['address_match']
-        
-        # 5. Principal Name Matching (Factor 4)
-        validation_results['principal_name_match'] = self._principal_name_matching(contractor.primary_principal_name, content)
-        validation_results['details']['principal_name'] = contractor.primary_principal_name
-        validation_results['details']['principal_name_found'] = validation_results['principal_name_match']
-        
-        # 6. Domain Name Business Word Match (Factor 6)
-        domain_match_score = self._domain_business_name_matching(contractor.business_name, contractor.website_url)
-        validation_results['domain_match_score'] = domain_match_score
-        validation_results['details']['domain_match'] = domain_match_score > 0.0
-        validation_results['details']['domain_match_score'] = domain_match_score
-        
-        # 7. Contractor Keywords Analysis
-        contractor_keywords = [
-            'plumbing', 'electrical', 'hvac', 'heating', 'cooling', 'air conditioning',
-            'roofing', 'construction', 'remodeling', 'renovation', 'contractor',
-            'painting', 'flooring', 'landscaping', 'handyman', 'maintenance',
-            'repair', 'installation', 'service', 'professional', 'licensed'
-        ]
-        validation_results['contractor_keywords'] = sum(1 for keyword in contractor_keywords if keyword in content_lower)
+        self._validation_cache[cache_key] = validation_results
+        if len(self._validation_cache) > _VALIDATION_CACHE_SIZE:
+            self._validation_cache.popitem(last=False)
         
         return validation_results
     
-    def _advanced_business_name_matching(self, business_name: str, content: str) -> float:
+    @staticmethod
+    def _advanced_business_name_matching(business_name: str, content: str,
+                                         content_lower: Optional[str] = None,
+                                         content_tokens: Optional[set] = None) -> float:
         """Advanced business name matching with stricter validation"""
         # Clean business name
-        clean_name = re.sub(r'[^\w\s]', '', business_name).strip()
+        clean_name = _PUNCTUATION_RE.sub('', business_name).strip()
         words = clean_name.split()
         
+        # Lowercase the page once (unless the caller already has); it is searched once per name word below
+        if content_lower is None:
+            content_lower = content.lower()
+        
         if len(words) <= 1:
-            return 1.0 if clean_name.lower() in content.lower() else 0.0
+            return 1.0 if clean_name.lower() in content_lower else 0.0
         
         # For multi-word business names, require at least 50% of words to match
         # AND at least one word must be a significant business identifier
@@ -1593,24 +2087,27 @@ Respond with valid JSON only.
         for word in words:
             if len(word) > 2:  # Only consider words longer than 2 characters
                 # Skip common business suffixes
-                if word.upper() not in ['LLC', 'INC', 'CORP', 'CO', 'COMPANY', 'SERVICES', 'SERVICE']:
+                if word.upper() not in _GENERIC_NAME_WORDS:
                     significant_words.append(word)
         
-        # Check for word matches
+        # Check for word matches, searching the page once per distinct word. A word that is
+        # one of the page's tokens is certainly a substring, so only the rest need a scan
+        found_words = set()
         for word in words:
             if len(word) > 2:  # Only consider words longer than 2 characters
-                if word.lower() in content.lower():
+                word_lower = word.lower()
+                if (word in found_words
+                        or (content_tokens is not None and word_lower in content_tokens)
+                        or word_lower in content_lower):
+                    found_words.add(word)
                     matched_words += 1
         
         # Calculate base score
         base_score = matched_words / total_words if total_words > 0 else 0.0
         
         # Require at least one significant word to match for high confidence
-        significant_match = False
-        for word in significant_words:
-            if word.lower() in content.lower():
-                significant_match = True
-                break
+        # (significant words are a subset of the words searched above)
+        significant_match = any(word in found_words for word in significant_words)
         
         # If no significant words match, reduce confidence significantly
         if not significant_match and significant_words:
@@ -1622,140 +2119,109 @@ Respond with valid JSON only.
         
         return base_score
     
-    def _keyword_business_name_matching(self, business_name: str, content: str) -> float:
+    @staticmethod
+    def _keyword_business_name_matching(business_name: str, content: str,
+                                        content_tokens: Optional[set] = None) -> float:
         """Extract key business name components and match against content"""
         # Extract potential business name components
         business_words = business_name.split()
         
-        # Look for business name patterns in content
+        # Look for business name words in content
         # This is a simplified version - could be enhanced with NLP
-        business_patterns = [
-            r'\b' + re.escape(word) + r'\b' for word in business_words if len(word) > 2
-        ]
+        significant_words = [word for word in business_words if len(word) > 2]
+        if not significant_words:
+            return 0.0
         
-        matches = 0
-        total_patterns = len(business_patterns)
+        # One pass over the page: plain words are whole-word matches iff they are one of its \w+ tokens
+        if content_tokens is None:
+            content_tokens = _content_tokens(content.lower())
         
-        for pattern in business_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+        matches = 0
+        for word in significant_words:
+            if _WORD_TOKEN_RE.fullmatch(word):
+                if word.lower() in content_tokens:
+                    matches += 1
+            elif re.search(r'\b' + re.escape(word) + r'\b', content, re.IGNORECASE):
+                # Words with punctuation (e.g. "A-1") keep the original boundary search
                 matches += 1
         
-        return matches / total_patterns if total_patterns > 0 else 0.0
+        return matches / len(significant_words)
     
-    def _license_matching(self, license_number: str, content: str) -> bool:
+    @staticmethod
+    def _license_matching(license_number: str, content: str, content_lower: Optional[str] = None) -> bool:
         """Check if contractor license number appears in website content"""
         if not license_number:
             return False
         
         # Clean license number (remove common formatting)
-        clean_license = re.sub(r'[^\w]', '', license_number.upper())
-        
-        # Look for license number in content
-        content_upper = content.upper()
-        
-        # Direct match
-        if clean_license in content_upper:
-            return True
-        
-        # Look for license patterns
-        license_patterns = [
-            r'license[:\s]*' + re.escape(clean_license),
-            r'lic[:\s]*' + re.escape(clean_license),
-            r'contractor[:\s]*' + re.escape(clean_license)
-        ]
-        
-        for pattern in license_patterns:
-            if re.search(pattern, content_upper):
-                return True
+        clean_license = _NON_WORD_RE.sub('', license_number.lower())
         
-        return False
+        # Case-insensitive direct match (labelled forms like "License: X" contain X as well)
+        if content_lower is None:
+            content_lower = content.lower()
+        return clean_license in content_lower
     
-    def _phone_number_matching(self, phone_number: str, content: str) -> bool:
+    @staticmethod
+    def _phone_number_matching(phone_number: str, content: str) -> bool:
         """Check if contractor phone number appears in website content"""
         if not phone_number:
             return False
         
         # Normalize phone number (remove all non-digits)
-        clean_phone = re.sub(r'[^\d]', '', phone_number)
+        clean_phone = _digits_only(phone_number)
         
         # Must have at least 10 digits for a valid phone number
         if len(clean_phone) < 10:
             return False
         
-        # Normalize content (remove all non-digits)
-        content_digits = re.sub(r'[^\d]', '', content)
-        
-        # Look for full normalized phone number in content
-        if clean_phone in content_digits:
-            return True
-        
-        # Look for phone patterns with full number
-        phone_patterns = [
-            r'phone[:\s]*' + re.escape(phone_number),
-            r'tel[:\s]*' + re.escape(phone_number),
-            r'call[:\s]*' + re.escape(phone_number),
-            r'contact[:\s]*' + re.escape(phone_number)
-        ]
-        
-        for pattern in phone_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
-        
-        return False
+        # Look for full normalized phone number in the page's digit stream. This covers
+        # labelled forms ("Phone: ...") too: any literal occurrence of the number leaves
+        # its digits contiguous here, so no second regex scan of the page is needed
+        return clean_phone in _digits_only(content)
     
-    def _address_matching(self, address: str, content: str) -> bool:
+    @staticmethod
+    def _address_matching(address: str, content: str, content_lower: Optional[str] = None,
+                          content_tokens: Optional[set] = None) -> bool:
         """Check if contractor address appears in website content"""
         if not address:
             return False
         
         # Clean address (remove common formatting)
-        clean_address = re.sub(r'[^\w\s,.]', '', address.upper())
+        clean_address = _ADDRESS_NOISE_RE.sub('', address.lower())
         
-        # Look for address in content
-        content_upper = content.upper()
+        # Case-insensitive checks all run against one shared lowercase copy of the page
+        if content_lower is None:
+            content_lower = content.lower()
         
         # Direct match
-        if clean_address in content_upper:
+        if clean_address in content_lower:
             return True
         
-        # Look for address patterns
-        address_patterns = [
-            r'\b' + re.escape(word) + r'\b' for word in clean_address.split() if len(word) > 2
-        ]
-        
-        for pattern in address_patterns:
-            if re.search(pattern, content_upper):
+        # Look for any significant address word. Plain words are whole-word matches iff they
+        # are page tokens; only words carrying '.' or ',' need the \b-anchored regex pass
+        address_words = [word for word in clean_address.split() if len(word) > 2]
+        if content_tokens is not None:
+            if any(word in content_tokens for word in address_words):
                 return True
-        
-        # Puget Sound region indicators (counties, cities, regions)
-        puget_sound_indicators = [
-            'KING COUNTY', 'PIERCE COUNTY', 'SNOHOMISH COUNTY', 'KITSAP COUNTY',
-            'SEATTLE', 'TACOMA', 'BELLEVUE', 'EVERETT', 'KENT', 'RENTON', 
-            'FEDERAL WAY', 'KIRKLAND', 'BELLINGHAM', 'KENNEWICK', 'AUBURN',
-            'MARYSVILLE', 'LAKEWOOD', 'REDMOND', 'SHORELINE', 'RICHLAND', 'OLYMPIA',
-            'LACEY', 'EDMONDS', 'BURIEN', 'BOTHELL', 'LYNNWOOD', 'LONGVIEW',
-            'WENATCHEE', 'MOUNT VERNON', 'CENTRALIA', 'ANACORTES', 'UNIVERSITY PLACE', 
-            'MUKILTEO', 'TUKWILA', 'BREMERTON', 'CHEHALIS', 'PORT ORCHARD',
-            'MAPLE VALLEY', 'OAK HARBOR', 'FERNDALE', 'MOUNTLAKE TERRACE',
-            'PUGET SOUND', 'GREATER SEATTLE', 'SEATTLE AREA', 'TACOMA AREA',
-            'SERVING SEATTLE', 'SERVING TACOMA', 'SERVING BELLEVUE',
-            'PACIFIC NORTHWEST', 'PNW', 'NORTHWESTERN', 'WA LICENSE'
-        ]
-        
-        # Check if any Puget Sound indicators are present in content
-        for indicator in puget_sound_indicators:
-            if indicator in content_upper:
+            address_words = [word for word in address_words if not _WORD_TOKEN_RE.fullmatch(word)]
+        if address_words:
+            address_pattern = r'\b(?:' + '|'.join(re.escape(word) for word in address_words) + r')\b'
+            if re.search(address_pattern, content_lower):
                 return True
         
-        return False
+        # Check if any Puget Sound indicators are present in content
+        return any(indicator in content_lower for indicator in _PUGET_SOUND_INDICATORS_LOWER)
     
-    def _principal_name_matching(self, principal_name: str, content: str) -> bool:
+    @staticmethod
+    def _principal_name_matching(principal_name: str, content: str, content_lower: Optional[str] = None,
+                                 content_tokens: Optional[set] = None) -> bool:
         """Check if principal name (e.g., owner, manager) appears in website content"""
         if not principal_name:
             return False
         
         # Convert content to lowercase for case-insensitive matching
-        content_lower = content.lower()
+        if content_lower is None:
+            content_lower = content.lower()
         
         # Parse principal name format: "Last, First Middle" -> "First Last"
         # Handle various formats: "Last, First", "Last, First M", "First Last", etc.
@@ -1771,64 +2237,41 @@ Respond with valid JSON only.
             reformatted_name = f"{first_name} {last_name}".strip()
             
             # Clean and convert to lowercase
-            clean_reformatted = re.sub(r'[^\w\s]', '', reformatted_name).strip().lower()
+            clean_reformatted = _PUNCTUATION_RE.sub('', reformatted_name).strip().lower()
             
             # Check for reformatted name match
             if clean_reformatted in content_lower:
                 return True
             
             # Also check individual words from reformatted name
-            reformatted_words = clean_reformatted.split()
-            for word in reformatted_words:
-                if len(word) > 2:  # Only match words longer than 2 characters
-                    pattern = r'\b' + re.escape(word) + r'\b'
-                    if re.search(pattern, content_lower):
-                        return True
+            return _any_name_word_in(clean_reformatted.split(), content_lower, content_tokens)
         else:
             # Original format (no comma) - try as is
-            clean_principal = re.sub(r'[^\w\s]', '', principal_name).strip().lower()
+            clean_principal = _PUNCTUATION_RE.sub('', principal_name).strip().lower()
             
             # Direct match (case insensitive)
             if clean_principal in content_lower:
                 return True
             
-            # Split principal name into words and look for individual word matches
-            principal_words = clean_principal.split()
-            
-            # Look for principal name patterns (individual words)
-            for word in principal_words:
-                if len(word) > 2:  # Only match words longer than 2 characters
-                    # Look for word boundaries to avoid partial matches
-                    pattern = r'\b' + re.escape(word) + r'\b'
-                    if re.search(pattern, content_lower):
-                        return True
+            # Look for individual principal name words
+            return _any_name_word_in(clean_principal.split(), content_lower, content_tokens)
         
         return False
     
-    def _domain_business_name_matching(self, business_name: str, website_url: str) -> float:
+    @staticmethod
+    def _domain_business_name_matching(business_name: str, website_url: str) -> float:
         """Calculate domain name matching score for business name words"""
         if not website_url:
             return 0.0
         
         # Extract domain from URL
         try:
-            from urllib.parse import urlparse
             parsed_url = urlparse(website_url)
             domain = parsed_url.netloc.lower()
-        except:
+        except ValueError:
             return 0.0
         
-        # Clean business name and extract words
-        import re
-        clean_name = re.sub(r'[^\w\s]', '', business_name).strip()
-        business_words = clean_name.split()
-        
-        # Filter out common business suffixes and short words
-        significant_words = []
-        for word in business_words:
-            if len(word) > 2 and word.upper() not in ['LLC', 'INC', 'CORP', 'CO', 'COMPANY', 'SERVICES', 'SERVICE']:
-                significant_words.append(word.lower())
-        
+        significant_words = _significant_name_words(business_name)
         if not significant_words:
             return 0.0
         
@@ -1846,14 +2289,13 @@ Respond with valid JSON only.
         # Cap at 0.20 (2 words max for domain bonus)
         final_score = min(score, 0.20)
         
-        # Debug logging
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"Domain matching for {business_name} -> {website_url}")
-        logger.info(f"  Domain: {domain}")
-        logger.info(f"  Business words: {significant_words}")
-        logger.info(f"  Matched words: {matched_word_list}")
-        logger.info(f"  Score: {final_score}")
+        # Debug logging (runs once per validated page, so skip the formatting when INFO is off)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Domain matching for %s -> %s", business_name, website_url)
+            logger.info("  Domain: %s", domain)
+            logger.info("  Business words: %s", list(significant_words))
+            logger.info("  Matched words: %s", matched_word_list)
+            logger.info("  Score: %s", final_score)
         
         return final_score
     
@@ -1893,36 +2335,27 @@ Respond with valid JSON only.
         
         return max(confidence, 0.0)  # Ensure non-negative
     
-    def _determine_category_from_content(self, content: str, business_name: str) -> str:
-        """Determine contractor category from website content"""
-        content_lower = content.lower()
-        
-        # Category keywords mapping
-        category_keywords = {
-            'Electrical Contractor': ['electrical', 'electrician', 'wiring', 'electrical contractor'],
-            'Plumbing Contractor': ['plumbing', 'plumber', 'pipe', 'drain', 'sewer'],
-            'HVAC Contractor': ['hvac', 'heating', 'cooling', 'air conditioning', 'furnace', 'ac'],
-            'Roofing Contractor': ['roofing', 'roof', 'shingle', 'gutter'],
-            'General Contractor': ['construction', 'remodeling', 'renovation', 'general contractor']
-        }
-        
+    def _determine_category_from_content(self, content_lower: str, business_name: str) -> str:
+        """Determine contractor category from already-lowercased website content"""
         # Check for category matches
-        for category, keywords in category_keywords.items():
+        for category, keywords in _CATEGORY_KEYWORDS:
             if any(keyword in content_lower for keyword in keywords):
                 return category
         
         # Default to General Contractor if no specific category found
         return 'General Contractor'
     
-    async def process_contractor(self, contractor: Contractor) -> Contractor:
+    async def process_contractor(self, contractor: Contractor, mark_processing: bool = True,
+                                 save: bool = True, processed_at: Optional[datetime] = None) -> Contractor:
         """Process a single contractor with discovery"""
         with contractor_logger.contractor_processing(contractor.id, contractor.business_name) as logger_ctx:
             try:
                 # Increment processing attempts
                 contractor.processing_attempts = (contractor.processing_attempts or 0) + 1
                 
-                # Update status to processing
-                await self.update_contractor_status(contractor.id, 'processing')
+                # Update status to processing (process_batch already did this for the whole batch)
+                if mark_processing:
+                    await self.update_contractor_status(contractor.id, 'processing')
                 
                 # Step 1: Website Discovery (returns confidence score)
                 try:
@@ -1931,7 +2364,8 @@ Respond with valid JSON only.
                     # Quota exceeded - mark contractor as failed and re-raise
                     contractor.processing_status = 'failed'
                     contractor.error_message = 'Daily Google API quota exceeded'
-                    await self.update_contractor(contractor)
+                    if save:
+                        await self.update_contractor(contractor)
                     logger_ctx.error("Daily Google API quota exceeded - stopping processing")
                     raise QuotaExceededError("Daily Google API quota exceeded")
                 
@@ -1999,6 +2433,8 @@ Respond with valid JSON only.
                 ai_category = None
                 ai_residential_focus = None
                 ai_reasoning = None
+                # Category the keyword fallback picked during this run, if it ran
+                fallback_category = self._fallback_categories.pop(contractor.id, None)
                 if contractor.data_sources and 'ai_analysis' in contractor.data_sources:
                     ai_analysis = contractor.data_sources['ai_analysis']
                     ai_category = ai_analysis.get('category')
@@ -2007,6 +2443,9 @@ Respond with valid JSON only.
                 
                 if ai_category:
                     contractor.mailer_category = ai_category
+                elif fallback_category:
+                    # The keyword fallback already categorised this page; don't lowercase and scan it again
+                    contractor.mailer_category = fallback_category
                 else:
                     contractor.mailer_category = self._determine_category_from_content(
                         contractor.data_sources.get('crawled_content', '').lower() if contractor.data_sources else '',
@@ -2021,13 +2460,15 @@ Respond with valid JSON only.
                 if ai_reasoning:
                     contractor.business_description = ai_reasoning
                 
-                contractor.last_processed = datetime.utcnow()
+                # process_batch stamps its whole batch with one shared timestamp
+                contractor.last_processed = processed_at or datetime.utcnow()
                 
                 # Log final result
                 logger_ctx.log_final_result(overall_confidence, contractor.processing_status)
                 
-                # Save results
-                await self.update_contractor(contractor)
+                # Save results (process_batch writes the whole batch at once instead)
+                if save:
+                    await self.update_contractor(contractor)
                 
                 return contractor
                 
@@ -2036,7 +2477,8 @@ Respond with valid JSON only.
                 logger.error(f"Error processing contractor {contractor.business_name}: {error_msg}")
                 contractor.processing_status = 'error'
                 contractor.error_message = error_msg
-                await self.update_contractor(contractor)
+                if save:
+                    await self.update_contractor(contractor)
                 
                 # Log error in logging
                 logger_ctx.log_final_result(0.0, 'error', error_msg)
@@ -2051,36 +2493,35 @@ Respond with valid JSON only.
         """
         await db_pool.execute(query, status, contractor_id)
     
-    async def update_contractor(self, contractor: Contractor):
-        """Update contractor with processing results"""
+    async def update_contractors_status(self, contractor_ids: List[int], status: str):
+        """Update processing status for many contractors in a single round-trip"""
         query = """
         UPDATE contractors 
-        SET 
-            processing_status = $1,
-            confidence_score = $2,
-            website_confidence = $3,
-            classification_confidence = $4,
-            mailer_category = $5,
-            website_url = $6,
-            website_status = $7,
-            data_sources = $8,
-            last_processed = $9,
-            error_message = $10,
-            review_status = $11,
-            residential_focus = $12,
-            business_description = $13,
-            gpt4mini_analysis = $14,
-            gpt4_verification = $15,
-            website_content_hash = $16,
-            processing_attempts = $17,
-            updated_at = NOW()
-        WHERE id = $18
+        SET processing_status = $1, updated_at = NOW()
+        WHERE id = ANY($2::int[])
         """
+        await db_pool.execute(query, status, contractor_ids)
+    
+    async def reset_stale_processing(self, older_than_minutes: int) -> int:
+        """Return contractors left in 'processing' by an interrupted run to 'pending'
         
+        Only rows marked processing more than `older_than_minutes` ago are reset, so contractors
+        another live run is still working on are left alone. Returns the number of rows reset.
+        """
+        query = """
+        UPDATE contractors 
+        SET processing_status = 'pending', updated_at = NOW()
+        WHERE processing_status = 'processing'
+        AND updated_at < NOW() - make_interval(mins => $1)
+        """
+        status = await db_pool.execute(query, older_than_minutes)
+        return int(status.split()[-1])
+    
+    def _contractor_update_args(self, contractor: Contractor) -> tuple:
+        """Build the parameter tuple for _UPDATE_CONTRACTOR_QUERY"""
         # Generate content hash if we have crawled content
         content_hash = None
         if contractor.data_sources and 'crawled_content' in contractor.data_sources:
-            import hashlib
             content = contractor.data_sources['crawled_content']
             content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
         
@@ -2092,8 +2533,7 @@ Respond with valid JSON only.
         # For now, gpt4_verification is not implemented, but we'll save the structure
         gpt4_verification = None
         
-        await db_pool.execute(
-            query,
+        return (
             contractor.processing_status,
             contractor.confidence_score,
             contractor.website_confidence,
@@ -2101,39 +2541,73 @@ Respond with valid JSON only.
             contractor.mailer_category,
             contractor.website_url,
             contractor.website_status,
-            json.dumps(contractor.data_sources) if contractor.data_sources else None,
+            orjson.dumps(contractor.data_sources).decode() if contractor.data_sources else None,
             contractor.last_processed,
             contractor.error_message,
             contractor.review_status,
             contractor.residential_focus,
             contractor.business_description,
-            json.dumps(gpt4mini_analysis) if gpt4mini_analysis else None,
-            json.dumps(gpt4_verification) if gpt4_verification else None,
+            orjson.dumps(gpt4mini_analysis).decode() if gpt4mini_analysis else None,
+            orjson.dumps(gpt4_verification).decode() if gpt4_verification else None,
             content_hash,
             contractor.processing_attempts,
             contractor.id
         )
     
+    async def update_contractor(self, contractor: Contractor):
+        """Update contractor with processing results"""
+        await db_pool.execute(_UPDATE_CONTRACTOR_QUERY, *self._contractor_update_args(contractor))
+    
+    async def update_contractors(self, contractors: List[Contractor]):
+        """Update many contractors with processing results in a single executemany round-trip"""
+        if not contractors:
+            return
+        await db_pool.execute_many(
+            _UPDATE_CONTRACTOR_QUERY,
+            [self._contractor_update_args(contractor) for contractor in contractors]
+        )
+    
     async def get_pending_contractors(self, limit: int = None) -> List[Contractor]:
         """Get contractors with pending processing status"""
+        # Constant SQL with a bound LIMIT lets asyncpg reuse its cached prepared statement;
+        # LIMIT NULL means no limit
         query = """
         SELECT * FROM contractors 
         WHERE processing_status = 'pending' 
         ORDER BY created_at ASC
+        LIMIT $1
         """
         
-        if limit:
-            query += f" LIMIT {limit}"
-            
-        rows = await db_pool.fetch(query)
+        rows = await db_pool.fetch(query, limit or None)
         
         contractors = []
         for row in rows:
-            contractor = Contractor.from_dict(dict(row))
+            contractor = Contractor.from_dict(row)
             contractors.append(contractor)
             
         return contractors
     
+    async def get_contractors_by_names(self, names: List[str]) -> List[Optional[Contractor]]:
+        """Look up the first contractor whose business name contains each of `names` (case-insensitive)
+        
+        One round-trip for all names; each lookup can use the business_name trigram index.
+        Returns one entry per name, in order, with None where nothing matched.
+        """
+        query = """
+        SELECT p.ord, c.*
+        FROM unnest($1::text[]) WITH ORDINALITY AS p(pattern, ord)
+        CROSS JOIN LATERAL (
+            SELECT * FROM contractors 
+            WHERE business_name ILIKE p.pattern
+            LIMIT 1
+        ) c
+        """
+        
+        rows = await db_pool.fetch(query, [f'%{name}%' for name in names])
+        
+        found = {row['ord']: Contractor.from_dict(row) for row in rows}
+        return [found.get(i) for i in range(1, len(names) + 1)]
+    
     async def get_processing_stats(self) -> Dict[str, Any]:
         """Get processing statistics"""
         query = """
@@ -2163,15 +2637,27 @@ Respond with valid JSON only.
         completed = 0
         errors = 0
         
-        # Process contractors sequentially to avoid logging intermixing
-        for contractor in contractors:
-            try:
-                await self.process_contractor(contractor)
-                completed += 1
-            except Exception as e:
+        # Mark the whole batch as processing in one query instead of one UPDATE per contractor
+        await self.update_contractors_status([contractor.id for contractor in contractors], 'processing')
+        
+        # Process contractors concurrently - contractor logs are buffered per task, so they don't intermix
+        processed_at = datetime.utcnow()
+        results = await asyncio.gather(
+            *(self.process_contractor(contractor, mark_processing=False, save=False, processed_at=processed_at)
+              for contractor in contractors),
+            return_exceptions=True
+        )
+        
+        # Write every result back in one batched UPDATE rather than one round-trip per contractor
+        await self.update_contractors(contractors)
+        
+        for contractor, result in zip(contractors, results):
+            if isinstance(result, Exception):
                 business_name = contractor.business_name if contractor else 'Unknown'
-                logger.error(f"Error processing {business_name}: {e}")
+                logger.error(f"Error processing {business_name}: {result}")
                 errors += 1
+            else:
+                completed += 1
         
         manual_review = len(contractors) - completed - errors
         
@@ -2188,3 +2674,92 @@ Respond with valid JSON only.
         """Close the service and cleanup resources"""
         if self.session and not self.session.closed:
             await self.session.close()
+        if self._parser_pool is not None:
+            self._parser_pool.shutdown(wait=False, cancel_futures=True)
+            self._parser_pool = None
+        if self._parser_log_listener is not None:
+            self._parser_log_listener.stop()
+            self._parser_log_listener = None
+        if self._search_cache is not None:
+            self._search_cache.close()
+            self._search_cache = None
+
+
+def _validate_page_content(business_name: str, license_number: Optional[str], phone_number: Optional[str],
+                           address: Optional[str], principal_name: Optional[str], website_url: Optional[str],
+                           content: str) -> Dict[str, Any]:
+    """Run every website validation factor against one page; pure, so it can run in the parser pool"""
+    validation_results = {
+        'business_name_match': False,
+        'keyword_business_name_match': False,
+        'license_match': False,
+        'phone_match': False,
+        'address_match': False,
+        'principal_name_match': False,
+        'details': {
+            'business_name': '',
+            'business_name_found': False,
+            'license': '',
+            'license_found': False,
+            'phone': '',
+            'phone_found': False,
+            'address': '',
+            'address_found': False,
+            'principal_name': '',
+            'principal_name_found': False
+        }
+    }
+    
+    # Lowercase and tokenise the page once; the name matchers below all reuse them
+    content_lower = content.lower()
+    content_tokens = _content_tokens(content_lower)
+    
+    # 1. Business Name Matching (Factor 1)
+    business_name_match = ContractorService._advanced_business_name_matching(
+        business_name, content, content_lower, content_tokens
+    )
+    keyword_business_name_match = ContractorService._keyword_business_name_matching(business_name, content, content_tokens)
+    
+    validation_results['business_name_match'] = business_name_match
+    validation_results['keyword_business_name_match'] = keyword_business_name_match
+    validation_results['details']['business_name'] = business_name
+    validation_results['details']['business_name_found'] = business_name_match or keyword_business_name_match
+    
+    # 2. License Number Matching (Factor 2)
+    if license_number:
+        license_match = ContractorService._license_matching(license_number, content, content_lower)
+        validation_results['license_match'] = license_match
+        validation_results['details']['license'] = license_number
+        validation_results['details']['license_found'] = license_match
+    else:
+        validation_results['license_match'] = False
+        validation_results['details']['license'] = ''
+        validation_results['details']['license_found'] = False
+    
+    # 3. Phone Number Matching
+    validation_results['phone_match'] = ContractorService._phone_number_matching(phone_number, content)
+    validation_results['details']['phone'] = phone_number
+    validation_results['details']['phone_found'] = validation_results['phone_match']
+    
+    # 4. Address Matching (Factor 5)
+    validation_results['address_match'] = ContractorService._address_matching(address, content, content_lower, content_tokens)
+    validation_results['details']['address'] = address
+    validation_results['details']['address_found'] = validation_results['address_match']
+    
+    # 5. Principal Name Matching (Factor 4)
+    validation_results['principal_name_match'] = ContractorService._principal_name_matching(
+        principal_name, content, content_lower, content_tokens
+    )
+    validation_results['details']['principal_name'] = principal_name
+    validation_results['details']['principal_name_found'] = validation_results['principal_name_match']
+    
+    # 6. Domain Name Business Word Match (Factor 6)
+    domain_match_score = ContractorService._domain_business_name_matching(business_name, website_url)
+    validation_results['domain_match_score'] = domain_match_score
+    validation_results['details']['domain_match'] = domain_match_score > 0.0
+    validation_results['details']['domain_match_score'] = domain_match_score
+    
+    # 7. Contractor Keywords Analysis
+    validation_results['contractor_keywords'] = sum(1 for keyword in _VALIDATION_CONTRACTOR_KEYWORDS if keyword in content_lower)
+    
+    return validation_results
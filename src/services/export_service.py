@@ -13,6 +13,19 @@ from ..config import config
 
 logger = logging.getLogger(__name__)
 
+# Columns for full export
+_FULL_EXPORT_COLUMNS = (
+    'id', 'business_name', 'phone_number', 'address1', 'address2', 'city', 'state', 'zip',
+    'website_url', 'confidence_score', 'residential_focus', 'mailer_category',
+    'contractor_license_type_code_desc', 'processing_status', 'last_processed'
+)
+
+# Columns for summary export (a subset of the full export columns)
+_SUMMARY_EXPORT_COLUMNS = (
+    'business_name', 'phone_number', 'address1', 'address2', 'city', 'state', 'website_url',
+    'confidence_score', 'residential_focus', 'mailer_category'
+)
+
 
 class ExportService:
     """Service for exporting processed contractor data to CSV"""
@@ -22,9 +35,12 @@ class ExportService:
         self.export_dir.mkdir(exist_ok=True)
     
     async def get_exportable_contractors(self, limit: int = None) -> List[Contractor]:
-        """Get contractors ready for export (completed or approved)"""
-        query = """
-        SELECT * FROM contractors 
+        """Get contractors ready for export (completed or approved)
+        
+        Only the exported columns are loaded; crawl data and AI analysis stay in the database.
+        """
+        query = f"""
+        SELECT {', '.join(_FULL_EXPORT_COLUMNS)} FROM contractors 
         WHERE processing_status IN ('completed', 'approved')
         AND (exported_at IS NULL OR exported_at < updated_at)
         ORDER BY confidence_score DESC, updated_at ASC
@@ -37,7 +53,7 @@ class ExportService:
         
         contractors = []
         for row in rows:
-            contractor = Contractor.from_dict(dict(row))
+            contractor = Contractor.from_dict(row)
             contractors.append(contractor)
             
         logger.info(f"Found {len(contractors)} contractors ready for export")
@@ -104,12 +120,7 @@ class ExportService:
         filename = f"{filename_prefix}_full_{timestamp}.csv"
         filepath = self.export_dir / filename
         
-        # Define columns for full export
-        columns = [
-            'id', 'business_name', 'phone_number', 'address1', 'address2', 'city', 'state', 'zip',
-            'website_url', 'confidence_score', 'residential_focus', 'mailer_category',
-            'contractor_license_type_code_desc', 'processing_status', 'last_processed'
-        ]
+        columns = _FULL_EXPORT_COLUMNS
         
         logger.info(f"Exporting {len(contractors)} contractors to {filename}")
         
@@ -143,11 +154,7 @@ class ExportService:
         filename = f"{filename_prefix}_summary_{timestamp}.csv"
         filepath = self.export_dir / filename
         
-        # Define columns for summary export
-        columns = [
-            'business_name', 'phone_number', 'address1', 'address2', 'city', 'state', 'website_url', 
-            'confidence_score', 'residential_focus', 'mailer_category'
-        ]
+        columns = _SUMMARY_EXPORT_COLUMNS
         
         logger.info(f"Creating summary export with {len(contractors)} contractors to {filename}")
         
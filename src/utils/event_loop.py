@@ -0,0 +1,19 @@
+"""
+Event loop setup shared by the command-line entry points
+"""
+import sys
+
+
+def install_event_loop():
+    """Use uvloop for asyncio.run() when it is available
+
+    uvloop is a faster drop-in event loop; it has no Windows build, so it stays optional
+    and the default asyncio loop is used without it.
+    """
+    if sys.platform == 'win32':
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
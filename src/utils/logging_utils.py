@@ -4,6 +4,7 @@ Enhanced logging utilities for contractor processing pipeline
 import json
 import logging
 import logging.handlers
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, List
@@ -11,6 +12,13 @@ from dataclasses import dataclass, asdict
 import asyncio
 from contextlib import contextmanager
 
+import orjson
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize a log entry with orjson (stringifying anything it can't encode natively)"""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 @dataclass
 class ContractorProcessingLog:
@@ -77,8 +85,9 @@ class ContractorLogger:
             'completed': 0,
             'errors': 0,
             'manual_review': 0,
-            'start_time': datetime.utcnow()
+            'start_time': datetime.utcnow()  # Human-readable only; durations use the monotonic clock
         }
+        self._start_monotonic = time.monotonic()
     
     def _setup_json_logger(self) -> logging.Logger:
         """Setup JSON structured logger with rotation"""
@@ -101,8 +110,8 @@ class ContractorLogger:
         class JSONFormatter(logging.Formatter):
             def format(self, record):
                 if hasattr(record, 'contractor_data'):
-                    return json.dumps(record.contractor_data, default=str)
-                return json.dumps({
+                    return _json_dumps(record.contractor_data)
+                return _json_dumps({
                     'timestamp': datetime.utcnow().isoformat(),
                     'level': record.levelname,
                     'message': record.getMessage(),
@@ -229,7 +238,7 @@ class ContractorLogger:
             'business_name': log.business_name,
             'timestamp': log.processing_start.isoformat()
         }
-        task_storage['log_buffer'].append(f"JSON_LOG: {json.dumps(json_log_entry)}")
+        task_storage['log_buffer'].append(f"JSON_LOG: {_json_dumps(json_log_entry)}")
     
     def _log_contractor_complete(self):
         """Log contractor processing completion"""
@@ -266,7 +275,7 @@ class ContractorLogger:
         for log_line in task_storage['log_buffer']:
             if log_line.startswith("JSON_LOG: "):
                 # Extract and log JSON data
-                json_data = json.loads(log_line[10:])  # Remove "JSON_LOG: " prefix
+                json_data = orjson.loads(log_line[10:])  # Remove "JSON_LOG: " prefix
                 self.json_logger.info("", extra={'contractor_data': json_data})
             else:
                 # Log human-readable output
@@ -277,7 +286,7 @@ class ContractorLogger:
             'event': 'contractor_complete',
             **log.to_dict()
         }
-        task_storage['log_buffer'].append(f"JSON_LOG: {json.dumps(json_log_entry)}")
+        task_storage['log_buffer'].append(f"JSON_LOG: {_json_dumps(json_log_entry)}")
     
     def log_search_query(self, query: str):
         """Log search query"""
@@ -299,7 +308,7 @@ class ContractorLogger:
             'query': query,
             'timestamp': datetime.utcnow().isoformat()
         }
-        task_storage['log_buffer'].append(f"JSON_LOG: {json.dumps(json_log_entry)}")
+        task_storage['log_buffer'].append(f"JSON_LOG: {_json_dumps(json_log_entry)}")
     
     def log_search_results(self, results: List[Dict[str, Any]]):
         """Log search results"""
@@ -326,7 +335,7 @@ class ContractorLogger:
             'results': results,
             'timestamp': datetime.utcnow().isoformat()
         }
-        task_storage['log_buffer'].append(f"JSON_LOG: {json.dumps(json_log_entry)}")
+        task_storage['log_buffer'].append(f"JSON_LOG: {_json_dumps(json_log_entry)}")
     
     def log_validation_results(self, url: str, validation_results: Dict[str, Any], confidence: float):
         """Log 5-factor validation results for a website"""
@@ -373,7 +382,7 @@ class ContractorLogger:
             'confidence': confidence,
             'timestamp': datetime.utcnow().isoformat()
         }
-        task_storage['log_buffer'].append(f"JSON_LOG: {json.dumps(json_log_entry)}")
+        task_storage['log_buffer'].append(f"JSON_LOG: {_json_dumps(json_log_entry)}")
     
     def log_validation_failed(self, url: str, confidence: float, reason: str):
         """Log validation failure for a website"""
@@ -396,7 +405,7 @@ class ContractorLogger:
             'reason': reason,
             'timestamp': datetime.utcnow().isoformat()
         }
-        task_storage['log_buffer'].append(f"JSON_LOG: {json.dumps(json_log_entry)}")
+        task_storage['log_buffer'].append(f"JSON_LOG: {_json_dumps(json_log_entry)}")
     
     def log_website_evaluation(self, url: str, source: str, confidence: float, reason: str = ""):
         """Log website evaluation during selection process"""
@@ -422,7 +431,7 @@ class ContractorLogger:
             'reason': reason,
             'timestamp': datetime.utcnow().isoformat()
         }
-        task_storage['log_buffer'].append(f"JSON_LOG: {json.dumps(json_log_entry)}")
+        task_storage['log_buffer'].append(f"JSON_LOG: {_json_dumps(json_log_entry)}")
     
     def log_ai_call(self, tool_name: str, input_data: Dict[str, Any], output_data: Dict[str, Any] = None):
         """Log AI tool call"""
@@ -452,7 +461,7 @@ class ContractorLogger:
             'business_name': log.business_name,
             'ai_call': ai_call
         }
-        task_storage['log_buffer'].append(f"JSON_LOG: {json.dumps(json_log_entry)}")
+        task_storage['log_buffer'].append(f"JSON_LOG: {_json_dumps(json_log_entry)}")
     
     def log_website_selection(self, website: str, confidence: float):
         """Log website selection"""
@@ -478,7 +487,7 @@ class ContractorLogger:
             'confidence': confidence,
             'timestamp': datetime.utcnow().isoformat()
         }
-        task_storage['log_buffer'].append(f"JSON_LOG: {json.dumps(json_log_entry)}")
+        task_storage['log_buffer'].append(f"JSON_LOG: {_json_dumps(json_log_entry)}")
     
     def log_classification(self, category: str, confidence: float):
         """Log classification results"""
@@ -504,7 +513,7 @@ class ContractorLogger:
             'confidence': confidence,
             'timestamp': datetime.utcnow().isoformat()
         }
-        task_storage['log_buffer'].append(f"JSON_LOG: {json.dumps(json_log_entry)}")
+        task_storage['log_buffer'].append(f"JSON_LOG: {_json_dumps(json_log_entry)}")
     
     def log_final_result(self, confidence_score: float, processing_status: str, error_message: str = None):
         """Log final processing result"""
@@ -535,7 +544,7 @@ class ContractorLogger:
             'error_message': error_message,
             'timestamp': datetime.utcnow().isoformat()
         }
-        task_storage['log_buffer'].append(f"JSON_LOG: {json.dumps(json_log_entry)}")
+        task_storage['log_buffer'].append(f"JSON_LOG: {_json_dumps(json_log_entry)}")
     
     def log_batch_progress(self, batch_number: int, total_processed: int, batch_results: Dict[str, int]):
         """Log batch processing progress"""
@@ -596,11 +605,11 @@ class ContractorLogger:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get current processing statistics"""
-        duration = datetime.utcnow() - self.stats['start_time']
+        elapsed = time.monotonic() - self._start_monotonic
         return {
             **self.stats,
-            'duration_seconds': duration.total_seconds(),
-            'records_per_minute': (self.stats['total_processed'] / max(duration.total_seconds() / 60, 1))
+            'duration_seconds': elapsed,
+            'records_per_minute': (self.stats['total_processed'] / max(elapsed / 60, 1))
         }
 
 
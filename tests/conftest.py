@@ -0,0 +1,36 @@
+"""
+Shared fixtures for the contractor enrichment tests
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src and scripts to path
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / 'scripts'))
+
+from src.config import config
+from src.services.contractor_service import ContractorService
+
+
+@pytest.fixture
+def make_service(monkeypatch):
+    """Build ContractorService instances without a real OpenAI key; all are closed after the test
+
+    A factory rather than a ready-made service, so tests can patch config (which the
+    constructor reads) before building one.
+    """
+    monkeypatch.setattr(config, 'OPENAI_API_KEY', config.OPENAI_API_KEY or 'test-key')
+    services = []
+
+    def make() -> ContractorService:
+        service = ContractorService()
+        services.append(service)
+        return service
+
+    yield make
+
+    for service in services:
+        asyncio.run(service.close())
@@ -78,6 +78,20 @@ def test_required_packages():
     
     return True
 
+def test_local_area_code_parsing():
+    """Test that area codes are read correctly across phone formats"""
+    print("Testing local area code parsing...")
+    
+    from src.config import is_local_business_validation
+    
+    for phone in ['(425) 772-8264', '425.772.8264', '+1 425 772 8264', '1-425-772-8264']:
+        result = is_local_business_validation('Redmond', 'WA', phone, '')
+        assert result['details']['area_code'] == '425', phone
+        assert result['area_code_match'], phone
+    print("✅ Area codes parsed for all formats")
+    
+    return True
+
 def main():
     """Run all configuration tests"""
     print("=== Contractor Enrichment System Configuration Tests ===\n")
@@ -85,7 +99,8 @@ def main():
     tests = [
         test_required_packages,
         test_config_import,
-        test_database_models
+        test_database_models,
+        test_local_area_code_parsing
     ]
     
     passed = 0
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Tests for looking up several contractors by name fragment in one query
+"""
+import asyncio
+
+from src.services import contractor_service
+
+
+def test_get_contractors_by_names_keeps_input_order(monkeypatch, make_service):
+    """One entry per name in input order, with None where the query returned no row for it"""
+    calls = []
+
+    async def fake_fetch(query, patterns):
+        calls.append(patterns)
+        # Rows carry the 1-based position of the pattern they matched; 2 and 4 found nothing,
+        # and the database is free to return the rest in any order
+        return [
+            {'ord': 5, 'id': 55, 'business_name': 'ELECTRIC AVENUE LLC', 'city': 'KENT'},
+            {'ord': 1, 'id': 11, 'business_name': '425 CONSTRUCTION INC', 'city': 'BELLEVUE'},
+            {'ord': 3, 'id': 33, 'business_name': 'ACME ROOFING', 'city': 'SEATTLE'},
+        ]
+
+    monkeypatch.setattr(contractor_service.db_pool, 'fetch', fake_fetch)
+    names = ['425 CONSTRUCTION', 'NOBODY', 'acme', 'MISSING', 'electric avenue']
+
+    service = make_service()
+    contractors = asyncio.run(service.get_contractors_by_names(names))
+
+    assert calls == [['%425 CONSTRUCTION%', '%NOBODY%', '%acme%', '%MISSING%', '%electric avenue%']]
+    assert len(contractors) == len(names)
+    assert [c.id if c else None for c in contractors] == [11, None, 33, None, 55]
+    assert contractors[2].business_name == 'ACME ROOFING'
+    assert contractors[4].city == 'KENT'
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-service LRU + TTL cache in front of comprehensive website crawls
+"""
+import asyncio
+
+import pytest
+
+from src.services import contractor_service
+from src.services.contractor_service import _CRAWL_CACHE_SIZE, _CRAWL_CACHE_TTL
+
+
+class _Clock:
+    """Stand-in for time.monotonic that only moves when told to"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def crawl_service(make_service, monkeypatch):
+    """A service on a frozen clock whose uncached crawl records each URL and returns a fresh dict
+
+    Returns (service, clock, crawled URLs, result overrides by URL).
+    """
+    clock = _Clock()
+    monkeypatch.setattr(contractor_service.time, 'monotonic', clock)
+    service = make_service()
+    crawled = []
+    overrides = {}
+
+    async def crawl_uncached(url):
+        crawled.append(url)
+        if url in overrides:
+            return overrides[url]
+        return {'combined_content': f'content of {url}', 'pages_crawled': 1}
+
+    monkeypatch.setattr(service, '_crawl_website_uncached', crawl_uncached)
+    return service, clock, crawled, overrides
+
+
+def test_hit_within_ttl(crawl_service):
+    service, clock, crawled, overrides = crawl_service
+
+    async def run():
+        first = await service.crawl_website_comprehensive('https://acmeroofing.com/')
+        clock.now += _CRAWL_CACHE_TTL - 1
+        second = await service.crawl_website_comprehensive('https://acmeroofing.com/')
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert second is first
+    assert crawled == ['https://acmeroofing.com/']
+
+
+def test_recrawl_after_ttl(crawl_service):
+    service, clock, crawled, overrides = crawl_service
+
+    async def run():
+        first = await service.crawl_website_comprehensive('https://acmeroofing.com/')
+        clock.now += _CRAWL_CACHE_TTL
+        second = await service.crawl_website_comprehensive('https://acmeroofing.com/')
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert second is not first
+    assert crawled == ['https://acmeroofing.com/', 'https://acmeroofing.com/']
+
+
+def test_eviction_past_cache_size(crawl_service):
+    """Past _CRAWL_CACHE_SIZE sites the least recently used one is dropped"""
+    service, clock, crawled, overrides = crawl_service
+    urls = [f'https://contractor{i}.com/' for i in range(_CRAWL_CACHE_SIZE)]
+
+    async def run():
+        for url in urls:
+            await service.crawl_website_comprehensive(url)
+        # Touch the oldest entry so the second-oldest becomes least recently used
+        await service.crawl_website_comprehensive(urls[0])
+        await service.crawl_website_comprehensive('https://newcomer.com/')
+        crawled.clear()
+        await service.crawl_website_comprehensive(urls[0])
+        await service.crawl_website_comprehensive(urls[1])
+
+    asyncio.run(run())
+
+    assert len(service._crawl_cache) == _CRAWL_CACHE_SIZE
+    assert crawled == [urls[1]]
+
+
+def test_failed_crawl_not_cached(crawl_service):
+    service, clock, crawled, overrides = crawl_service
+    overrides['https://unreachable.com/'] = None
+
+    async def run():
+        first = await service.crawl_website_comprehensive('https://unreachable.com/')
+        second = await service.crawl_website_comprehensive('https://unreachable.com/')
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first is None and second is None
+    assert crawled == ['https://unreachable.com/', 'https://unreachable.com/']
+    assert 'https://unreachable.com/' not in service._crawl_cache
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for decoding crawled pages whose response may not declare a charset
+"""
+import asyncio
+
+from src.services.contractor_service import _detect_page_charset
+
+
+class _FakeContent:
+    def __init__(self, body: bytes):
+        self._body = body
+
+    async def iter_chunked(self, size):
+        for start in range(0, len(self._body), size):
+            yield self._body[start:start + size]
+
+
+class _FakeResponse:
+    def __init__(self, body: bytes, charset=None):
+        self.content = _FakeContent(body)
+        self.charset = charset
+
+
+PAGE = '<html><body><h1>Café Remodeling – Tacoma</h1></body></html>'
+
+
+def _read(make_service, body: bytes, charset=None) -> str:
+    service = make_service()
+    return asyncio.run(service._read_capped_text(_FakeResponse(body, charset)))
+
+
+def test_declared_charset_is_used(make_service):
+    assert _read(make_service, PAGE.encode('cp1252'), charset='windows-1252') == PAGE
+
+
+def test_undeclared_utf8_page(make_service):
+    assert _read(make_service, PAGE.encode('utf-8')) == PAGE
+
+
+def test_undeclared_legacy_page_is_not_garbled(make_service):
+    """Non-UTF-8 bytes with no charset anywhere decode as windows-1252, like a browser would"""
+    assert _read(make_service, PAGE.encode('cp1252')) == PAGE
+
+
+def test_meta_charset_used_when_header_has_none(make_service):
+    page = '<html><head><meta charset="iso-8859-1"></head><body>Señor Roofing</body></html>'
+    assert _read(make_service, page.encode('latin-1')) == page
+
+
+def test_unknown_header_charset_falls_back_to_detection(make_service):
+    assert _read(make_service, PAGE.encode('utf-8'), charset='x-made-up') == PAGE
+
+
+def test_detect_page_charset():
+    assert _detect_page_charset(b'<meta http-equiv="Content-Type" content="text/html; charset=Shift_JIS">') == 'shift_jis'
+    assert _detect_page_charset(b'<meta charset="utf-16">hello') == 'utf-8'
+    assert _detect_page_charset(b'<meta charset="bogus-encoding">plain ascii') == 'utf-8'
+    assert _detect_page_charset('café'.encode('cp1252')) == 'cp1252'
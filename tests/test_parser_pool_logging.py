@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests that log messages from work run in the parser process pool reach the parent's handlers
+"""
+import asyncio
+import logging
+import time
+
+from src.database.models import Contractor
+from src.services.contractor_service import _parse_main_page
+
+
+def _wait_for_message(caplog, text: str, timeout: float = 10.0) -> bool:
+    """Worker records arrive through a queue listener thread, so allow them a moment"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if any(text in record.getMessage() for record in caplog.records):
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_validation_logs_forwarded_from_pool(caplog, make_service):
+    """Domain matching runs inside the pool during validation; its INFO lines must not be lost"""
+    caplog.set_level(logging.INFO)
+    contractor = Contractor(
+        id=61291,
+        business_name='3 BRIDGES ELECTRIC',
+        website_url='https://3bridgeselectric.com/',
+        phone_number='(253) 590-8973',
+    )
+
+    service = make_service()
+    results = asyncio.run(service._comprehensive_website_validation(
+        contractor, "3 Bridges Electric is a full-service electrical contractor", None
+    ))
+
+    assert results['domain_match_score'] > 0
+    assert _wait_for_message(caplog, 'Domain matching for 3 BRIDGES ELECTRIC')
+    assert _wait_for_message(caplog, 'Matched words')
+
+
+def test_navigation_logs_forwarded_from_pool(caplog, make_service):
+    """Main-page parsing runs inside the pool while crawling; its link count must still be logged"""
+    caplog.set_level(logging.INFO)
+    raw_html = """
+    <html><body><nav>
+      <a href="/services">Services</a>
+      <a href="/about-us">About Us</a>
+      <a href="https://elsewhere.com/contact">Partner</a>
+    </nav><p>Licensed electrical contractor</p></body></html>
+    """
+
+    service = make_service()
+    # The listener runs until the fixture closes the service, so records can still arrive below
+    nav_links, main_content = service._get_parser_pool().submit(
+        _parse_main_page, 'https://example.com/', raw_html
+    ).result()
+
+    assert nav_links == ['https://example.com/services', 'https://example.com/about-us']
+    assert 'Licensed electrical contractor' in main_content
+    assert _wait_for_message(caplog, 'Extracted 2 navigation links from https://example.com/')
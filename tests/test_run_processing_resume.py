@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests that the processing orchestrator resumes its contractor stream where a quota stop left off
+"""
+import asyncio
+
+import pytest
+
+import run_processing
+
+
+class _FakeContractorService:
+    def __init__(self):
+        self.processed = []
+
+    async def process_contractor(self, contractor, save=True):
+        self.processed.append(contractor.id)
+
+    async def update_contractors(self, contractors):
+        pass
+
+
+@pytest.fixture
+def orchestrator():
+    """A one-at-a-time orchestrator whose contractor service only records what it processed"""
+    # Skip __init__: the export service it builds creates the export directory
+    orchestrator = run_processing.ProcessingOrchestrator.__new__(run_processing.ProcessingOrchestrator)
+    orchestrator.processes = 1
+    orchestrator.puget_sound_only = True
+    orchestrator.contractor_service = _FakeContractorService()
+    orchestrator.processed_count = 0
+    orchestrator._last_id = 0
+    return orchestrator
+
+
+def test_quota_stop_mid_page_resumes_at_unstarted_row(monkeypatch, orchestrator):
+    """A row pulled from the stream but not started (quota stop) is the first one read next call"""
+    rows = [{'id': contractor_id, 'business_name': f'CONTRACTOR {contractor_id}'}
+            for contractor_id in range(10, 210, 10)]
+    fetch_calls = []
+
+    async def fake_fetch(query, last_id, limit):
+        fetch_calls.append(last_id)
+        return [row for row in rows if row['id'] > last_id][:limit]
+
+    monkeypatch.setattr(run_processing.db_pool, 'fetch', fake_fetch)
+
+    # Quota runs out while the 4th contractor of the first 5-row page is waiting to start
+    quota_checks = []
+
+    def is_quota_exceeded():
+        quota_checks.append(True)
+        return len(quota_checks) == 4
+
+    monkeypatch.setattr(run_processing.quota_tracker, 'is_quota_exceeded', is_quota_exceeded)
+
+    service = orchestrator.contractor_service
+
+    first_completed = asyncio.run(orchestrator.process_contractors(target_count=10, batch_size=5))
+
+    assert first_completed == 3
+    assert service.processed == [10, 20, 30]
+    assert orchestrator._last_id == 30
+
+    service.processed.clear()
+    fetch_calls.clear()
+    second_completed = asyncio.run(orchestrator.process_contractors(target_count=10, batch_size=5))
+
+    assert fetch_calls[0] == 30
+    assert service.processed[0] == 40
+    assert service.processed == list(range(40, 140, 10))
+    assert second_completed == 10
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-disk Google search response cache and its replay mode
+"""
+import asyncio
+
+from src.config import config
+from src.services import contractor_service
+from src.services.contractor_service import SearchResponseCache
+
+
+SAMPLE_RESPONSE = {
+    'items': [
+        {'link': 'https://acmeroofing.com/', 'title': 'Acme Roofing | Seattle, WA', 'snippet': 'Roof repair'}
+    ],
+    'searchInformation': {'totalResults': '1'}
+}
+
+
+def test_put_get_round_trip(tmp_path):
+    """A stored response comes back unchanged, also after reopening the file"""
+    path = str(tmp_path / 'nested' / 'google_search.sqlite')
+    cache = SearchResponseCache(path)
+    key = SearchResponseCache.key('"ACME ROOFING" Seattle WA', 'web')
+
+    assert cache.get(key) is None
+    cache.put(key, SAMPLE_RESPONSE)
+    assert cache.get(key) == SAMPLE_RESPONSE
+    cache.close()
+
+    reopened = SearchResponseCache(path)
+    assert reopened.get(key) == SAMPLE_RESPONSE
+    reopened.close()
+
+
+def test_key_normalisation():
+    """Case and whitespace don't change the key; the search type does"""
+    key = SearchResponseCache.key('"ACME ROOFING" Seattle WA', 'web')
+
+    assert SearchResponseCache.key('  "acme roofing"   seattle\twa ', 'web') == key
+    assert SearchResponseCache.key('"ACME ROOFING" Seattle WA', 'knowledge') != key
+    assert SearchResponseCache.key('"ACME ROOFING" Tacoma WA', 'web') != key
+
+
+def test_replay_mode(tmp_path, monkeypatch, make_service):
+    """Replay mode serves hits from disk and never calls the API or touches the quota on a miss"""
+    path = str(tmp_path / 'google_search.sqlite')
+    seed = SearchResponseCache(path)
+    seed.put(SearchResponseCache.key('"ACME ROOFING" Seattle WA', 'web'), SAMPLE_RESPONSE)
+    seed.close()
+
+    monkeypatch.setattr(config, 'GOOGLE_SEARCH_CACHE_REPLAY', True)
+    monkeypatch.setattr(config, 'GOOGLE_SEARCH_CACHE_PATH', path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError('replay mode must not reach the Google API or the quota tracker')
+
+    tracker = contractor_service.quota_tracker
+    monkeypatch.setattr(tracker, 'is_quota_exceeded', fail)
+    monkeypatch.setattr(tracker, 'record_query', fail)
+    monkeypatch.setattr(tracker, 'record_429_error', fail)
+    queries_before = tracker.queries_today
+
+    service = make_service()
+    monkeypatch.setattr(service, '_get_session', fail)
+
+    async def run():
+        hit = await service.search_google_api('"acme roofing"  seattle wa')
+        miss = await service.search_google_api('"UNKNOWN BUILDERS" Tacoma WA')
+        return hit, miss
+
+    hit, miss = asyncio.run(run())
+
+    assert hit == SAMPLE_RESPONSE
+    assert miss is None
+    assert tracker.queries_today == queries_before
+
+
+class _FakeResponse:
+    status = 200
+
+    async def json(self, loads=None):
+        return SAMPLE_RESPONSE
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class _FakeSession:
+    def __init__(self):
+        self.requests = 0
+
+    def get(self, url, params=None):
+        self.requests += 1
+        return _FakeResponse()
+
+
+def test_fetched_response_is_cached(tmp_path, monkeypatch, make_service):
+    """With caching on, the first search hits the API and stores it; the repeat is served from disk"""
+    monkeypatch.setattr(config, 'GOOGLE_SEARCH_CACHE', True)
+    monkeypatch.setattr(config, 'GOOGLE_SEARCH_CACHE_PATH', str(tmp_path / 'google_search.sqlite'))
+    monkeypatch.setattr(contractor_service.quota_tracker, 'is_quota_exceeded', lambda: False)
+    monkeypatch.setattr(contractor_service.quota_tracker, 'record_query', lambda: None)
+    session = _FakeSession()
+
+    service = make_service()
+
+    async def get_session():
+        return session
+
+    monkeypatch.setattr(service, '_get_session', get_session)
+
+    async def run():
+        first = await service.search_google_api('"ACME ROOFING" Seattle WA')
+        second = await service.search_google_api('"acme roofing" seattle wa')
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == second == SAMPLE_RESPONSE
+    assert session.requests == 1